@@ -5,21 +5,218 @@ Batch processing example for pyresume library.
 This example shows how to process multiple resume files and analyze them in bulk.
 """
 
+import os
+import time
 import json
 import csv
+import logging
+import hashlib
+import mmap
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional
 from pyresume import ResumeParser
+from confidence_scores import ConfidenceAnalyzer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
+# Per-process parser and analyzer, created once in each worker by _init_worker
+_PARSER = None
+_ANALYZER = None
+
+# Seconds before a cached summary is considered stale (unset = never)
+CACHE_TTL_ENV = 'PYRESUME_CACHE_TTL'
+
+# Supported file extensions
+SUPPORTED_EXTENSIONS = frozenset({'.pdf', '.docx', '.txt'})
+
+# Per-resume list fields folded into running counters and dropped from
+# summary rows unless the processor keeps details
+DETAIL_FIELDS = ('skills_list', 'companies', 'universities')
+
+
+def _init_worker():
+    """Create the parser and confidence analyzer used by a worker process."""
+    global _PARSER, _ANALYZER
+    _PARSER = ResumeParser()
+    _ANALYZER = ConfidenceAnalyzer(_PARSER)
+
+
+def _iter_resume_files(root: str, recursive: bool) -> Iterator[str]:
+    """Yield paths of supported resume files under root, including hidden ones as glob did."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                elif entry.is_file():
+                    dot = name.rfind('.')
+                    if dot > 0 and name[dot:].lower() in SUPPORTED_EXTENSIONS:
+                        yield entry.path
+
+
+def _summarize_resume(file_path: str, resume, analyzer: ConfidenceAnalyzer) -> Dict[str, Any]:
+    """Build the summary row for a parsed resume, including its confidence scores."""
+    file_name = os.path.basename(file_path)
+    analysis = analyzer.analyze_resume_confidence(resume)
+    return {
+        'file_name': file_name,
+        'file_path': file_path,
+        'file_type': os.path.splitext(file_name)[1].lower(),
+        'contact_name': resume.contact_info.name,
+        'email': resume.contact_info.email,
+        'phone': resume.contact_info.phone,
+        'years_experience': resume.get_years_experience(),
+        'num_jobs': len(resume.experience),
+        'num_education': len(resume.education),
+        'num_skills': len(resume.skills),
+        'num_projects': len(resume.projects),
+        'num_certifications': len(resume.certifications),
+        'has_summary': bool(resume.summary),
+        'skills_list': [skill.name for skill in resume.skills],
+        'companies': [exp.company for exp in resume.experience if exp.company],
+        'universities': [edu.institution for edu in resume.education if edu.institution],
+        'confidence': analysis['overall_confidence'],
+        'section_confidence': analysis['section_confidence'],
+        'completeness': analysis['data_completeness'],
+        'processing_success': True
+    }
+
+
+def _normalize_key(value: str) -> str:
+    """Normalize a skill or company name for counting; equal keys share one string."""
+    return sys.intern(value.strip().casefold())
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=str).encode('utf-8')
+
+
+@contextmanager
+def _map_file(file_path: str):
+    """Map a file read-only, yielding its contents as a buffer without copying."""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''  # Empty files cannot be mapped
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            yield mapped
+
+
+def _load_cached(cache_path: Path) -> Optional[Dict[str, Any]]:
+    """Load a cached summary, dropping it if older than the configured TTL."""
+    try:
+        ttl = os.environ.get(CACHE_TTL_ENV)
+        if ttl and time.time() - cache_path.stat().st_mtime > float(ttl):
+            cache_path.unlink()
+            return None
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached(cache_path: Path, summary: Dict[str, Any]):
+    """Atomically write a summary to the cache."""
+    tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, default=str)
+    os.replace(tmp_path, cache_path)
+
+
+def _parse_one(file_path: str, parser: Optional[ResumeParser] = None,
+               analyzer: Optional[ConfidenceAnalyzer] = None,
+               cache_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Parse a single resume file.
+    
+    When ``cache_dir`` is given, summaries are cached by the SHA-256 of the
+    file contents and unchanged files are not re-parsed.
+    
+    Returns the summary row on success, or an error row with
+    ``processing_success`` set to False.
+    """
+    parser = parser or _PARSER
+    analyzer = analyzer or _ANALYZER
+    try:
+        # Hashing and parsing share one mapping of the file
+        with _map_file(file_path) as data:
+            cache_path = None
+            if cache_dir is not None:
+                cache_path = cache_dir / f"{hashlib.sha256(data).hexdigest()}.json"
+                summary = _load_cached(cache_path)
+                if summary is not None:
+                    # Identical content may live under a different name
+                    file_name = os.path.basename(file_path)
+                    summary.update(file_name=file_name, file_path=file_path,
+                                   file_type=os.path.splitext(file_name)[1].lower())
+                    return summary
+            
+            resume = parser.parse_bytes(data, os.path.splitext(file_path)[1])
+        
+        summary = _summarize_resume(file_path, resume, analyzer)
+        
+        if cache_path is not None:
+            _store_cached(cache_path, summary)
+        return summary
+    except Exception as e:
+        return {
+            'file_name': os.path.basename(file_path),
+            'file_path': file_path,
+            'error': str(e),
+            'error_type': type(e).__name__,
+            'processing_success': False
+        }
 
 
 class ResumeBatchProcessor:
     """Process multiple resumes and generate reports."""
     
-    def __init__(self):
-        """Initialize the batch processor."""
+    def __init__(self, max_workers: Optional[int] = None, cache_dir: Optional[Path] = None,
+                 keep_details: bool = True):
+        """
+        Initialize the batch processor.
+        
+        Args:
+            max_workers: Number of worker processes used to parse files
+                (defaults to the number of CPUs; 1 parses in-process)
+            cache_dir: Directory for caching summaries keyed by file content
+                hash; set PYRESUME_CACHE_TTL to expire entries after N seconds
+            keep_details: Keep the per-resume skills, companies and universities
+                lists in each result (needed for those CSV/JSON report columns);
+                pass False to retain only the aggregate counts, in which case
+                the reports omit those columns with a warning
+        """
         self.parser = ResumeParser()
+        self.analyzer = ConfidenceAnalyzer(self.parser)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.keep_details = keep_details
         self.results = []
         self.errors = []
+        self._skill_counter = Counter()
+        self._company_counter = Counter()
     
     def process_directory(self, directory_path: str, recursive: bool = False) -> List[Dict[str, Any]]:
         """
@@ -32,139 +229,130 @@ class ResumeBatchProcessor:
         Returns:
             List of parsed resume data
         """
-        directory = Path(directory_path)
-        
-        if not directory.exists():
+        if not os.path.isdir(directory_path):
             raise FileNotFoundError(f"Directory not found: {directory_path}")
         
-        # Supported file extensions
-        supported_extensions = {'.pdf', '.docx', '.txt'}
-        
         # Find all resume files
-        pattern = "**/*" if recursive else "*"
-        resume_files = []
-        
-        for file_path in directory.glob(pattern):
-            if file_path.is_file() and file_path.suffix.lower() in supported_extensions:
-                resume_files.append(file_path)
+        resume_files = list(_iter_resume_files(str(directory_path), recursive))
         
         print(f"Found {len(resume_files)} resume files to process...")
         
-        # Process each file
-        for i, file_path in enumerate(resume_files, 1):
-            print(f"Processing {i}/{len(resume_files)}: {file_path.name}")
-            
-            try:
-                resume = self.parser.parse(str(file_path))
-                
-                # Create summary data
-                summary = {
-                    'file_name': file_path.name,
-                    'file_path': str(file_path),
-                    'file_type': file_path.suffix.lower(),
-                    'contact_name': resume.contact_info.name,
-                    'email': resume.contact_info.email,
-                    'phone': resume.contact_info.phone,
-                    'years_experience': resume.get_years_experience(),
-                    'num_jobs': len(resume.experience),
-                    'num_education': len(resume.education),
-                    'num_skills': len(resume.skills),
-                    'num_projects': len(resume.projects),
-                    'num_certifications': len(resume.certifications),
-                    'has_summary': bool(resume.summary),
-                    'skills_list': [skill.name for skill in resume.skills],
-                    'companies': [exp.company for exp in resume.experience if exp.company],
-                    'universities': [edu.institution for edu in resume.education if edu.institution],
-                    'processing_success': True
-                }
-                
-                self.results.append(summary)
-                
-            except Exception as e:
-                error_info = {
-                    'file_name': file_path.name,
-                    'file_path': str(file_path),
-                    'error': str(e),
-                    'error_type': type(e).__name__
-                }
-                self.errors.append(error_info)
-                print(f"  Error processing {file_path.name}: {e}")
+        # Process files, fanning out to worker processes when useful
+        total = len(resume_files)
+        if self.max_workers > 1 and total > 1:
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, total),
+                                     initializer=_init_worker) as executor:
+                parse = partial(_parse_one, cache_dir=self.cache_dir)
+                outcomes = executor.map(parse, resume_files, chunksize=4)
+                self._collect(outcomes, total)
+        else:
+            outcomes = (_parse_one(file_path, self.parser, self.analyzer, self.cache_dir)
+                        for file_path in resume_files)
+            self._collect(outcomes, total)
         
         return self.results
     
+    def _collect(self, outcomes, total: int):
+        """Sort parse outcomes into results and errors, in input order."""
+        for i, outcome in enumerate(outcomes, 1):
+            logger.info("Processed %d/%d: %s", i, total, outcome['file_name'])
+            
+            if outcome['processing_success']:
+                self.add_result(outcome)
+            else:
+                self.errors.append(outcome)
+                logger.warning("Error processing %s: %s", outcome['file_name'], outcome['error'])
+    
+    def add_result(self, summary: Dict[str, Any]):
+        """
+        Record a successful summary row and fold its lists into the analytics counters.
+        
+        Args:
+            summary: Summary row as produced for a parsed resume
+        """
+        self._count(self._skill_counter, summary.get('skills_list', ()))
+        self._count(self._company_counter, summary.get('companies', ()))
+        if not self.keep_details:
+            for field in DETAIL_FIELDS:
+                summary.pop(field, None)
+        self.results.append(summary)
+    
     def generate_csv_report(self, output_path: str):
         """Generate a CSV report of all processed resumes."""
         if not self.results:
             print("No results to export.")
             return
         
-        # Define CSV columns
-        csv_columns = [
+        # Define CSV columns; list-valued columns are joined into one cell
+        scalar_columns = (
             'file_name', 'contact_name', 'email', 'phone',
             'years_experience', 'num_jobs', 'num_education',
             'num_skills', 'num_projects', 'num_certifications',
-            'has_summary', 'companies', 'universities'
-        ]
+            'has_summary'
+        )
+        list_columns = ('companies', 'universities') if self.keep_details else ()
+        self._warn_details_dropped(output_path)
         
-        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=csv_columns)
-            writer.writeheader()
-            
-            for result in self.results:
-                # Convert lists to comma-separated strings for CSV
-                row = result.copy()
-                row['companies'] = '; '.join(row.get('companies', []))
-                row['universities'] = '; '.join(row.get('universities', []))
-                
-                # Only include columns that exist in CSV schema
-                filtered_row = {k: v for k, v in row.items() if k in csv_columns}
-                writer.writerow(filtered_row)
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(scalar_columns + list_columns)
+            writer.writerows(
+                tuple(result.get(column, '') for column in scalar_columns)
+                + tuple('; '.join(result.get(column, ())) for column in list_columns)
+                for result in self.results
+            )
         
         print(f"CSV report saved to: {output_path}")
     
     def generate_json_report(self, output_path: str):
-        """Generate a detailed JSON report."""
-        report = {
-            'summary': {
-                'total_files_processed': len(self.results) + len(self.errors),
-                'successful_parses': len(self.results),
-                'failed_parses': len(self.errors),
-                'success_rate': len(self.results) / (len(self.results) + len(self.errors)) * 100 if (len(self.results) + len(self.errors)) > 0 else 0
-            },
-            'results': self.results,
-            'errors': self.errors
+        """Generate a detailed JSON report, writing one record at a time."""
+        self._warn_details_dropped(output_path)
+        total = len(self.results) + len(self.errors)
+        summary = {
+            'total_files_processed': total,
+            'successful_parses': len(self.results),
+            'failed_parses': len(self.errors),
+            'success_rate': len(self.results) / total * 100 if total > 0 else 0
         }
         
-        with open(output_path, 'w', encoding='utf-8') as jsonfile:
-            json.dump(report, jsonfile, indent=2, default=str)
+        with open(output_path, 'wb', buffering=1 << 20) as jsonfile:
+            jsonfile.write(b'{\n"summary": ')
+            jsonfile.write(_dumps(summary, indent=True))
+            self._write_json_records(jsonfile, 'results', self.results)
+            self._write_json_records(jsonfile, 'errors', self.errors)
+            jsonfile.write(b'\n}\n')
         
         print(f"JSON report saved to: {output_path}")
     
-    def analyze_skills(self) -> Dict[str, int]:
-        """Analyze skills across all resumes."""
-        skill_counts = {}
-        
-        for result in self.results:
-            for skill in result.get('skills_list', []):
-                skill_lower = skill.lower().strip()
-                skill_counts[skill_lower] = skill_counts.get(skill_lower, 0) + 1
-        
-        # Sort by frequency
-        sorted_skills = dict(sorted(skill_counts.items(), key=lambda x: x[1], reverse=True))
-        return sorted_skills
+    def _warn_details_dropped(self, output_path: str):
+        """Warn that a report will lack the per-resume lists discarded by add_result."""
+        if not self.keep_details and self.results:
+            logger.warning(
+                "%s: skills, companies and universities are omitted because the "
+                "processor was created with keep_details=False", output_path
+            )
     
-    def analyze_companies(self) -> Dict[str, int]:
-        """Analyze companies across all resumes."""
-        company_counts = {}
-        
-        for result in self.results:
-            for company in result.get('companies', []):
-                if company:
-                    company_lower = company.lower().strip()
-                    company_counts[company_lower] = company_counts.get(company_lower, 0) + 1
-        
-        sorted_companies = dict(sorted(company_counts.items(), key=lambda x: x[1], reverse=True))
-        return sorted_companies
+    @staticmethod
+    def _write_json_records(jsonfile, key: str, records: List[Dict[str, Any]]):
+        """Write records as a JSON array member without building the whole report."""
+        jsonfile.write(f',\n"{key}": ['.encode('utf-8'))
+        for i, record in enumerate(records):
+            jsonfile.write(b',\n  ' if i else b'\n  ')
+            jsonfile.write(_dumps(record))
+        jsonfile.write(b'\n]' if records else b']')
+    
+    @staticmethod
+    def _count(counter: Counter, values):
+        """Add normalized, non-empty values to a counter."""
+        counter.update(_normalize_key(value) for value in values if value)
+    
+    def analyze_skills(self, top_n: Optional[int] = None) -> Dict[str, int]:
+        """Analyze skills across all resumes, most common first."""
+        return dict(self._skill_counter.most_common(top_n))
+    
+    def analyze_companies(self, top_n: Optional[int] = None) -> Dict[str, int]:
+        """Analyze companies across all resumes, most common first."""
+        return dict(self._company_counter.most_common(top_n))
     
     def print_analytics(self):
         """Print analytics summary."""
@@ -185,19 +373,20 @@ class ResumeBatchProcessor:
         
         # Skills analytics
         print(f"\\n=== TOP SKILLS ===")
-        skills = self.analyze_skills()
-        for skill, count in list(skills.items())[:10]:
+        skills = self.analyze_skills(top_n=10)
+        for skill, count in skills.items():
             print(f"{skill}: {count} resumes")
         
         # Companies analytics
         print(f"\\n=== TOP COMPANIES ===")
-        companies = self.analyze_companies()
-        for company, count in list(companies.items())[:10]:
+        companies = self.analyze_companies(top_n=10)
+        for company, count in companies.items():
             print(f"{company}: {count} resumes")
 
 
 def main():
     """Demonstrate batch processing."""
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     processor = ResumeBatchProcessor()
     
     # Example usage
@@ -264,7 +453,8 @@ def demonstrate_with_mock_data(processor: ResumeBatchProcessor):
         }
     ]
     
-    processor.results = mock_results
+    for result in mock_results:
+        processor.add_result(result)
     processor.print_analytics()
 
 
@@ -8,15 +8,57 @@ to understand the quality and reliability of the parsed resume data.
 
 from pyresume import ResumeParser
 from pyresume.models.resume import Resume
+from functools import lru_cache
 import json
+import re
+
+# Field classifiers used when scoring contact information
+_DIGIT_RE = re.compile(r'\d')
+_SOCIAL_RE = re.compile(r'linkedin|github', re.IGNORECASE)
+
+# (section, minimum confidence, recommendation) checked in order
+_SECTION_RULES = (
+    ('contact_info', 0.6, "Contact information extraction has low confidence. Verify email and phone number formats."),
+    ('experience', 0.6, "Experience section extraction needs improvement. Check date formats and job title/company clarity."),
+)
+
+# Recommendations for missing email, experience and skills, in that order
+_MISSING_MESSAGES = (
+    "No email address found. This is critical contact information.",
+    "No work experience found. Check if the experience section is clearly labeled.",
+    "No skills found. Consider adding a dedicated skills section.",
+)
+
+
+@lru_cache(maxsize=1)
+def _load_known_skills() -> frozenset:
+    """Load the lowercased set of known skills used for validation (built once)."""
+    try:
+        from pyresume.data.skills import SKILL_CATEGORIES
+        return frozenset(
+            skill.lower()
+            for category_skills in SKILL_CATEGORIES.values()
+            for skill in category_skills
+        )
+    except Exception:
+        # Fallback to common skills
+        return frozenset({
+            'python', 'javascript', 'java', 'react', 'node.js', 'sql', 'html', 'css',
+            'aws', 'docker', 'kubernetes', 'git', 'linux', 'windows', 'macos'
+        })
 
 
 class ConfidenceAnalyzer:
     """Analyze confidence scores and extraction quality."""
     
-    def __init__(self):
-        """Initialize the analyzer."""
-        self.parser = ResumeParser()
+    def __init__(self, parser: ResumeParser = None):
+        """
+        Initialize the analyzer.
+        
+        Args:
+            parser: Parser to reuse (a new one is created if omitted)
+        """
+        self.parser = parser or ResumeParser()
     
     def analyze_resume_confidence(self, resume: Resume) -> dict:
         """
@@ -36,20 +78,15 @@ class ConfidenceAnalyzer:
             'recommendations': []
         }
         
-        # Analyze contact information confidence
+        # Score each section; experience and education also report completeness
         contact_confidence = self._analyze_contact_confidence(resume)
-        analysis['section_confidence']['contact_info'] = contact_confidence
+        experience_confidence, experience_completeness = self._score_experience(resume)
+        education_confidence, education_completeness = self._score_education(resume)
+        skills_confidence = self._analyze_skills_confidence(resume)
         
-        # Analyze experience section confidence
-        experience_confidence = self._analyze_experience_confidence(resume)
+        analysis['section_confidence']['contact_info'] = contact_confidence
         analysis['section_confidence']['experience'] = experience_confidence
-        
-        # Analyze education section confidence
-        education_confidence = self._analyze_education_confidence(resume)
         analysis['section_confidence']['education'] = education_confidence
-        
-        # Analyze skills section confidence
-        skills_confidence = self._analyze_skills_confidence(resume)
         analysis['section_confidence']['skills'] = skills_confidence
         
         # Calculate overall confidence
@@ -57,7 +94,9 @@ class ConfidenceAnalyzer:
         analysis['overall_confidence'] = sum(confidences) / len(confidences) if confidences else 0.0
         
         # Analyze data completeness
-        analysis['data_completeness'] = self._analyze_completeness(resume)
+        analysis['data_completeness'] = self._analyze_completeness(
+            resume, experience_completeness, education_completeness
+        )
         
         # Generate recommendations
         analysis['recommendations'] = self._generate_recommendations(resume, analysis)
@@ -67,119 +106,122 @@ class ConfidenceAnalyzer:
     def _analyze_contact_confidence(self, resume: Resume) -> float:
         """Analyze confidence in contact information extraction."""
         confidence = 0.0
-        total_fields = 0
         
         # Check each contact field
-        contact_fields = [
-            resume.contact_info.name,
-            resume.contact_info.email,
-            resume.contact_info.phone,
-            resume.contact_info.address,
-            resume.contact_info.linkedin,
-            resume.contact_info.github
-        ]
+        ci = resume.contact_info
+        contact_fields = (ci.name, ci.email, ci.phone, ci.address, ci.linkedin, ci.github)
         
         for field in contact_fields:
-            total_fields += 1
-            if field:
-                # Basic validation
-                if '@' in str(field) and '.' in str(field):  # Email-like
-                    confidence += 0.9
-                elif any(char.isdigit() for char in str(field)) and len(str(field)) >= 10:  # Phone-like
-                    confidence += 0.8
-                elif 'linkedin' in str(field).lower() or 'github' in str(field).lower():  # Social links
-                    confidence += 0.85
-                else:
-                    confidence += 0.7  # Name or address
-        
-        return confidence / total_fields if total_fields > 0 else 0.0
+            if not field:
+                continue
+            
+            # Basic validation
+            value = str(field)
+            if '@' in value and '.' in value:  # Email-like
+                confidence += 0.9
+            elif len(value) >= 10 and _DIGIT_RE.search(value):  # Phone-like
+                confidence += 0.8
+            elif _SOCIAL_RE.search(value):  # Social links
+                confidence += 0.85
+            else:
+                confidence += 0.7  # Name or address
+        
+        return confidence / len(contact_fields)
     
-    def _analyze_experience_confidence(self, resume: Resume) -> float:
-        """Analyze confidence in experience extraction."""
+    def _score_experience(self, resume: Resume) -> tuple:
+        """
+        Score experience extraction.
+        
+        Returns:
+            Tuple of (confidence, completeness)
+        """
         if not resume.experience:
-            return 0.0
+            return 0.0, 0.0
         
         total_confidence = 0.0
+        total_completeness = 0.0
         
         for exp in resume.experience:
+            title, company, start, end = exp.title, exp.company, exp.start_date, exp.end_date
+            current, description, responsibilities = exp.current, exp.description, exp.responsibilities
             exp_confidence = 0.0
-            field_count = 0
             
             # Check required fields
-            if exp.title:
+            if title:
                 exp_confidence += 0.3
-                field_count += 1
-            if exp.company:
+            if company:
                 exp_confidence += 0.3
-                field_count += 1
-            if exp.start_date:
+            if start:
                 exp_confidence += 0.2
-                field_count += 1
-            if exp.description or exp.responsibilities:
+            if description or responsibilities:
                 exp_confidence += 0.2
-                field_count += 1
             
             # Bonus for date consistency
-            if exp.start_date and exp.end_date and exp.start_date <= exp.end_date:
+            if start and end and start <= end:
                 exp_confidence += 0.1
-            elif exp.current and exp.start_date:
+            elif current and start:
                 exp_confidence += 0.1
             
             total_confidence += exp_confidence
+            
+            # Completeness of the core fields
+            filled = bool(title) + bool(company) + bool(start)
+            total_completeness += filled / 3
         
-        return total_confidence / len(resume.experience)
+        count = len(resume.experience)
+        return total_confidence / count, total_completeness / count
     
-    def _analyze_education_confidence(self, resume: Resume) -> float:
-        """Analyze confidence in education extraction."""
+    def _score_education(self, resume: Resume) -> tuple:
+        """
+        Score education extraction.
+        
+        Returns:
+            Tuple of (confidence, completeness)
+        """
         if not resume.education:
-            return 0.0
+            return 0.0, 0.0
         
         total_confidence = 0.0
+        total_completeness = 0.0
         
         for edu in resume.education:
+            degree, institution, graduation_date = edu.degree, edu.institution, edu.graduation_date
             edu_confidence = 0.0
             
-            if edu.degree:
+            if degree:
                 edu_confidence += 0.4
-            if edu.institution:
+            if institution:
                 edu_confidence += 0.4
-            if edu.graduation_date:
+            if graduation_date:
                 edu_confidence += 0.2
             
             total_confidence += edu_confidence
+            
+            # Completeness of the core fields
+            filled = bool(degree) + bool(institution)
+            total_completeness += filled / 2
         
-        return total_confidence / len(resume.education)
+        count = len(resume.education)
+        return total_confidence / count, total_completeness / count
     
     def _analyze_skills_confidence(self, resume: Resume) -> float:
         """Analyze confidence in skills extraction."""
         if not resume.skills:
             return 0.0
         
-        # Load known skills for validation
-        try:
-            from pyresume.data.skills import SKILL_CATEGORIES
-            known_skills = set()
-            for category_skills in SKILL_CATEGORIES.values():
-                known_skills.update(skill.lower() for skill in category_skills)
-        except:
-            # Fallback to common skills
-            known_skills = {
-                'python', 'javascript', 'java', 'react', 'node.js', 'sql', 'html', 'css',
-                'aws', 'docker', 'kubernetes', 'git', 'linux', 'windows', 'macos'
-            }
-        
-        recognized_skills = 0
-        for skill in resume.skills:
-            if skill.name.lower() in known_skills:
-                recognized_skills += 1
-        
-        recognition_rate = recognized_skills / len(resume.skills) if resume.skills else 0.0
+        known_skills = _load_known_skills()
+        # resume.skills is a plain list, so a single comprehension walks it
+        # linearly; everything below works off the materialized names.
+        skill_names = [skill.name.lower() for skill in resume.skills]
+        skill_count = len(skill_names)
+        recognized_skills = sum(1 for name in skill_names if name in known_skills)
+        
+        recognition_rate = recognized_skills / skill_count
         
         # Confidence based on recognition rate and number of skills
         confidence = recognition_rate * 0.7
         
         # Bonus for reasonable number of skills (5-20 is typical)
-        skill_count = len(resume.skills)
         if 5 <= skill_count <= 20:
             confidence += 0.3
         elif skill_count > 0:
@@ -187,42 +229,21 @@ class ConfidenceAnalyzer:
         
         return min(confidence, 1.0)
     
-    def _analyze_completeness(self, resume: Resume) -> dict:
+    def _analyze_completeness(self, resume: Resume, experience_completeness: float,
+                              education_completeness: float) -> dict:
         """Analyze how complete the extracted data is."""
         completeness = {
             'contact_info': 0.0,
-            'experience': 0.0,
-            'education': 0.0,
+            'experience': experience_completeness,
+            'education': education_completeness,
             'skills': 0.0,
             'overall': 0.0
         }
         
-        # Contact completeness
-        contact_fields = [
-            resume.contact_info.name,
-            resume.contact_info.email,
-            resume.contact_info.phone
-        ]
-        contact_filled = sum(1 for field in contact_fields if field)
-        completeness['contact_info'] = contact_filled / len(contact_fields)
-        
-        # Experience completeness
-        if resume.experience:
-            exp_completeness = []
-            for exp in resume.experience:
-                fields = [exp.title, exp.company, exp.start_date]
-                filled = sum(1 for field in fields if field)
-                exp_completeness.append(filled / len(fields))
-            completeness['experience'] = sum(exp_completeness) / len(exp_completeness)
-        
-        # Education completeness
-        if resume.education:
-            edu_completeness = []
-            for edu in resume.education:
-                fields = [edu.degree, edu.institution]
-                filled = sum(1 for field in fields if field)
-                edu_completeness.append(filled / len(fields))
-            completeness['education'] = sum(edu_completeness) / len(edu_completeness)
+        # Contact completeness (name, email, phone)
+        ci = resume.contact_info
+        contact_filled = bool(ci.name) + bool(ci.email) + bool(ci.phone)
+        completeness['contact_info'] = contact_filled / 3
         
         # Skills completeness (binary - either has skills or doesn't)
         completeness['skills'] = 1.0 if resume.skills else 0.0
@@ -240,37 +261,30 @@ class ConfidenceAnalyzer:
     
     def _generate_recommendations(self, resume: Resume, analysis: dict) -> list:
         """Generate recommendations for improving extraction quality."""
-        recommendations = []
+        section_confidence = analysis['section_confidence']
         
         # Check overall confidence
-        overall_conf = analysis['overall_confidence']
-        if overall_conf < 0.5:
+        recommendations = []
+        if analysis['overall_confidence'] < 0.5:
             recommendations.append("Overall extraction confidence is low. Consider preprocessing the resume text or using a different file format.")
         
-        # Check contact info
-        contact_conf = analysis['section_confidence'].get('contact_info', 0)
-        if contact_conf < 0.6:
-            recommendations.append("Contact information extraction has low confidence. Verify email and phone number formats.")
-        
-        # Check experience section
-        exp_conf = analysis['section_confidence'].get('experience', 0)
-        if exp_conf < 0.6:
-            recommendations.append("Experience section extraction needs improvement. Check date formats and job title/company clarity.")
+        # Check low-confidence sections
+        recommendations.extend(
+            message for section, threshold, message in _SECTION_RULES
+            if section_confidence.get(section, 0) < threshold
+        )
         
         # Check completeness
-        completeness = analysis['data_completeness']['overall']
-        if completeness < 0.7:
+        if analysis['data_completeness']['overall'] < 0.7:
             recommendations.append("Resume data appears incomplete. Some sections may be missing or poorly formatted.")
         
         # Check for missing critical information
-        if not resume.contact_info.email:
-            recommendations.append("No email address found. This is critical contact information.")
-        
-        if not resume.experience:
-            recommendations.append("No work experience found. Check if the experience section is clearly labeled.")
-        
-        if not resume.skills:
-            recommendations.append("No skills found. Consider adding a dedicated skills section.")
+        missing = (
+            not resume.contact_info.email,
+            not resume.experience,
+            not resume.skills,
+        )
+        recommendations.extend(message for is_missing, message in zip(missing, _MISSING_MESSAGES) if is_missing)
         
         return recommendations
     
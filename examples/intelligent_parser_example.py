@@ -3,9 +3,13 @@
 Intelligent Parser example for PyResume - Using LLMs for enhanced parsing
 """
 
+import asyncio
 import os
 from pyresume import IntelligentResumeParser
 
+# Maximum number of LLM requests in flight; keep within your provider's rate limit
+MAX_CONCURRENCY = 5
+
 
 def example_with_anthropic():
     """Example using Anthropic Claude for parsing."""
@@ -195,12 +199,16 @@ def example_batch_processing():
     """Example of batch processing with intelligent parser."""
     print("\n\n=== Batch Processing with Intelligent Parser ===\n")
     
-    # Configure parser for batch processing
+    # Configure parser for batch processing; bound each request so one slow
+    # call cannot stall the batch
     parser = IntelligentResumeParser(
         provider='anthropic',
         api_key=os.environ.get('ANTHROPIC_API_KEY'),
         fallback_to_regex=True,
-        use_llm=True
+        use_llm=True,
+        request_timeout=30.0,
+        max_output_tokens=2048,
+        max_retries=3
     )
     
     # Sample resumes to process
@@ -210,22 +218,34 @@ def example_batch_processing():
         """Bob Manager | bob@manage.com | Product Manager at StartupXYZ"""
     ]
     
+    async def parse_one(semaphore, index, resume_text):
+        async with semaphore:
+            resume = await parser.parse_text_async(resume_text)
+        return {
+            'index': index,
+            'name': resume.contact_info.name,
+            'email': resume.contact_info.email,
+            'used_llm': resume.extraction_metadata.get('used_llm', False),
+            'confidence': resume.confidence_scores.get('overall', 0)
+        }
+    
+    async def parse_all():
+        # Fire all requests at once, bounded by the semaphore
+        semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+        return await asyncio.gather(
+            *(parse_one(semaphore, i + 1, text) for i, text in enumerate(resumes)),
+            return_exceptions=True
+        )
+    
     results = []
-    for i, resume_text in enumerate(resumes):
-        try:
-            resume = parser.parse_text(resume_text)
-            results.append({
-                'index': i + 1,
-                'name': resume.contact_info.name,
-                'email': resume.contact_info.email,
-                'used_llm': parser.last_parse_used_llm,
-                'confidence': resume.confidence_scores.get('overall', 0)
-            })
-        except Exception as e:
+    for i, outcome in enumerate(asyncio.run(parse_all())):
+        if isinstance(outcome, Exception):
             results.append({
                 'index': i + 1,
-                'error': str(e)
+                'error': str(outcome)
             })
+        else:
+            results.append(outcome)
     
     # Display results
     print("Batch Processing Results:")
@@ -238,6 +258,28 @@ def example_batch_processing():
                   f"- {llm_status} - Confidence: {result['confidence']:.2%}")
 
 
+def example_offline_batch():
+    """Example of parsing many resumes through the provider's batch API."""
+    print("\n\n=== Offline Batch Parsing (Batch API) ===\n")
+    
+    # Batch jobs cost less and have higher rate limits, but finish
+    # asynchronously (up to 24 hours) - use them for offline pipelines
+    parser = IntelligentResumeParser(
+        provider='anthropic',
+        api_key=os.environ.get('ANTHROPIC_API_KEY'),
+        fallback_to_regex=True
+    )
+    
+    resumes = [
+        """John Developer | john@dev.com | Senior Engineer at TechCorp""",
+        """Jane Designer | jane@design.com | UX Lead at DesignStudio""",
+        """Bob Manager | bob@manage.com | Product Manager at StartupXYZ"""
+    ]
+    
+    for i, resume in enumerate(parser.parse_batch(resumes), 1):
+        print(f"  {i}. {resume.contact_info.name} ({resume.contact_info.email})")
+
+
 def main():
     """Run all examples."""
     print("=" * 60)
@@ -15,13 +15,15 @@ Basic usage:
     print(f"Experience: {len(resume.experience)} jobs")
 """
 
+import importlib
+import importlib.util
+
 __version__ = "0.1.0"
 __author__ = "PyResume Team"
 __email__ = "contact@pyresume.dev"
 
 # Main exports
 from .parser import ResumeParser
-from .intelligent_parser import IntelligentResumeParser
 from .models.resume import (
     Resume,
     ContactInfo,
@@ -32,24 +34,41 @@ from .models.resume import (
     Certification
 )
 
-# Import providers if available
-try:
-    from .providers import registry
-    from .providers.anthropic_provider import AnthropicProvider
-    from .providers.openai_provider import OpenAIProvider
-    from .providers.local_provider import LocalLLMProvider
-except ImportError:
-    pass
-
 # Utility exports
 from .utils.dates import DateParser
 from .utils.phones import PhoneParser
 from .utils.patterns import ResumePatterns
 
-# Extractor exports
-from .extractors.pdf import PDFExtractor
-from .extractors.docx import DOCXExtractor
-from .extractors.text import TextExtractor
+# Heavier exports (LLM SDKs, pdfplumber, python-docx) are imported on first
+# attribute access (PEP 562) so that `import pyresume` stays cheap
+_LAZY_EXPORTS = {
+    'IntelligentResumeParser': ('.intelligent_parser', 'IntelligentResumeParser'),
+    'PDFExtractor': ('.extractors.pdf', 'PDFExtractor'),
+    'DOCXExtractor': ('.extractors.docx', 'DOCXExtractor'),
+    'TextExtractor': ('.extractors.text', 'TextExtractor'),
+    # Providers, available when their dependencies are installed
+    'registry': ('.providers', 'registry'),
+    'AnthropicProvider': ('.providers.anthropic_provider', 'AnthropicProvider'),
+    'OpenAIProvider': ('.providers.openai_provider', 'OpenAIProvider'),
+    'LocalLLMProvider': ('.providers.local_provider', 'LocalLLMProvider'),
+}
+
+
+def __getattr__(name):
+    """Import lazily exported names on first access."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    module_name, attribute = _LAZY_EXPORTS[name]
+    try:
+        module = importlib.import_module(module_name, __name__)
+    except ImportError as e:
+        raise AttributeError(f"{name} is unavailable: {e}") from e
+    
+    value = getattr(module, attribute)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Main classes
@@ -93,53 +112,16 @@ def get_supported_formats():
 
 
 def check_dependencies():
-    """Check if optional dependencies are available."""
-    dependencies = {
-        'pdfplumber': False,
-        'python-docx': False,
-        'phonenumbers': False,
-        'chardet': True,  # Usually included
-        'pytesseract': False,
-        'spacy': False,
+    """Check if optional dependencies are available (without importing them)."""
+    modules = {
+        'pdfplumber': 'pdfplumber',
+        'python-docx': 'docx',
+        'phonenumbers': 'phonenumbers',
+        'chardet': 'chardet',
+        'pytesseract': 'pytesseract',
+        'spacy': 'spacy',
     }
-    
-    try:
-        import pdfplumber
-        dependencies['pdfplumber'] = True
-    except ImportError:
-        pass
-    
-    try:
-        import docx
-        dependencies['python-docx'] = True
-    except ImportError:
-        pass
-    
-    try:
-        import phonenumbers
-        dependencies['phonenumbers'] = True
-    except ImportError:
-        pass
-    
-    try:
-        import chardet
-        dependencies['chardet'] = True
-    except ImportError:
-        dependencies['chardet'] = False
-    
-    try:
-        import pytesseract
-        dependencies['pytesseract'] = True
-    except ImportError:
-        pass
-    
-    try:
-        import spacy
-        dependencies['spacy'] = True
-    except ImportError:
-        pass
-    
-    return dependencies
+    return {name: importlib.util.find_spec(module) is not None for name, module in modules.items()}
 
 
 # Optional CLI module import
@@ -7,12 +7,20 @@ This module contains extractors for different file formats:
 - TextExtractor: Handle plain text files with encoding detection
 """
 
-from .pdf import PDFExtractor
-from .docx import DOCXExtractor
-from .text import TextExtractor
+import importlib
 
 __all__ = [
     'PDFExtractor',
     'DOCXExtractor', 
     'TextExtractor',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import extractors on first access so unused backends are never loaded."""
+    modules = {'PDFExtractor': '.pdf', 'DOCXExtractor': '.docx', 'TextExtractor': '.text'}
+    if name not in modules:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(modules[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,17 +1,21 @@
 """
-Enhanced DOCX text extraction using python-docx and lxml.
-Handles headers, footers, text boxes, shapes, and all document parts.
+Enhanced DOCX text extraction using lxml, with python-docx for structure analysis.
+Handles headers, footers, tables, text boxes, and footnotes in a single streaming pass.
 """
-from typing import Optional, List, Set
+from typing import Optional, List, Set, IO, Iterator
+from functools import lru_cache
 import logging
+import os
+import re
 import zipfile
-import xml.etree.ElementTree as ET
 
 try:
     from docx import Document
     from docx.oxml.ns import qn
+    from lxml import etree
 except ImportError:
     Document = None
+    etree = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -30,10 +34,28 @@ class DOCXExtractor:
         'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
     }
     
+    # Clark-notation prefix for WordprocessingML tags
+    W_NS = '{%s}' % NAMESPACES['w']
+    
+    # Run children that stand in for text, as python-docx renders them
+    RUN_TEXT = {
+        W_NS + 'tab': '\t',
+        W_NS + 'ptab': '\t',
+        W_NS + 'cr': '\n',
+        W_NS + 'noBreakHyphen': '-',
+    }
+    
+    # The only package parts read for text; styles, themes, settings, fonts and
+    # docProps never carry resume content and are not opened
+    NUMBERED_PART = re.compile(r'word/(header|footer)(\d*)\.xml$')
+    NOTE_PARTS = ('word/footnotes.xml', 'word/endnotes.xml')
+    
     def __init__(self, debug: bool = False):
         if Document is None:
             raise ImportError("python-docx is required for DOCX extraction. Install with: pip install python-docx")
         self.debug = debug
+        # Parsed documents keyed by (path, mtime), shared by repeated calls on this instance
+        self._load_document = lru_cache(maxsize=4)(self._open_document)
         if debug:
             logging.basicConfig(level=logging.DEBUG)
     
@@ -52,64 +74,68 @@ class DOCXExtractor:
         """
         try:
             all_text_parts = []
-            seen_text = set()  # To avoid duplicates
-            
-            # Method 1: Use python-docx for standard content
-            doc = Document(file_path)
+            seen_hashes: Set[int] = set()  # hash() of emitted text, to avoid duplicates
             
-            # Extract headers
-            for section in doc.sections:
-                header = section.header
-                if header:
-                    header_text = self._extract_text_from_element(header._element)
-                    if header_text and header_text not in seen_text:
+            # Read every text-bearing part straight from the package in one pass
+            with zipfile.ZipFile(file_path, 'r') as docx_zip:
+                part_names = set(docx_zip.namelist())
+                
+                # Extract headers
+                for part_name in self._numbered_parts(part_names, 'header'):
+                    header_text = self._extract_text_from_element(etree.fromstring(docx_zip.read(part_name)))
+                    if header_text and (header_hash := hash(header_text)) not in seen_hashes:
                         all_text_parts.append(f"[Header] {header_text}")
-                        seen_text.add(header_text)
+                        seen_hashes.add(header_hash)
                         if self.debug:
                             logger.debug(f"Found header: {header_text[:50]}...")
-            
-            # Extract main body paragraphs
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip() and paragraph.text not in seen_text:
-                    all_text_parts.append(paragraph.text)
-                    seen_text.add(paragraph.text)
-                    if self.debug:
-                        logger.debug(f"Found paragraph: {paragraph.text[:50]}...")
-            
-            # Extract text from tables
-            for table_idx, table in enumerate(doc.tables):
-                table_texts = []
-                for row_idx, row in enumerate(table.rows):
-                    row_text = []
-                    for cell in row.cells:
-                        cell_text = cell.text.strip()
-                        if cell_text and cell_text not in seen_text:
-                            row_text.append(cell_text)
-                            seen_text.add(cell_text)
-                    if row_text:
-                        table_texts.append(' | '.join(row_text))
                 
-                if table_texts:
-                    all_text_parts.append(f"\n[Table {table_idx + 1}]")
-                    all_text_parts.extend(table_texts)
-                    if self.debug:
-                        logger.debug(f"Found table {table_idx + 1} with {len(table_texts)} rows")
-            
-            # Extract footers
-            for section in doc.sections:
-                footer = section.footer
-                if footer:
-                    footer_text = self._extract_text_from_element(footer._element)
-                    if footer_text and footer_text not in seen_text:
+                # Extract main body paragraphs, collecting tables as they stream past
+                tables = []
+                with docx_zip.open('word/document.xml') as xml_stream:
+                    for paragraph_text in self._iter_paragraphs(xml_stream, tables):
+                        if paragraph_text.strip() and (paragraph_hash := hash(paragraph_text)) not in seen_hashes:
+                            all_text_parts.append(paragraph_text)
+                            seen_hashes.add(paragraph_hash)
+                            if self.debug:
+                                logger.debug(f"Found paragraph: {paragraph_text[:50]}...")
+                
+                # Extract text from tables
+                for table_idx, rows in enumerate(tables):
+                    table_texts = []
+                    for cells in rows:
+                        row_text = []
+                        for cell_text in cells:
+                            if cell_text and (cell_hash := hash(cell_text)) not in seen_hashes:
+                                row_text.append(cell_text)
+                                seen_hashes.add(cell_hash)
+                        if row_text:
+                            table_texts.append(' | '.join(row_text))
+                    
+                    if table_texts:
+                        all_text_parts.append(f"\n[Table {table_idx + 1}]")
+                        all_text_parts.extend(table_texts)
+                        if self.debug:
+                            logger.debug(f"Found table {table_idx + 1} with {len(table_texts)} rows")
+                
+                # Extract footers
+                for part_name in self._numbered_parts(part_names, 'footer'):
+                    footer_text = self._extract_text_from_element(etree.fromstring(docx_zip.read(part_name)))
+                    if footer_text and (footer_hash := hash(footer_text)) not in seen_hashes:
                         all_text_parts.append(f"[Footer] {footer_text}")
-                        seen_text.add(footer_text)
+                        seen_hashes.add(footer_hash)
                         if self.debug:
                             logger.debug(f"Found footer: {footer_text[:50]}...")
-            
-            # Method 2: Direct XML parsing for text boxes, shapes, and other elements
-            additional_text = self._extract_from_xml(file_path, seen_text)
-            if additional_text:
-                all_text_parts.extend(additional_text)
+                
+                # Extract footnotes and endnotes
+                for part_name in self.NOTE_PARTS:
+                    if part_name not in part_names:
+                        continue
+                    with docx_zip.open(part_name) as xml_stream:
+                        for note_text in self._iter_paragraphs(xml_stream, []):
+                            note_text = note_text.strip()
+                            if note_text and (note_hash := hash(note_text)) not in seen_hashes:
+                                all_text_parts.append(f"[Note] {note_text}")
+                                seen_hashes.add(note_hash)
             
             # Join all text parts
             final_text = '\n'.join(all_text_parts)
@@ -126,92 +152,101 @@ class DOCXExtractor:
     
     def _extract_text_from_element(self, element) -> str:
         """Extract all text from an XML element recursively."""
-        texts = []
-        for elem in element.iter():
-            if elem.tag.endswith('}t'):  # Text elements
-                if elem.text:
-                    texts.append(elem.text)
-        return ' '.join(texts).strip()
+        # '{*}t' matches text elements in any namespace; lxml filters the tags in C
+        return ' '.join(elem.text for elem in element.iter('{*}t') if elem.text).strip()
     
-    def _extract_from_xml(self, file_path: str, seen_text: Set[str]) -> List[str]:
-        """
-        Extract text from XML parts that python-docx might miss.
-        This includes text boxes, shapes, SmartArt, etc.
+    @staticmethod
+    def _numbered_parts(part_names: Set[str], kind: str) -> List[str]:
+        """Return word/<kind>N.xml part names ("header" or "footer") in numeric order."""
+        numbered = []
+        for name in part_names:
+            match = DOCXExtractor.NUMBERED_PART.match(name)
+            if match and match.group(1) == kind:
+                numbered.append((int(match.group(2) or 0), name))
+        return [name for _, name in sorted(numbered)]
+    
+    def _iter_paragraphs(self, xml_stream: IO[bytes], tables: List[List[List[str]]]) -> Iterator[str]:
         """
-        additional_texts = []
-        
-        try:
-            with zipfile.ZipFile(file_path, 'r') as docx_zip:
-                # List all XML files in the DOCX
-                xml_files = [f for f in docx_zip.namelist() if f.endswith('.xml')]
-                
-                if self.debug:
-                    logger.debug(f"Found {len(xml_files)} XML files in DOCX")
-                
-                # Process each XML file
-                for xml_file in xml_files:
-                    try:
-                        content = docx_zip.read(xml_file)
-                        root = ET.fromstring(content)
-                        
-                        # Extract text from various elements
-                        texts = self._extract_texts_from_xml_root(root)
-                        
-                        for text in texts:
-                            if text and text not in seen_text:
-                                # Add context about where the text was found
-                                if 'header' in xml_file:
-                                    additional_texts.append(f"[Header XML] {text}")
-                                elif 'footer' in xml_file:
-                                    additional_texts.append(f"[Footer XML] {text}")
-                                elif 'document' in xml_file:
-                                    additional_texts.append(text)
-                                else:
-                                    additional_texts.append(f"[{xml_file}] {text}")
-                                
-                                seen_text.add(text)
-                                
-                                if self.debug:
-                                    logger.debug(f"Found in {xml_file}: {text[:50]}...")
-                    
-                    except Exception as e:
-                        if self.debug:
-                            logger.debug(f"Could not parse {xml_file}: {e}")
-                        continue
+        Stream paragraph text out of a document part without building its full tree.
         
-        except Exception as e:
-            logger.warning(f"Could not perform deep XML extraction: {e}")
+        Paragraphs outside tables, including those in text boxes, are yielded
+        in document order. Each table is appended to ``tables`` as rows of cell
+        text; tables nested in a cell are folded into that cell's text.
+        Elements are cleared once parsed, so memory stays bounded by the
+        nesting depth rather than the size of the part.
+        """
+        w = self.W_NS
+        pieces = []        # text pieces of each open paragraph, innermost last
+        targets = [None]   # where finished paragraphs go: None yields, a list collects cell text
+        open_rows = []     # cell texts of each open table row
+        open_tables = []   # rows of each open table
         
-        return additional_texts
+        for event, elem in etree.iterparse(xml_stream, events=('start', 'end')):
+            tag = elem.tag
+            
+            if event == 'start':
+                if tag == w + 'p':
+                    pieces.append([])
+                elif tag == w + 'tc':
+                    targets.append([])
+                elif tag == w + 'txbxContent':
+                    targets.append(None)
+                elif tag == w + 'tr':
+                    open_rows.append([])
+                elif tag == w + 'tbl':
+                    open_tables.append([])
+                continue
+            
+            if tag == w + 'p':
+                paragraph_text = ''.join(pieces.pop())
+                if targets[-1] is None:
+                    yield paragraph_text
+                else:
+                    targets[-1].append(paragraph_text)
+            elif tag == w + 't':
+                if pieces:
+                    pieces[-1].append(elem.text or '')
+            elif pieces and elem.getparent() is not None and elem.getparent().tag == w + 'r':
+                if tag in self.RUN_TEXT:
+                    pieces[-1].append(self.RUN_TEXT[tag])
+                elif tag == w + 'br' and elem.get(w + 'type', 'textWrapping') == 'textWrapping':
+                    pieces[-1].append('\n')
+            elif tag == w + 'tc':
+                open_rows[-1].append('\n'.join(targets.pop()).strip())
+            elif tag == w + 'txbxContent':
+                targets.pop()
+            elif tag == w + 'tr':
+                open_tables[-1].append(open_rows.pop())
+            elif tag == w + 'tbl':
+                rows = open_tables.pop()
+                if targets[-1] is None:
+                    tables.append(rows)
+                else:
+                    targets[-1].extend(' | '.join(cell for cell in cells if cell) for cells in rows)
+            
+            # Children have already been visited; free them and earlier siblings
+            elem.clear()
+            parent = elem.getparent()
+            if parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
     
-    def _extract_texts_from_xml_root(self, root) -> List[str]:
-        """Extract all text content from an XML root element."""
-        texts = []
-        
-        # Define all possible text-containing elements
-        text_elements = [
-            './/w:t',  # Regular text
-            './/v:textpath',  # Text in VML shapes
-            './/a:t',  # DrawingML text
-            './/w:instrText',  # Field instruction text
-            './/w:delText',  # Deleted text (track changes)
-            './/w:noBreakHyphen',  # Non-breaking hyphens
-        ]
-        
-        # Extract text from each type of element
-        for xpath in text_elements:
-            for elem in root.findall(xpath, self.NAMESPACES):
-                if elem.text and elem.text.strip():
-                    texts.append(elem.text.strip())
-        
-        # Also try without namespaces for compatibility
-        for elem in root.iter():
-            if elem.tag.endswith(('t', 'text', 'textpath')) and elem.text:
-                text = elem.text.strip()
-                if text and text not in texts:
-                    texts.append(text)
+    def _get_doc(self, file_path: str):
+        """
+        Return a python-docx Document, reusing the last few parsed files.
         
-        return texts
+        Entries are keyed by path and modification time, so an edited file is
+        re-read. File-like objects are always parsed fresh.
+        """
+        if not isinstance(file_path, (str, os.PathLike)):
+            return Document(file_path)
+        path = os.fspath(file_path)
+        return self._load_document(path, os.stat(path).st_mtime_ns)
+    
+    @staticmethod
+    def _open_document(path: str, mtime_ns: int):
+        """Parse a DOCX file; mtime_ns only takes part in the cache key."""
+        return Document(path)
     
     def extract_structure(self, file_path: str) -> dict:
         """
@@ -224,7 +259,7 @@ class DOCXExtractor:
             Dictionary containing document structure information
         """
         try:
-            doc = Document(file_path)
+            doc = self._get_doc(file_path)
             structure = {
                 'paragraphs': len(doc.paragraphs),
                 'tables': len(doc.tables),
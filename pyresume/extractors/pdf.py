@@ -1,30 +1,104 @@
 """
-PDF text extraction using pdfplumber.
+PDF text extraction using pdfplumber, with optional PyMuPDF and Poppler fast paths.
 """
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Callable
+from concurrent.futures import ProcessPoolExecutor
+import io
 import logging
+import os
+import re
+import shutil
+import subprocess
 
 try:
     import pdfplumber
 except ImportError:
     pdfplumber = None
 
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
 logger = logging.getLogger(__name__)
 
+# Runs of three or more newlines, collapsed to a single blank line
+_MULTI_NL = re.compile(r'\n{3,}')
+
+# Below this many pages the process pool costs more than it saves
+PARALLEL_PAGE_THRESHOLD = 4
+
+# Pages with fewer characters than this and an embedded image are treated as scans
+SCANNED_PAGE_MAX_CHARS = 20
+
+# Graphics-heavy pages with fewer characters than this skip table detection
+GRAPHICS_PAGE_MAX_CHARS = 200
+
+
+def _extract_page_range(file_path: str, start: int, stop: int, options: Dict[str, Any]) -> List[str]:
+    """Extract text from pages [start, stop) in a worker process."""
+    extractor = PDFExtractor(backend='pdfplumber', **options)
+    with pdfplumber.open(file_path) as pdf:
+        return [extractor._extract_page_text(page, start + i + 1)
+                for i, page in enumerate(pdf.pages[start:stop])]
+
 
 class PDFExtractor:
     """Extract text content from PDF files."""
     
-    def __init__(self):
-        if pdfplumber is None:
+    def __init__(
+        self,
+        backend: str = 'auto',
+        workers: Optional[int] = None,
+        include_tables: bool = True,
+        max_graphics_ops: int = 5000
+    ):
+        """
+        Initialize the extractor.
+        
+        Args:
+            backend: "pdfplumber", "pymupdf" (text-only and much faster; requires
+                PyMuPDF), "pdftotext" (text-only; requires the Poppler command
+                line tools) or "auto" to use PyMuPDF when it is installed, then
+                pdftotext when tables are not needed, then pdfplumber
+            workers: Default number of processes for pdfplumber page extraction
+                (0 for one per CPU core, None or 1 for in-process extraction)
+            include_tables: Append pdfplumber table text to each page; turn off
+                for text-only resumes to skip table detection entirely
+            max_graphics_ops: Skip table detection on pages with more line and
+                curve objects than this and little text (drawings, charts)
+        """
+        if backend not in ('auto', 'pdfplumber', 'pymupdf', 'pdftotext'):
+            raise ValueError(f"Unknown PDF backend: {backend}")
+        self.pdftotext_path = shutil.which('pdftotext')
+        if backend == 'auto':
+            if fitz is not None:
+                backend = 'pymupdf'
+            elif self.pdftotext_path and not include_tables:
+                backend = 'pdftotext'
+            else:
+                backend = 'pdfplumber'
+        
+        if backend == 'pymupdf' and fitz is None:
+            raise ImportError("PyMuPDF is required for the pymupdf backend. Install with: pip install pymupdf")
+        if backend == 'pdftotext' and not self.pdftotext_path:
+            raise RuntimeError("pdftotext was not found on PATH. Install Poppler (e.g. poppler-utils)")
+        if backend == 'pdfplumber' and pdfplumber is None:
             raise ImportError("pdfplumber is required for PDF extraction. Install with: pip install pdfplumber")
+        self.backend = backend
+        self.workers = workers
+        self.include_tables = include_tables
+        self.max_graphics_ops = max_graphics_ops
     
-    def extract_text(self, file_path: str) -> str:
+    def extract_text(self, file_path: str, workers: Optional[int] = None) -> str:
         """
         Extract text content from a PDF file.
         
         Args:
             file_path: Path to the PDF file
+            workers: Number of processes for pdfplumber page extraction; PDFs
+                with more than PARALLEL_PAGE_THRESHOLD pages are split across
+                them (0 for one per CPU core, None for the instance default)
             
         Returns:
             Extracted text content
@@ -32,57 +106,233 @@ class PDFExtractor:
         Raises:
             Exception: If PDF cannot be read or processed
         """
+        if workers is None:
+            workers = self.workers
+        if workers == 0:
+            workers = os.cpu_count() or 1
+        
+        if (self.backend == 'pdfplumber' and workers and workers > 1
+                and isinstance(file_path, (str, os.PathLike))):
+            pages = self._extract_pages_parallel(file_path, workers)
+        else:
+            pages = self.extract_text_stream(file_path)
+        
+        # Clean each page as it arrives and join them with blank lines, so only
+        # the output buffer holds the whole document
+        buffer = io.StringIO()
+        for page_text in pages:
+            page_text = self._clean_page(page_text)
+            if page_text:
+                buffer.write(page_text)
+                buffer.write('\n\n')
+        return buffer.getvalue().strip()
+    
+    def _extract_pages_parallel(self, file_path: str, workers: int) -> List[str]:
+        """Extract page texts across a process pool, preserving page order."""
         try:
             with pdfplumber.open(file_path) as pdf:
-                text_parts = []
+                page_count = len(pdf.pages)
+            
+            if page_count <= PARALLEL_PAGE_THRESHOLD:
+                return list(self.extract_text_stream(file_path))
+            
+            # One contiguous range per worker so each reopens the file once
+            workers = min(workers, page_count)
+            chunk = -(-page_count // workers)
+            starts = range(0, page_count, chunk)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                ranges = executor.map(
+                    _extract_page_range,
+                    [file_path] * len(starts),
+                    starts,
+                    [start + chunk for start in starts],
+                    [{'include_tables': self.include_tables, 'max_graphics_ops': self.max_graphics_ops}] * len(starts)
+                )
+                return [text for page_texts in ranges for text in page_texts if text]
+                
+        except Exception as e:
+            raise Exception(f"Failed to extract text from PDF: {str(e)}")
+    
+    def extract_text_stream(self, file_path: str, max_pages: Optional[int] = None) -> Iterator[str]:
+        """
+        Lazily extract text from a PDF file one page at a time.
+        
+        Pages are only read as the generator is advanced, so a consumer that
+        stops early never pays for the remaining pages. Page text is yielded
+        uncleaned; empty pages are skipped.
+        
+        Args:
+            file_path: Path to the PDF file
+            max_pages: Read at most this many pages (None reads all pages)
+            
+        Yields:
+            Text content of each non-empty page
+            
+        Raises:
+            Exception: If PDF cannot be read or processed
+        """
+        if self.backend == 'pymupdf':
+            found_text = False
+            for page_text in self._stream_pymupdf(file_path, max_pages):
+                found_text = True
+                yield page_text
+            if found_text or pdfplumber is None:
+                return
+            
+            # No text layer for PyMuPDF (e.g. a scanned PDF); give pdfplumber a try
+            if hasattr(file_path, 'seek'):
+                file_path.seek(0)
+        
+        elif self.backend == 'pdftotext':
+            pages = self._run_pdftotext(file_path, max_pages)
+            if pages or pdfplumber is None:
+                yield from pages
+                return
+            
+            # pdftotext failed or found no text; give pdfplumber a try
+            if hasattr(file_path, 'seek'):
+                file_path.seek(0)
+        
+        yield from self._stream_pdfplumber(file_path, max_pages)
+    
+    def _stream_pymupdf(self, file_path: str, max_pages: Optional[int]) -> Iterator[str]:
+        """Yield the text of each non-empty page using PyMuPDF."""
+        try:
+            if isinstance(file_path, (str, os.PathLike)):
+                doc = fitz.open(file_path)
+            else:
+                doc = fitz.open(stream=file_path.read(), filetype='pdf')
+            
+            with doc:
+                page_count = doc.page_count if max_pages is None else min(max_pages, doc.page_count)
+                for i in range(page_count):
+                    page_text = doc[i].get_text('text')
+                    if page_text.strip():
+                        yield page_text
                 
+        except Exception as e:
+            raise Exception(f"Failed to extract text from PDF: {str(e)}")
+    
+    def _run_pdftotext(self, file_path: str, max_pages: Optional[int]) -> List[str]:
+        """Return the text of each non-empty page using Poppler's pdftotext, or [] on failure."""
+        command = [self.pdftotext_path, '-layout', '-enc', 'UTF-8']
+        if max_pages is not None:
+            command += ['-l', str(max_pages)]
+        
+        if isinstance(file_path, (str, os.PathLike)):
+            command += [os.fspath(file_path), '-']
+            stdin_data = None
+        else:
+            command += ['-', '-']
+            stdin_data = file_path.read()
+        
+        try:
+            result = subprocess.run(command, input=stdin_data, capture_output=True)
+        except OSError as e:
+            logger.warning(f"pdftotext could not be run: {e}")
+            return []
+        if result.returncode != 0:
+            logger.warning(f"pdftotext failed: {result.stderr.decode('utf-8', errors='replace').strip()}")
+            return []
+        
+        # Pages are separated by form feeds
+        pages = result.stdout.decode('utf-8', errors='replace').split('\f')
+        return [page_text for page_text in pages if page_text.strip()]
+    
+    def _stream_pdfplumber(self, file_path: str, max_pages: Optional[int]) -> Iterator[str]:
+        """Yield the text of each non-empty page using pdfplumber."""
+        try:
+            with pdfplumber.open(file_path) as pdf:
                 # Get metadata if available
                 metadata = self._extract_metadata(pdf)
                 if metadata:
                     logger.debug(f"PDF metadata: {metadata}")
                 
-                for i, page in enumerate(pdf.pages):
+                pages = pdf.pages if max_pages is None else pdf.pages[:max_pages]
+                
+                # Image-only pages skip the text strategies one page at a time
+                # (see _extract_page_text), so a scanned cover page does not
+                # hide the text pages behind it
+                found_text = False
+                for i, page in enumerate(pages):
                     # Try different extraction strategies
                     page_text = self._extract_page_text(page, i + 1)
                     
                     if page_text:
-                        text_parts.append(page_text)
+                        found_text = True
+                        yield page_text
                 
-                # Join pages with double newlines
-                full_text = '\n\n'.join(text_parts)
-                
-                # Clean up excessive whitespace
-                full_text = self._clean_text(full_text)
-                
-                return full_text
+                if not found_text and any(page.images for page in pages):
+                    logger.info("PDF appears to be scanned images with no text layer")
                 
         except Exception as e:
             raise Exception(f"Failed to extract text from PDF: {str(e)}")
     
+    def extract_until(
+        self,
+        file_path: str,
+        predicate: Optional[Callable[[str], bool]] = None,
+        max_pages: Optional[int] = None
+    ) -> str:
+        """
+        Extract text from a PDF file, stopping once enough has been read.
+        
+        Args:
+            file_path: Path to the PDF file
+            predicate: Called with the text read so far after each page;
+                extraction stops when it returns True
+            max_pages: Read at most this many pages (None reads all pages)
+            
+        Returns:
+            Extracted text content of the pages read
+            
+        Raises:
+            Exception: If PDF cannot be read or processed
+        """
+        text_parts = []
+        for page_text in self.extract_text_stream(file_path, max_pages=max_pages):
+            text_parts.append(page_text)
+            if predicate is not None and predicate('\n\n'.join(text_parts)):
+                break
+        
+        return self._clean_text('\n\n'.join(text_parts))
+    
     def _extract_page_text(self, page, page_num: int) -> str:
         """Extract text from a single page using multiple strategies."""
         page_text = None
         
-        # Strategy 1: Default extraction
+        # All strategies render the same (cached) page.chars, so a page without
+        # any characters, e.g. a scanned image, has no text for them to find
         try:
-            page_text = page.extract_text()
+            has_chars = bool(page.chars)
         except Exception as e:
-            logger.warning(f"Default extraction failed for page {page_num}: {e}")
+            logger.warning(f"Character parsing failed for page {page_num}: {e}")
+            has_chars = True
+        
+        # Strategy 1: Default extraction
+        if has_chars:
+            try:
+                page_text = page.extract_text()
+            except Exception as e:
+                logger.warning(f"Default extraction failed for page {page_num}: {e}")
         
         # Strategy 2: If default extraction gives poor results, try with layout
-        if not page_text or len(page_text.strip()) < 50:
+        if has_chars and (not page_text or len(page_text.strip()) < 50):
             try:
                 page_text = page.extract_text(layout=True)
             except Exception as e:
                 logger.warning(f"Layout extraction failed for page {page_num}: {e}")
         
         # Strategy 3: Try x_tolerance and y_tolerance adjustments for better extraction
-        if not page_text or len(page_text.strip()) < 50:
+        if has_chars and (not page_text or len(page_text.strip()) < 50):
             try:
                 page_text = page.extract_text(x_tolerance=2, y_tolerance=2)
             except Exception as e:
                 logger.warning(f"Tolerance extraction failed for page {page_num}: {e}")
         
+        if not self.include_tables:
+            return page_text or ""
+        
         # Strategy 4: Extract tables separately if present
         table_text = self._extract_tables_from_page(page)
         if table_text:
@@ -96,6 +346,13 @@ class PDFExtractor:
     def _extract_tables_from_page(self, page) -> str:
         """Extract tables from a page and convert to text."""
         try:
+            # Table detection walks every line and edge; skip pages that cannot hold text tables
+            char_count = len(page.chars)
+            if char_count < SCANNED_PAGE_MAX_CHARS and page.images:
+                return ""
+            if char_count < GRAPHICS_PAGE_MAX_CHARS and len(page.lines) + len(page.curves) > self.max_graphics_ops:
+                return ""
+            
             tables = page.extract_tables()
             if not tables:
                 return ""
@@ -117,15 +374,12 @@ class PDFExtractor:
         if not table:
             return ""
         
-        # Filter out empty rows
-        table = [row for row in table if any(cell for cell in row if cell)]
-        if not table:
-            return ""
-        
-        # Convert to text with pipe separators
+        # Convert to text with pipe separators, skipping empty rows
         lines = []
         for row in table:
-            formatted_row = ' | '.join([str(cell or '').strip() for cell in row])
+            if not any(row):
+                continue
+            formatted_row = ' | '.join(str(cell).strip() if cell else '' for cell in row)
             if formatted_row.strip():
                 lines.append(formatted_row)
         
@@ -148,6 +402,25 @@ class PDFExtractor:
     
     def _clean_text(self, text: str) -> str:
         """Clean extracted text."""
+        # Remove multiple consecutive blank lines
+        text = _MULTI_NL.sub('\n\n', self._clean_page(text))
+        
+        return text.strip()
+    
+    def _clean_page(self, text: str) -> str:
+        """
+        Clean the text of a single page.
+        
+        Trailing whitespace is removed, blank-line runs collapse to one and
+        leading/trailing blank lines are dropped; the first line keeps its
+        indentation so pages can be cleaned independently and joined.
+        
+        Args:
+            text: Raw page text
+            
+        Returns:
+            Cleaned page text (empty if the page has no visible text)
+        """
         # Remove excessive whitespace while preserving structure
         lines = text.split('\n')
         cleaned_lines = []
@@ -162,14 +435,11 @@ class PDFExtractor:
             elif cleaned_lines and cleaned_lines[-1] != '':
                 cleaned_lines.append('')
         
-        # Join lines back together
-        text = '\n'.join(cleaned_lines)
-        
-        # Remove multiple consecutive blank lines
-        while '\n\n\n' in text:
-            text = text.replace('\n\n\n', '\n\n')
+        if cleaned_lines and cleaned_lines[-1] == '':
+            cleaned_lines.pop()
         
-        return text.strip()
+        # Join lines back together
+        return '\n'.join(cleaned_lines)
     
     def extract_tables(self, file_path: str) -> list:
         """
@@ -4,6 +4,9 @@ Plain text file handling.
 from typing import Optional
 import chardet
 
+# Bytes handed to chardet; its Python state machine is O(n) and a window is plenty
+ENCODING_DETECT_BYTES = 65536
+
 
 class TextExtractor:
     """Extract content from plain text files."""
@@ -22,23 +25,38 @@ class TextExtractor:
             Exception: If file cannot be read
         """
         try:
-            # Try to detect encoding first
             with open(file_path, 'rb') as f:
                 raw_data = f.read()
-                encoding_result = chardet.detect(raw_data)
-                encoding = encoding_result.get('encoding', 'utf-8')
-            
-            # Read with detected encoding
-            with open(file_path, 'r', encoding=encoding, errors='replace') as f:
-                return f.read()
-                
         except Exception as e:
-            # Fallback to UTF-8 with error replacement
+            raise Exception(f"Failed to read text file: {str(e)}")
+        
+        return self.decode(raw_data)
+    
+    def decode(self, raw_data: bytes) -> str:
+        """
+        Decode raw text file content using its detected encoding.
+        
+        Args:
+            raw_data: Raw file content (bytes or any buffer, e.g. an mmap)
+            
+        Returns:
+            Text content with line endings normalized to '\\n'
+        """
+        raw_data = bytes(raw_data)
+        try:
+            # ASCII and UTF-8 files (the common case) decode without detection;
+            # utf-8-sig also drops a leading byte-order mark
+            content = raw_data.decode('utf-8-sig')
+        except UnicodeDecodeError:
+            encoding = chardet.detect(raw_data[:ENCODING_DETECT_BYTES]).get('encoding') or 'utf-8'
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                    return f.read()
-            except Exception as fallback_error:
-                raise Exception(f"Failed to read text file: {str(fallback_error)}")
+                content = raw_data.decode(encoding, errors='replace')
+            except LookupError:
+                # Fallback to UTF-8 with error replacement
+                content = raw_data.decode('utf-8', errors='replace')
+        
+        # Match the universal newline handling of text-mode reads
+        return content.replace('\r\n', '\n').replace('\r', '\n')
     
     def clean_text(self, text: str) -> str:
         """
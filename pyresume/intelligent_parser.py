@@ -1,18 +1,64 @@
 """
 Intelligent resume parser using LLM providers.
 """
-from typing import Optional, Dict, Any, Union
-from pathlib import Path
+from typing import Optional, Dict, Any, Union, List, Callable
+from collections import OrderedDict
+from datetime import date
+from functools import lru_cache, partial
+import asyncio
+import copy
+import hashlib
+import os
+import re
+import threading
+import time
+import warnings
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
 
 from .parser import ResumeParser as RegexParser
 from .models.resume import Resume, ContactInfo, Experience, Education, Skill, Project, Certification
-from .providers import registry, ParsedResume, LLMProvider
+from .providers import registry, ParsedResume, LLMProvider, RESUME_JSON_SCHEMA, EXTRACTION_GUIDELINES
+from .providers._ratelimit import TokenBucket
 from .utils.dates import DateParser
 
 # Create a date parser instance
 date_parser = DateParser()
 
 
+@lru_cache(maxsize=1024)
+def _parse_date_str(date_str: str, today: date) -> Optional[date]:
+    """
+    Parse a date string, memoized since resumes repeat the same date tokens.
+    
+    ``today`` is only part of the cache key: "Present" and partial dates
+    such as "2018" resolve relative to the current date, so entries from an
+    earlier day must not be reused.
+    """
+    return date_parser.parse_date(date_str)
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    """Parse a date field from LLM output, ignoring empty and non-string values."""
+    return _parse_date_str(value, date.today()) if value and isinstance(value, str) else None
+
+
+# Changes to the extraction prompt invalidate cached LLM results
+PROMPT_VERSION = hashlib.sha256((RESUME_JSON_SCHEMA + EXTRACTION_GUIDELINES).encode("utf-8")).hexdigest()[:12]
+
+# Seconds a provider availability check is reused; local providers probe
+# their endpoint over HTTP on every is_available() call
+PROVIDER_CHECK_TTL = 30.0
+
+# Skill category keywords, matched as substrings of the lowercased skill
+_PROGRAMMING_RE = re.compile(r'python|java|javascript|c\+\+|c#|ruby|go|rust|swift|kotlin')
+_WEB_RE = re.compile(r'html|css|react|angular|vue|node|django|flask|rails')
+_DATABASE_RE = re.compile(r'sql|mysql|postgresql|mongodb|redis|oracle|sqlite')
+
+
 class IntelligentResumeParser:
     """
     Resume parser that uses LLMs for intelligent parsing with fallback to regex.
@@ -29,6 +75,16 @@ class IntelligentResumeParser:
         provider: Optional[Union[str, LLMProvider]] = None,
         use_llm: bool = True,
         fallback_to_regex: bool = True,
+        cache_size: int = 256,
+        cache_dir: Optional[str] = None,
+        request_timeout: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+        max_output_tokens_per_call: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        rate_limit_rpm: Optional[int] = None,
+        rate_limit_tpm: Optional[int] = None,
+        max_pages: Optional[int] = 3,
+        early_stop_predicate: Optional[Callable[[str], bool]] = None,
         **provider_kwargs
     ):
         """
@@ -38,22 +94,67 @@ class IntelligentResumeParser:
             provider: Provider name ("anthropic", "openai", "local") or LLMProvider instance
             use_llm: Whether to use LLM parsing (default: True)
             fallback_to_regex: Whether to fallback to regex if LLM fails (default: True)
+            cache_size: Number of LLM results kept in memory, keyed by a hash of
+                the input text (0 disables the in-memory cache)
+            cache_dir: Directory for a persistent result cache, e.g.
+                "~/.pyresume/cache" (requires diskcache)
+            request_timeout: Per-request timeout in seconds for a named provider
+            max_output_tokens: Output token cap per resume ("anthropic"/"openai")
+            max_output_tokens_per_call: Output token limit of the model, which
+                bounds the resumes packed into one request by
+                parse_texts_marshaled ("anthropic"/"openai"); pass
+                packed_tokens_per_resume to change the share each one gets
+            max_retries: Retries with backoff on 429/5xx errors ("anthropic"/"openai")
+            rate_limit_rpm: Client-side cap on provider requests per minute
+                (e.g. 50 for Anthropic tier 1)
+            rate_limit_tpm: Client-side cap on estimated tokens per minute
+                (e.g. 40000 for Anthropic tier 1)
+            max_pages: Pages of a PDF sent to the LLM (None for all pages)
+            early_stop_predicate: Stop reading a PDF once this returns True for
+                the text so far, e.g. ResumePatterns.has_contact_and_sections
             **provider_kwargs: Additional arguments for provider initialization
         """
         self.use_llm = use_llm
         self.fallback_to_regex = fallback_to_regex
         self.regex_parser = RegexParser()
+        self._extractors = self.regex_parser.extractors
+        self.last_parse_used_llm = False
+        self.max_pages = max_pages
+        self.early_stop_predicate = early_stop_predicate
+        
+        # LLM result caches
+        self.cache_size = cache_size
+        self._memory_cache = OrderedDict()
+        self._disk_cache = None
+        if cache_dir:
+            if diskcache is None:
+                raise ImportError("diskcache is required for a persistent cache. Install with: pip install diskcache")
+            self._disk_cache = diskcache.Cache(os.path.expanduser(cache_dir))
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
         
         # Initialize LLM provider
         self.llm_provider = None
         if use_llm:
             if isinstance(provider, str):
+                limits = {"timeout": request_timeout}
+                if provider in ("anthropic", "openai"):
+                    limits.update(max_tokens=max_output_tokens, max_retries=max_retries,
+                                  max_output_tokens_per_call=max_output_tokens_per_call)
+                provider_kwargs.update((key, value) for key, value in limits.items() if value is not None)
                 self.llm_provider = self._create_provider(provider, **provider_kwargs)
             elif isinstance(provider, LLMProvider):
                 self.llm_provider = provider
             else:
                 # Try to get from registry
                 self.llm_provider = registry.get()
+        
+        if self.llm_provider is not None and (rate_limit_rpm or rate_limit_tpm):
+            self.llm_provider.rate_limiter = TokenBucket(rate_limit_rpm, rate_limit_tpm)
+        
+        # (provider, checked_at, available) from the last availability check
+        self._availability = (None, 0.0, False)
     
     def _create_provider(self, provider_type: str, **kwargs) -> Optional[LLMProvider]:
         """Create a provider instance."""
@@ -75,6 +176,19 @@ class IntelligentResumeParser:
         else:
             return registry.get(provider_type)
     
+    def _provider_available(self) -> bool:
+        """Check whether the LLM provider can be used, reusing recent results."""
+        provider = self.llm_provider
+        if provider is None:
+            return False
+        
+        checked_provider, checked_at, available = self._availability
+        now = time.monotonic()
+        if checked_provider is not provider or now - checked_at >= PROVIDER_CHECK_TTL:
+            available = bool(provider.is_available())
+            self._availability = (provider, now, available)
+        return available
+    
     def parse(
         self, 
         file_path: str,
@@ -99,10 +213,11 @@ class IntelligentResumeParser:
         should_use_llm = use_llm if use_llm is not None else self.use_llm
         
         # Try LLM parsing first
-        if should_use_llm and self.llm_provider and self.llm_provider.is_available():
+        if should_use_llm and self._provider_available():
             try:
-                parsed = self.llm_provider.parse_resume(text, job_description)
-                return self._convert_to_resume(parsed, file_path)
+                resume = self._parse_with_llm(text, job_description, file_path)
+                self.last_parse_used_llm = True
+                return resume
             except Exception as e:
 # LLM parsing failed, fall back to regex if enabled
                 if not self.fallback_to_regex:
@@ -110,6 +225,7 @@ class IntelligentResumeParser:
         
         # Fallback to regex parsing
         if self.fallback_to_regex or not should_use_llm:
+            self.last_parse_used_llm = False
             return self.regex_parser.parse(file_path)
         
         raise RuntimeError("No parsing method available")
@@ -123,29 +239,259 @@ class IntelligentResumeParser:
         """Parse resume from raw text."""
         should_use_llm = use_llm if use_llm is not None else self.use_llm
         
-        if should_use_llm and self.llm_provider and self.llm_provider.is_available():
+        if should_use_llm and self._provider_available():
             try:
-                parsed = self.llm_provider.parse_resume(text, job_description)
-                return self._convert_to_resume(parsed, None)
+                resume = self._parse_with_llm(text, job_description, None)
+                self.last_parse_used_llm = True
+                return resume
             except Exception as e:
 # LLM parsing failed, fall back to regex if enabled
                 if not self.fallback_to_regex:
                     raise
         
         if self.fallback_to_regex or not should_use_llm:
+            self.last_parse_used_llm = False
             return self.regex_parser.parse_text(text)
         
         raise RuntimeError("No parsing method available")
     
+    def cache_info(self) -> Dict[str, int]:
+        """Return hit/miss counts and the size of the in-memory LLM result cache."""
+        with self._cache_lock:
+            return {
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "size": len(self._memory_cache)
+            }
+    
+    def _parse_with_llm(self, text: str, job_description: Optional[str],
+                        file_path: Optional[str]) -> Resume:
+        """Parse text with the LLM provider, reusing cached results for identical input."""
+        key = self._cache_key(text, job_description)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        parsed = self.llm_provider.parse_resume(text, job_description)
+        resume = self._convert_to_resume(parsed, file_path)
+        
+        # Responses that could not be decoded are not worth keeping
+        if parsed.confidence > 0:
+            self._cache_put(key, resume)
+        return resume
+    
+    def _cache_key(self, text: str, job_description: Optional[str]) -> str:
+        """Build a cache key from the provider, model, prompt version and input hash."""
+        digest = hashlib.sha256(text.encode("utf-8"))
+        if job_description:
+            digest.update(b"\0" + job_description.encode("utf-8"))
+        provider = self.llm_provider
+        return "|".join((
+            type(provider).__name__,
+            str(getattr(provider, "model", "")),
+            PROMPT_VERSION,
+            digest.hexdigest()
+        ))
+    
+    def _cache_get(self, key: str) -> Optional[Resume]:
+        """Look up a cached Resume, returning a copy the caller may modify."""
+        with self._cache_lock:
+            resume = self._memory_cache.get(key)
+            if resume is not None:
+                self._memory_cache.move_to_end(key)
+        if resume is None and self._disk_cache is not None:
+            resume = self._disk_cache.get(key)
+        
+        with self._cache_lock:
+            if resume is None:
+                self._cache_misses += 1
+                return None
+            self._cache_hits += 1
+        return copy.deepcopy(resume)
+    
+    def _cache_put(self, key: str, resume: Resume):
+        """Store a copy of a Resume in the enabled caches."""
+        if self.cache_size > 0:
+            with self._cache_lock:
+                self._memory_cache[key] = copy.deepcopy(resume)
+                if len(self._memory_cache) > self.cache_size:
+                    self._memory_cache.popitem(last=False)
+        if self._disk_cache is not None:
+            self._disk_cache.set(key, resume)
+    
+    async def parse_text_async(
+        self,
+        text: str,
+        job_description: Optional[str] = None,
+        use_llm: Optional[bool] = None
+    ) -> Resume:
+        """
+        Parse resume from raw text without blocking the event loop.
+        
+        Provider SDK calls are synchronous, so the parse runs in the loop's
+        default executor; gather several calls to overlap their latency.
+        Check ``resume.extraction_metadata.get("used_llm")`` rather than
+        ``last_parse_used_llm`` when parses run concurrently.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, partial(self.parse_text, text, job_description, use_llm)
+        )
+    
+    def parse_batch(
+        self,
+        texts: List[str],
+        job_description: Optional[str] = None,
+        use_llm: Optional[bool] = None
+    ) -> List[Resume]:
+        """
+        Parse many resumes in one provider batch job.
+        
+        Anthropic and OpenAI providers submit every text through their batch
+        APIs (cheaper, higher rate limits, but asynchronous - this blocks until
+        the job finishes); other providers parse the texts one at a time.
+        Texts the LLM could not parse fall back to regex when enabled.
+        
+        Args:
+            texts: Raw resume texts
+            job_description: Optional job description for context
+            use_llm: Override the default use_llm setting
+            
+        Returns:
+            One Resume per input text, in input order
+        """
+        should_use_llm = use_llm if use_llm is not None else self.use_llm
+        
+        if should_use_llm and self._provider_available():
+            try:
+                parsed_batch = self.llm_provider.parse_batch(texts, job_description)
+            except Exception:
+                if not self.fallback_to_regex:
+                    raise
+                parsed_batch = [None] * len(texts)
+            return self._convert_batch(texts, parsed_batch)
+        
+        if self.fallback_to_regex or not should_use_llm:
+            return [self.regex_parser.parse_text(text) for text in texts]
+        
+        raise RuntimeError("No parsing method available")
+    
+    def parse_texts_marshaled(
+        self,
+        texts: List[str],
+        rows_per_call: Optional[int] = None,
+        max_chars_per_call: int = 60000,
+        job_description: Optional[str] = None,
+        use_llm: Optional[bool] = None
+    ) -> List[Resume]:
+        """
+        Parse resumes several at a time, packing each group into one LLM request.
+        
+        Useful when the provider's requests-per-minute limit binds before its
+        tokens-per-minute limit. Groups hold at most ``rows_per_call`` resumes
+        and about ``max_chars_per_call`` characters of resume text; a single
+        longer resume is sent on its own. Groups are also kept small enough
+        that the expected output fits the provider's output budget (see
+        ``LLMProvider.max_resumes_per_call``, 4 with the default limits); a
+        larger ``rows_per_call`` is lowered to that with a warning.
+        
+        Args:
+            texts: Raw resume texts
+            rows_per_call: Maximum resumes per request (default: as many as
+                the provider's output budget allows, or 8 without a limit)
+            max_chars_per_call: Soft cap on resume characters per request
+            job_description: Optional job description for context
+            use_llm: Override the default use_llm setting
+            
+        Returns:
+            One Resume per input text, in input order
+        """
+        should_use_llm = use_llm if use_llm is not None else self.use_llm
+        
+        if should_use_llm and self._provider_available():
+            max_rows = self.llm_provider.max_resumes_per_call()
+            if rows_per_call is None:
+                rows_per_call = max_rows or 8
+            elif max_rows and rows_per_call > max_rows:
+                warnings.warn(
+                    f"rows_per_call={rows_per_call} exceeds the {max_rows} resumes whose "
+                    f"output fits one request; sending {max_rows} per request",
+                    stacklevel=2
+                )
+            parsed_batch = []
+            groups = self._group_texts(texts, rows_per_call, max_chars_per_call, max_rows)
+            for group in groups:
+                try:
+                    parsed_batch.extend(self.llm_provider.parse_resumes(group, job_description))
+                except Exception:
+                    if not self.fallback_to_regex:
+                        raise
+                    parsed_batch.extend([None] * len(group))
+            return self._convert_batch(texts, parsed_batch)
+        
+        if self.fallback_to_regex or not should_use_llm:
+            return [self.regex_parser.parse_text(text) for text in texts]
+        
+        raise RuntimeError("No parsing method available")
+    
+    @staticmethod
+    def _group_texts(
+        texts: List[str],
+        rows_per_call: int,
+        max_chars: int,
+        max_rows_for_output: Optional[int] = None
+    ) -> List[List[str]]:
+        """
+        Split texts into consecutive groups bounded by count and total length.
+        
+        Args:
+            texts: Texts to group
+            rows_per_call: Maximum texts per group
+            max_chars: Soft cap on characters per group
+            max_rows_for_output: Most texts whose output fits one request,
+                from the provider's output budget (None for no limit)
+            
+        Returns:
+            Groups of texts, in input order
+        """
+        if max_rows_for_output:
+            rows_per_call = min(rows_per_call, max_rows_for_output)
+        groups = []
+        group = []
+        group_chars = 0
+        for text in texts:
+            if group and (len(group) >= rows_per_call or group_chars + len(text) > max_chars):
+                groups.append(group)
+                group = []
+                group_chars = 0
+            group.append(text)
+            group_chars += len(text)
+        if group:
+            groups.append(group)
+        return groups
+    
+    def _convert_batch(self, texts: List[str], parsed_batch: List[Optional[ParsedResume]]) -> List[Resume]:
+        """Convert per-text LLM results, falling back to regex for failed entries."""
+        resumes = []
+        for text, parsed in zip(texts, parsed_batch):
+            if parsed is not None:
+                resumes.append(self._convert_to_resume(parsed, None))
+            elif self.fallback_to_regex:
+                resumes.append(self.regex_parser.parse_text(text))
+            else:
+                raise RuntimeError("LLM batch parsing failed for one or more resumes")
+        return resumes
+    
     def _extract_text(self, file_path: str) -> str:
         """Extract text from file using existing extractors."""
-        path = Path(file_path)
-        extension = path.suffix.lower()
-        
-        if extension not in self.regex_parser.extractors:
+        extension = os.path.splitext(file_path)[1].lower()
+        extractor = self._extractors.get(extension)
+        if extractor is None:
             raise ValueError(f"Unsupported file format: {extension}")
         
-        extractor = self.regex_parser.extractors[extension]
+        if extension == '.pdf':
+            # Later pages are rarely needed by the LLM; skip their layout analysis
+            return extractor.extract_until(file_path, self.early_stop_predicate, self.max_pages)
         return extractor.extract_text(file_path)
     
     def _convert_to_resume(self, parsed: ParsedResume, file_path: Optional[str]) -> Resume:
@@ -164,8 +510,10 @@ class IntelligentResumeParser:
         # Convert experience
         experiences = []
         for exp in parsed.experience:
-            start_date = date_parser.parse(exp.get("start_date")) if exp.get("start_date") else None
-            end_date = date_parser.parse(exp.get("end_date")) if exp.get("end_date") and exp.get("end_date") != "Present" else None
+            end = exp.get("end_date")
+            is_current = end == "Present"
+            start_date = _parse_date(exp.get("start_date"))
+            end_date = None if is_current else _parse_date(end)
             
             experiences.append(Experience(
                 title=exp.get("title"),
@@ -173,7 +521,7 @@ class IntelligentResumeParser:
                 location=exp.get("location"),
                 start_date=start_date,
                 end_date=end_date,
-                current=exp.get("end_date") == "Present",
+                current=is_current,
                 description=exp.get("description"),
                 responsibilities=exp.get("responsibilities", [])
             ))
@@ -181,7 +529,7 @@ class IntelligentResumeParser:
         # Convert education
         educations = []
         for edu in parsed.education:
-            grad_date = date_parser.parse(edu.get("graduation_date")) if edu.get("graduation_date") else None
+            grad_date = _parse_date(edu.get("graduation_date"))
             
             educations.append(Education(
                 degree=edu.get("degree"),
@@ -212,8 +560,8 @@ class IntelligentResumeParser:
             certifications.append(Certification(
                 name=cert.get("name"),
                 issuer=cert.get("issuer"),
-                issue_date=date_parser.parse(cert.get("date")) if cert.get("date") else None,
-                expiry_date=date_parser.parse(cert.get("expiry")) if cert.get("expiry") else None
+                issue_date=_parse_date(cert.get("date")),
+                expiry_date=_parse_date(cert.get("expiry"))
             ))
         
         # Create confidence scores
@@ -235,22 +583,19 @@ class IntelligentResumeParser:
             projects=projects,
             certifications=certifications,
             raw_text=parsed.raw_response or "",
-            confidence_scores=confidence_scores
+            confidence_scores=confidence_scores,
+            extraction_metadata={"used_llm": True}
         )
     
     def _categorize_skill(self, skill: str) -> str:
         """Categorize a skill."""
         skill_lower = skill.lower()
         
-        programming_keywords = ["python", "java", "javascript", "c++", "c#", "ruby", "go", "rust", "swift", "kotlin"]
-        web_keywords = ["html", "css", "react", "angular", "vue", "node", "django", "flask", "rails"]
-        database_keywords = ["sql", "mysql", "postgresql", "mongodb", "redis", "oracle", "sqlite"]
-        
-        if any(keyword in skill_lower for keyword in programming_keywords):
+        if _PROGRAMMING_RE.search(skill_lower):
             return "programming"
-        elif any(keyword in skill_lower for keyword in web_keywords):
+        elif _WEB_RE.search(skill_lower):
             return "web"
-        elif any(keyword in skill_lower for keyword in database_keywords):
+        elif _DATABASE_RE.search(skill_lower):
             return "database"
         else:
             return "other"
\ No newline at end of file
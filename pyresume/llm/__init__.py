@@ -5,22 +5,46 @@ This module provides interfaces and implementations for various LLM providers
 to enhance resume parsing capabilities.
 """
 
+import importlib
+
 from .base import LLMProvider, LLMConfig, LLMResponse
-from .providers import (
-    AnthropicProvider,
-    OpenAIProvider,
-    OllamaProvider,
-    CustomEndpointProvider,
-    RegexFallbackProvider
-)
-from .manager import LLMManager
-from .prompts import PromptTemplates
+from .cache import ResponseCache
+
+# Providers pull in their SDKs (anthropic, openai, httpx), so they and the
+# modules built on them are imported on first attribute access (PEP 562)
+_LAZY_EXPORTS = {
+    'AnthropicProvider': ('.providers', 'AnthropicProvider'),
+    'OpenAIProvider': ('.providers', 'OpenAIProvider'),
+    'OllamaProvider': ('.providers', 'OllamaProvider'),
+    'CustomEndpointProvider': ('.providers', 'CustomEndpointProvider'),
+    'RegexFallbackProvider': ('.providers', 'RegexFallbackProvider'),
+    'LLMManager': ('.manager', 'LLMManager'),
+    'PromptTemplates': ('.prompts', 'PromptTemplates'),
+}
+
+
+def __getattr__(name):
+    """Import lazily exported names on first access."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    module_name, attribute = _LAZY_EXPORTS[name]
+    try:
+        module = importlib.import_module(module_name, __name__)
+    except ImportError as e:
+        raise AttributeError(f"{name} is unavailable: {e}") from e
+    
+    value = getattr(module, attribute)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Base classes
     'LLMProvider',
     'LLMConfig',
     'LLMResponse',
+    'ResponseCache',
     
     # Providers
     'AnthropicProvider',
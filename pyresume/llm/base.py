@@ -3,10 +3,75 @@ Base classes and interfaces for LLM providers.
 """
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List, Tuple, Union, Callable
 from enum import Enum
+from functools import partial
+import asyncio
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson parses large responses several times faster; its decode error
+# subclasses json.JSONDecodeError, so error handling is shared
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Marks an LLMResponse whose content has not been parsed yet
+_UNPARSED = object()
+
+# LLMConfig.extra_params keys consumed by the client rather than sent to the API
+CLIENT_SIDE_PARAMS = frozenset({'max_concurrency', 'system_addendum'})
+
+# Receives each streamed text delta of one request together with the attempt
+# (starting at 1) it belongs to, since invalid JSON replies are retried
+TextCallback = Callable[[str, int], None]
+
+
+# Most embedded {...} spans tried by LLMResponse.get_json before giving up
+MAX_JSON_CANDIDATES = 32
+
+
+def _find_json_objs(text: str) -> List[Tuple[int, int]]:
+    """
+    Locate every balanced ``{...}`` span in one pass over the text.
+    
+    Open braces are kept on a stack, so a ``{`` that is never closed (for
+    example in prose before the JSON) is simply left behind rather than
+    rescanned. Braces inside JSON strings are ignored; quotes only count
+    inside an open brace, so stray quotes in surrounding prose are harmless.
+    
+    Args:
+        text: Text that may contain JSON objects
+        
+    Returns:
+        (begin, end) slice bounds of each balanced span, outermost and
+        earliest first
+    """
+    spans = []
+    opened = []
+    in_string = False
+    escaped = False
+    for i, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '{':
+            opened.append(i)
+        elif not opened:
+            continue
+        elif char == '"':
+            in_string = True
+        elif char == '}':
+            spans.append((opened.pop(), i + 1))
+    spans.sort()
+    return spans
+
 
 class LLMProviderType(Enum):
     """Supported LLM provider types."""
@@ -58,12 +123,19 @@ class LLMResponse:
     structured_data: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _json_cache: Any = field(default=_UNPARSED, init=False, repr=False, compare=False)
     
     def get_json(self) -> Optional[Dict[str, Any]]:
-        """Extract JSON from content if available."""
+        """Extract JSON from content if available; the parsed result is cached."""
         if self.structured_data:
             return self.structured_data
         
+        if self._json_cache is _UNPARSED:
+            self._json_cache = self._parse_content_json()
+        return self._json_cache
+    
+    def _parse_content_json(self) -> Optional[Dict[str, Any]]:
+        """Parse JSON out of the raw text content."""
         if self.content:
             try:
                 # Try to extract JSON from the content
@@ -82,15 +154,14 @@ class LLMResponse:
                 content = content.strip()
                 
                 # Try to parse as JSON
-                return json.loads(content)
+                return _json_loads(content)
             except json.JSONDecodeError:
-                # If direct parsing fails, try to find JSON in the content
-                import re
-                json_pattern = r'\{[^{}]*\}'
-                matches = re.findall(json_pattern, content, re.DOTALL)
-                for match in matches:
+                # If direct parsing fails, try to find JSON in the content;
+                # an object may sit inside a span that is not JSON itself, so
+                # nested spans are tried too, up to a fixed number of parses
+                for begin, end in _find_json_objs(content)[:MAX_JSON_CANDIDATES]:
                     try:
-                        return json.loads(match)
+                        return _json_loads(content[begin:end])
                     except json.JSONDecodeError:
                         continue
         
@@ -100,6 +171,9 @@ class LLMResponse:
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
     
+    # Optional ResponseCache consulted before each deterministic request
+    response_cache = None
+    
     def __init__(self, config: LLMConfig):
         """Initialize provider with configuration."""
         self.config = config
@@ -116,7 +190,9 @@ class LLMProvider(ABC):
         text: str,
         extraction_type: str,
         schema: Optional[Dict[str, Any]] = None,
-        examples: Optional[List[Dict[str, Any]]] = None
+        examples: Optional[List[Dict[str, Any]]] = None,
+        *,
+        on_text: Optional[TextCallback] = None
     ) -> LLMResponse:
         """
         Extract structured data from text.
@@ -126,6 +202,9 @@ class LLMProvider(ABC):
             extraction_type: Type of extraction (e.g., 'contact_info', 'experience')
             schema: Optional JSON schema for the expected output
             examples: Optional few-shot examples
+            on_text: Optional callable receiving each text delta of this
+                request and its attempt number as the reply streams in
+                (ignored by providers that do not stream)
             
         Returns:
             LLMResponse with extracted data
@@ -137,7 +216,10 @@ class LLMProvider(ABC):
         self,
         text: str,
         initial_extraction: Dict[str, Any],
-        extraction_type: str
+        extraction_type: str,
+        *,
+        is_complete: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        on_text: Optional[TextCallback] = None
     ) -> LLMResponse:
         """
         Enhance an existing extraction with LLM capabilities.
@@ -146,29 +228,64 @@ class LLMProvider(ABC):
             text: Original text
             initial_extraction: Initial extraction from regex parser
             extraction_type: Type of extraction
+            is_complete: Optional predicate; when it returns True for
+                ``initial_extraction``, the extraction is returned as-is
+                without a request
+            on_text: Optional callable receiving each text delta of this
+                request and its attempt number as the reply streams in
             
         Returns:
             LLMResponse with enhanced data
         """
         pass
     
+    def _request_params(self) -> Dict[str, Any]:
+        """Extra parameters to forward with each API request."""
+        return {key: value for key, value in self.config.extra_params.items()
+                if key not in CLIENT_SIDE_PARAMS}
+    
     async def batch_extract(
         self,
         texts: List[str],
         extraction_type: str,
-        schema: Optional[Dict[str, Any]] = None
+        schema: Optional[Dict[str, Any]] = None,
+        examples: Optional[List[Dict[str, Any]]] = None,
+        *,
+        concurrency: Optional[int] = None,
+        on_text: Optional[Callable[[int, str, int], None]] = None
     ) -> List[LLMResponse]:
         """
         Batch extraction for multiple texts.
         
-        Default implementation processes sequentially.
-        Providers can override for parallel processing.
+        Requests run concurrently over the provider's shared client, so
+        network latency overlaps across the batch.
+        
+        Args:
+            texts: Input texts to parse
+            extraction_type: Type of extraction (e.g., 'contact_info', 'experience')
+            schema: Optional JSON schema for the expected output
+            examples: Optional few-shot examples
+            concurrency: Maximum requests in flight (defaults to the
+                ``max_concurrency`` extra parameter, or 8)
+            on_text: Optional callable receiving the index of the text in
+                ``texts``, each streamed text delta and its attempt number,
+                so interleaved deltas of concurrent requests can be told apart
+            
+        Returns:
+            One LLMResponse per text, in the same order as ``texts``
         """
-        results = []
-        for text in texts:
-            result = await self.extract_structured(text, extraction_type, schema)
-            results.append(result)
-        return results
+        if concurrency is None:
+            concurrency = self.config.extra_params.get('max_concurrency', 8)
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _extract_one(index: int, text: str) -> LLMResponse:
+            async with semaphore:
+                return await self.extract_structured(
+                    text, extraction_type, schema, examples,
+                    on_text=partial(on_text, index) if on_text is not None else None
+                )
+        
+        return list(await asyncio.gather(*(_extract_one(i, text) for i, text in enumerate(texts))))
     
     def get_capabilities(self) -> Dict[str, Any]:
         """Get provider capabilities."""
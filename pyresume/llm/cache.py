@@ -0,0 +1,135 @@
+"""
+Content-addressed cache for LLM responses.
+"""
+from typing import Optional, Dict, Any
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+from .base import LLMResponse
+
+
+class ResponseCache:
+    """
+    Persistent store of successful LLM responses keyed by request content.
+    
+    Entries are addressed by a hash of everything that determines the
+    response (provider, model, prompts, sampling settings), so a repeated
+    request is answered without any network I/O and a changed prompt can
+    never return a stale entry. Backed by diskcache when it is installed,
+    otherwise by one JSON file per entry.
+    """
+    
+    def __init__(self, directory: str):
+        """
+        Initialize the cache.
+        
+        Args:
+            directory: Directory holding the cache entries (created if missing)
+        """
+        self.directory = os.path.expanduser(directory)
+        if diskcache is not None:
+            self._store = diskcache.Cache(self.directory)
+        else:
+            self._store = None
+            os.makedirs(self.directory, exist_ok=True)
+    
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Build a cache key from request parts.
+        
+        Each part is length-prefixed before hashing, so different splits of
+        the same bytes (e.g. "ab" + "c" and "a" + "bc") never collide.
+        
+        Args:
+            *parts: Strings, or JSON-serializable values, identifying the request
+        
+        Returns:
+            Hex SHA-256 digest
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            if not isinstance(part, str):
+                part = json.dumps(part, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+            data = part.encode("utf-8")
+            digest.update(len(data).to_bytes(8, "big"))
+            digest.update(data)
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[LLMResponse]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Key from ``make_key``
+        
+        Returns:
+            The cached LLMResponse, or None on a miss
+        """
+        if self._store is not None:
+            entry = self._store.get(key)
+        else:
+            try:
+                with open(self._path(key), "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                entry = None
+        
+        if entry is None:
+            return None
+        return LLMResponse(
+            success=True,
+            content=entry.get("content"),
+            structured_data=entry.get("structured_data"),
+            metadata=dict(entry.get("metadata") or {}, cache="hit")
+        )
+    
+    def set(self, key: str, response: LLMResponse):
+        """
+        Store a response; failed responses are not cached.
+        
+        Args:
+            key: Key from ``make_key``
+            response: Response to store
+        """
+        if not response.success:
+            return
+        
+        entry: Dict[str, Any] = {
+            "content": response.content,
+            "structured_data": response.structured_data,
+            "metadata": response.metadata,
+        }
+        if self._store is not None:
+            self._store.set(key, entry)
+            return
+        
+        # Write to a temporary file first so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    
+    async def aget(self, key: str) -> Optional[LLMResponse]:
+        """Like ``get``, but reads in a worker thread so the event loop is not blocked on disk I/O."""
+        return await asyncio.get_running_loop().run_in_executor(None, self.get, key)
+    
+    async def aset(self, key: str, response: LLMResponse):
+        """Like ``set``, but writes in a worker thread so the event loop is not blocked on disk I/O."""
+        await asyncio.get_running_loop().run_in_executor(None, self.set, key, response)
+    
+    def _path(self, key: str) -> str:
+        """File holding the entry for ``key`` in the JSON-directory backend."""
+        return os.path.join(self.directory, key + ".json")
\ No newline at end of file
@@ -1,12 +1,35 @@
 """
 LLM provider implementations.
+
+Providers are imported on first attribute access (PEP 562) so that their
+SDKs are only loaded when a provider is actually used.
 """
 
-from .anthropic_provider import AnthropicProvider
-from .openai_provider import OpenAIProvider
-from .ollama_provider import OllamaProvider
-from .custom_provider import CustomEndpointProvider
-from .regex_provider import RegexFallbackProvider
+import importlib
+
+_LAZY_EXPORTS = {
+    'AnthropicProvider': '.anthropic_provider',
+    'OpenAIProvider': '.openai_provider',
+    'OllamaProvider': '.ollama_provider',
+    'CustomEndpointProvider': '.custom_provider',
+    'RegexFallbackProvider': '.regex_provider',
+}
+
+
+def __getattr__(name):
+    """Import provider classes on first access."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    try:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+    except ImportError as e:
+        raise AttributeError(f"{name} is unavailable: {e}") from e
+    
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'AnthropicProvider',
@@ -1,12 +1,69 @@
 """
 Anthropic Claude API provider implementation.
 """
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Tuple
 import json
 import asyncio
-from ..base import LLMProvider, LLMResponse, LLMConfig
+import logging
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import anthropic
+    import httpx  # installed with anthropic
+except ImportError:
+    anthropic = None
+    httpx = None
+
+from ..base import LLMProvider, LLMResponse, LLMConfig, TextCallback
 from ..prompts import PromptTemplates
 
+EXTRACTION_SYSTEM_PROMPT = (
+    "You are a resume parsing assistant. Extract structured data from resumes "
+    "and return it as valid JSON. Be precise and accurate. "
+    "Only extract information that is explicitly stated in the text."
+)
+
+ENHANCEMENT_SYSTEM_PROMPT = (
+    "You are a resume parsing assistant. Review and enhance the initial extraction "
+    "by filling in missing information and correcting errors. "
+    "Return the enhanced data as valid JSON."
+)
+
+logger = logging.getLogger(__name__)
+
+# Anthropic ignores cache breakpoints on shorter prefixes (2048 for Haiku models)
+MIN_CACHEABLE_TOKENS = 1024
+
+# Connection pool for the shared HTTP clients; the SDK defaults would cap
+# concurrent batch requests well below typical per-key rate limits
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+KEEPALIVE_EXPIRY = 30.0
+
+_TRAILING_SPACE = re.compile(r'[ \t]+$', re.MULTILINE)
+_BLANK_LINES = re.compile(r'\n{3,}')
+
+
+def _canonical_json(obj: Any) -> str:
+    """Serialize to JSON with sorted keys and fixed separators, so equal values give equal bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+        except TypeError:
+            # Non-string keys, integers beyond 64 bits, ...
+            pass
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def _canonicalize(prompt: str) -> str:
+    """Strip trailing whitespace and collapse blank-line runs in a prompt."""
+    return _BLANK_LINES.sub('\n\n', _TRAILING_SPACE.sub('', prompt)).strip()
+
 
 class AnthropicProvider(LLMProvider):
     """Provider for Anthropic's Claude API."""
@@ -26,96 +83,86 @@ class AnthropicProvider(LLMProvider):
         if not self.config.model_name:
             self.config.model_name = "claude-3-sonnet-20240229"
     
+    @staticmethod
+    def _client_options() -> Dict[str, Any]:
+        """Check the SDK is installed and return the httpx pool limits for a client."""
+        if anthropic is None:
+            raise ImportError(
+                "anthropic package is required for AnthropicProvider. "
+                "Install with: pip install anthropic"
+            )
+        return {
+            'limits': httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY
+            )
+        }
+    
     def _get_client(self):
         """Get or create Anthropic client."""
         if self._client is None:
-            try:
-                import anthropic
-                self._client = anthropic.Anthropic(
-                    api_key=self.config.api_key,
-                    base_url=self.config.api_base_url,
-                    timeout=self.config.timeout,
-                    max_retries=self.config.retry_attempts
-                )
-            except ImportError:
-                raise ImportError(
-                    "anthropic package is required for AnthropicProvider. "
-                    "Install with: pip install anthropic"
-                )
+            options = self._client_options()
+            # The SDK's own httpx subclass keeps its defaults (older SDKs lack it)
+            http_client_class = getattr(anthropic, 'DefaultHttpxClient', httpx.Client)
+            self._client = anthropic.Anthropic(
+                api_key=self.config.api_key,
+                base_url=self.config.api_base_url,
+                timeout=self.config.timeout,
+                max_retries=self.config.retry_attempts,
+                http_client=http_client_class(timeout=self.config.timeout, **options)
+            )
         return self._client
     
-    async def _get_async_client(self):
+    def _get_async_client(self):
         """Get or create async Anthropic client."""
         if self._async_client is None:
-            try:
-                import anthropic
-                self._async_client = anthropic.AsyncAnthropic(
-                    api_key=self.config.api_key,
-                    base_url=self.config.api_base_url,
-                    timeout=self.config.timeout,
-                    max_retries=self.config.retry_attempts
-                )
-            except ImportError:
-                raise ImportError(
-                    "anthropic package is required for AnthropicProvider. "
-                    "Install with: pip install anthropic"
-                )
+            options = self._client_options()
+            http_client_class = getattr(anthropic, 'DefaultAsyncHttpxClient', httpx.AsyncClient)
+            self._async_client = anthropic.AsyncAnthropic(
+                api_key=self.config.api_key,
+                base_url=self.config.api_base_url,
+                timeout=self.config.timeout,
+                max_retries=self.config.retry_attempts,
+                http_client=http_client_class(timeout=self.config.timeout, **options)
+            )
         return self._async_client
     
+    def close(self):
+        """Release the sync client's connection pool."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+    
+    async def aclose(self):
+        """Release the connection pools of both clients."""
+        self.close()
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+    
     async def extract_structured(
         self,
         text: str,
         extraction_type: str,
         schema: Optional[Dict[str, Any]] = None,
-        examples: Optional[List[Dict[str, Any]]] = None
+        examples: Optional[List[Dict[str, Any]]] = None,
+        *,
+        on_text: Optional[TextCallback] = None
     ) -> LLMResponse:
-        """Extract structured data using Claude."""
+        """Extract structured data using Claude, streaming deltas to ``on_text``."""
+        if not text or text.isspace():
+            return self._skipped('empty_input')
+        
         try:
-            client = await self._get_async_client()
+            # Schema and examples repeat across calls, so they go in the cached
+            # system prefix; only the resume text is sent as the user message
+            prompt = _canonicalize(PromptTemplates.get_extraction_prompt(
+                extraction_type, text, None, None
+            ))
             
-            # Get prompt template
-            prompt = PromptTemplates.get_extraction_prompt(
-                extraction_type, text, schema, examples
-            )
-            
-            # Prepare messages
-            messages = [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
-            
-            # Add system message for JSON output
-            system_prompt = (
-                "You are a resume parsing assistant. Extract structured data from resumes "
-                "and return it as valid JSON. Be precise and accurate. "
-                "Only extract information that is explicitly stated in the text."
-            )
-            
-            # Make API call
-            response = await client.messages.create(
-                model=self.config.model_name,
-                messages=messages,
-                system=system_prompt,
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens or 4096,
-                **self.config.extra_params
-            )
-            
-            # Extract content
-            content = response.content[0].text if response.content else ""
-            
-            return LLMResponse(
-                success=True,
-                content=content,
-                metadata={
-                    'model': self.config.model_name,
-                    'usage': {
-                        'input_tokens': response.usage.input_tokens,
-                        'output_tokens': response.usage.output_tokens
-                    }
-                }
+            return await self._create_message(
+                self._system_blocks(EXTRACTION_SYSTEM_PROMPT, schema, examples), prompt, on_text
             )
             
         except Exception as e:
@@ -129,59 +176,224 @@ class AnthropicProvider(LLMProvider):
         self,
         text: str,
         initial_extraction: Dict[str, Any],
-        extraction_type: str
+        extraction_type: str,
+        *,
+        is_complete: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        on_text: Optional[TextCallback] = None
     ) -> LLMResponse:
         """Enhance existing extraction with Claude."""
+        if not text or text.isspace():
+            return self._skipped('empty_input')
+        if is_complete is not None and is_complete(initial_extraction):
+            return self._skipped('already_complete', initial_extraction)
+        
         try:
-            client = await self._get_async_client()
-            
             # Get enhancement prompt
-            prompt = PromptTemplates.get_enhancement_prompt(
+            prompt = _canonicalize(PromptTemplates.get_enhancement_prompt(
                 extraction_type, text, initial_extraction
-            )
+            ))
             
-            messages = [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
+            return await self._create_message(
+                self._system_blocks(ENHANCEMENT_SYSTEM_PROMPT), prompt, on_text
+            )
             
-            system_prompt = (
-                "You are a resume parsing assistant. Review and enhance the initial extraction "
-                "by filling in missing information and correcting errors. "
-                "Return the enhanced data as valid JSON."
+        except Exception as e:
+            return LLMResponse(
+                success=False,
+                error=str(e),
+                metadata={'provider': 'anthropic'}
             )
+    
+    @staticmethod
+    def _skipped(reason: str, data: Optional[Dict[str, Any]] = None) -> LLMResponse:
+        """Successful response for a request that did not need to be sent."""
+        data = data if data is not None else {}
+        return LLMResponse(
+            success=True,
+            content=_canonical_json(data),
+            structured_data=data,
+            metadata={'provider': 'anthropic', 'skipped': reason}
+        )
+    
+    async def _create_message(
+        self,
+        system: List[Dict[str, Any]],
+        prompt: str,
+        on_text: Optional[TextCallback] = None
+    ) -> LLMResponse:
+        """
+        Request a JSON reply, answering from the response cache when possible.
+        
+        A reply that does not parse as JSON is sent back to the model with
+        the parse error, up to ``retry_attempts`` requests in total. Only the
+        end of the conversation grows, so the cached system prefix still
+        applies to the corrective requests. Responses are only cached at
+        temperature 0, since sampled outputs are meant to differ.
+        
+        Args:
+            system: System content blocks
+            prompt: User message text
+            on_text: Optional callable receiving each text delta and the
+                attempt it belongs to; a cached reply streams nothing
             
-            response = await client.messages.create(
+        Returns:
+            LLMResponse with the model's last reply and the token usage of
+            every attempt
+        """
+        max_tokens = self.config.max_tokens or 4096
+        params = self._request_params()
+        
+        cache_key = None
+        if self.response_cache is not None and not self.config.temperature:
+            cache_key = self.response_cache.make_key(
+                'anthropic', self.config.model_name, system, prompt, max_tokens, params
+            )
+            cached = await self.response_cache.aget(cache_key)
+            if cached is not None:
+                return cached
+        
+        client = self._get_async_client()
+        messages = [
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+        usage: Dict[str, int] = {}
+        
+        for attempt in range(1, max(1, self.config.retry_attempts) + 1):
+            content, response_usage = await self._stream_message(
+                client,
+                on_text,
+                attempt,
                 model=self.config.model_name,
                 messages=messages,
-                system=system_prompt,
+                system=system,
                 temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens or 4096,
-                **self.config.extra_params
+                max_tokens=max_tokens,
+                **params
             )
+            for key, value in self._usage_metadata(response_usage).items():
+                usage[key] = usage.get(key, 0) + value
             
-            content = response.content[0].text if response.content else ""
-            
-            return LLMResponse(
+            result = LLMResponse(
                 success=True,
                 content=content,
                 metadata={
                     'model': self.config.model_name,
-                    'usage': {
-                        'input_tokens': response.usage.input_tokens,
-                        'output_tokens': response.usage.output_tokens
-                    }
+                    'usage': usage,
+                    'attempts': attempt
                 }
             )
+            if result.get_json() is not None:
+                if cache_key is not None:
+                    await self.response_cache.aset(cache_key, result)
+                return result
             
-        except Exception as e:
-            return LLMResponse(
-                success=False,
-                error=str(e),
-                metadata={'provider': 'anthropic'}
-            )
+            try:
+                json.loads(content)
+                error = "expected a JSON object"
+            except json.JSONDecodeError as e:
+                error = str(e)
+            messages = messages + [
+                {"role": "assistant", "content": content or "(empty)"},
+                {"role": "user", "content": f"Your output had an error: {error}. Return corrected JSON only."}
+            ]
+        
+        return result
+    
+    async def _stream_message(
+        self,
+        client,
+        on_text: Optional[TextCallback],
+        attempt: int,
+        **request
+    ) -> Tuple[str, Any]:
+        """
+        Send a Messages API request as a stream and collect the reply.
+        
+        Args:
+            client: Async Anthropic client
+            on_text: Optional callable receiving each text delta
+            attempt: Attempt number passed to ``on_text`` with each delta
+            **request: messages.stream / messages.create parameters
+            
+        Returns:
+            (reply text, usage) for the completed message
+        """
+        if not hasattr(client.messages, 'stream'):
+            # Older SDKs have no streaming helper
+            response = await client.messages.create(**request)
+            content = response.content[0].text if response.content else ""
+            if on_text is not None and content:
+                on_text(content, attempt)
+            return content, response.usage
+        
+        # Chunks are joined once at the end rather than concatenated as they arrive
+        parts = []
+        append = parts.append
+        async with client.messages.stream(**request) as stream:
+            async for text in stream.text_stream:
+                append(text)
+                if on_text is not None:
+                    on_text(text, attempt)
+            message = await stream.get_final_message()
+        return ''.join(parts), message.usage
+    
+    def _system_blocks(
+        self,
+        instructions: str,
+        schema: Optional[Dict[str, Any]] = None,
+        examples: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Build the system prompt as content blocks with a cache breakpoint.
+        
+        The stable blocks (instructions, canonically serialized schema and
+        examples) come first and end in the breakpoint, so they are
+        byte-identical between calls and Anthropic's prompt cache serves
+        them on repeat requests. A caller-supplied ``system_addendum`` extra
+        parameter follows the breakpoint, where changing it cannot
+        invalidate the cached prefix.
+        
+        Args:
+            instructions: Task instructions
+            schema: Optional JSON schema for the expected output
+            examples: Optional few-shot examples
+            
+        Returns:
+            System content blocks for the Messages API
+        """
+        blocks = [{"type": "text", "text": instructions}]
+        if schema:
+            blocks.append({"type": "text", "text": "Output schema:\n" + _canonical_json(schema)})
+        if examples:
+            blocks.append({"type": "text", "text": "Examples:\n" + _canonical_json(examples)})
+        blocks[-1]["cache_control"] = {"type": "ephemeral"}
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            # Roughly four characters per token
+            prefix_tokens = sum(len(block["text"]) for block in blocks) // 4
+            if prefix_tokens < MIN_CACHEABLE_TOKENS:
+                logger.debug(
+                    f"System prefix of ~{prefix_tokens} tokens is below the "
+                    f"{MIN_CACHEABLE_TOKENS}-token minimum for prompt caching"
+                )
+        
+        addendum = self.config.extra_params.get('system_addendum')
+        if addendum:
+            blocks.append({"type": "text", "text": addendum})
+        return blocks
+    
+    @staticmethod
+    def _usage_metadata(usage) -> Dict[str, int]:
+        """Token usage for LLMResponse metadata, including prompt-cache reads and writes."""
+        return {
+            'input_tokens': usage.input_tokens,
+            'output_tokens': usage.output_tokens,
+            'cache_read_input_tokens': getattr(usage, 'cache_read_input_tokens', None) or 0,
+            'cache_creation_input_tokens': getattr(usage, 'cache_creation_input_tokens', None) or 0
+        }
     
     def get_capabilities(self) -> Dict[str, Any]:
         """Get Anthropic provider capabilities."""
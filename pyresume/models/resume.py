@@ -1,12 +1,45 @@
 """
 Data models for resume information.
 """
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
+from typing import List, Optional, Dict, Any, Callable
 from datetime import date
+import json
+import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+# Drop the per-instance __dict__ where dataclasses support it (Python 3.10+);
+# resumes are created in the thousands during batch parsing
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _dict_converter(cls) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Build a function that returns a model instance's fields as a dict.
+    
+    Regular instances already own that dict, so it is returned directly;
+    slotted instances have none, so their fields are copied into a new one
+    with a single precomputed attrgetter.
+    
+    Args:
+        cls: Dataclass type with at least two fields
+        
+    Returns:
+        Function mapping an instance to a {field name: value} dict
+    """
+    if '__slots__' not in cls.__dict__:
+        return vars
+    names = tuple(f.name for f in fields(cls))
+    getter = attrgetter(*names)
+    return lambda obj: dict(zip(names, getter(obj)))
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ContactInfo:
     """Contact information from resume."""
     name: Optional[str] = None
@@ -18,7 +51,10 @@ class ContactInfo:
     website: Optional[str] = None
 
 
-@dataclass
+_contact_info_dict = _dict_converter(ContactInfo)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Experience:
     """Work experience entry."""
     title: Optional[str] = None
@@ -31,7 +67,10 @@ class Experience:
     location: Optional[str] = None
 
 
-@dataclass
+_experience_dict = _dict_converter(Experience)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Education:
     """Education entry."""
     degree: Optional[str] = None
@@ -43,7 +82,10 @@ class Education:
     location: Optional[str] = None
 
 
-@dataclass
+_education_dict = _dict_converter(Education)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Skill:
     """Skill with optional proficiency level."""
     name: str
@@ -51,7 +93,10 @@ class Skill:
     proficiency: Optional[str] = None  # e.g., "Expert", "Intermediate", "Beginner"
 
 
-@dataclass
+_skill_dict = _dict_converter(Skill)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Project:
     """Project entry."""
     name: Optional[str] = None
@@ -62,7 +107,10 @@ class Project:
     end_date: Optional[date] = None
 
 
-@dataclass
+_project_dict = _dict_converter(Project)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Certification:
     """Certification entry."""
     name: Optional[str] = None
@@ -72,7 +120,10 @@ class Certification:
     credential_id: Optional[str] = None
 
 
-@dataclass
+_certification_dict = _dict_converter(Certification)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Resume:
     """Complete resume data structure."""
     contact_info: ContactInfo = field(default_factory=ContactInfo)
@@ -92,18 +143,33 @@ class Resume:
     def to_dict(self) -> Dict[str, Any]:
         """Convert resume to dictionary format."""
         return {
-            'contact_info': self.contact_info.__dict__,
+            'contact_info': _contact_info_dict(self.contact_info),
             'summary': self.summary,
-            'experience': [exp.__dict__ for exp in self.experience],
-            'education': [edu.__dict__ for edu in self.education],
-            'skills': [skill.__dict__ for skill in self.skills],
-            'projects': [proj.__dict__ for proj in self.projects],
-            'certifications': [cert.__dict__ for cert in self.certifications],
+            'experience': [_experience_dict(exp) for exp in self.experience],
+            'education': [_education_dict(edu) for edu in self.education],
+            'skills': [_skill_dict(skill) for skill in self.skills],
+            'projects': [_project_dict(proj) for proj in self.projects],
+            'certifications': [_certification_dict(cert) for cert in self.certifications],
             'languages': self.languages,
             'confidence_scores': self.confidence_scores,
             'extraction_metadata': self.extraction_metadata
         }
     
+    def to_json(self) -> bytes:
+        """
+        Serialize the resume to UTF-8 JSON with sorted keys.
+        
+        Uses orjson when it is installed; dates are written in ISO format
+        and values JSON cannot represent are converted with str().
+        
+        Returns:
+            JSON document as bytes
+        """
+        data = self.to_dict()
+        if orjson is not None:
+            return orjson.dumps(data, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        return json.dumps(data, default=str, sort_keys=True, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    
     def get_contact_summary(self) -> str:
         """Get a formatted contact summary."""
         parts = []
@@ -120,11 +186,10 @@ class Resume:
         if not self.experience:
             return None
         
-        total_days = 0
-        for exp in self.experience:
-            if exp.start_date:
-                end = exp.end_date if exp.end_date else date.today()
-                days = (end - exp.start_date).days
-                total_days += max(0, days)
+        today = date.today()
+        total_days = sum(
+            max(0, ((exp.end_date or today) - exp.start_date).days)
+            for exp in self.experience if exp.start_date
+        )
         
         return round(total_days / 365.25, 1) if total_days > 0 else None
\ No newline at end of file
@@ -1,15 +1,120 @@
 """
 Main ResumeParser class for parsing resumes from various formats.
 """
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Set
+from functools import lru_cache
 from pathlib import Path
+import io
 import re
 from datetime import date
 
 from .models.resume import Resume, ContactInfo, Experience, Education, Skill, Project, Certification
-from .extractors import pdf, docx, text
 from .utils import DateParser, PhoneParser, ResumePatterns
 
+# Line-level patterns used for every block of every resume, compiled once
+_BULLET_CHARS = ('•', '▪', '▫', '‣', '⁃', '-', '*')  # tested with str.startswith, no regex needed
+_BULLET_RE = re.compile(r'^[•▪▫‣⁃\-\*]\s*')
+_BULLET_TEXT_RE = re.compile(r'^[•▪▫‣⁃\-\*]\s*(.+)')
+_DATE_RANGE_RE = re.compile(r'\d{1,2}/\d{4}|\d{4}\s*[-–]\s*(?:\d{4}|Present|Current)', re.IGNORECASE)
+_DATE_RANGE_START_RE = re.compile(r'\d{1,2}/\d{4}|\d{4}\s*[-–]')
+_YEAR_RE = re.compile(r'\d{4}')
+_DIGIT_RUN_RE = re.compile(r'\d{3,}')
+_STATE_CODE_RE = re.compile(r'\b[A-Z]{2}\b')
+_ALLCAPS_RE = re.compile(r'^[A-Z][A-Z\s\-,]+$')
+_HEADER_LINE_RE = re.compile(r'^[A-Z][A-Z\s]+:?$')
+_TITLE_AT_COMPANY_RE = re.compile(r'^(.+?)\s+(?:at|@)\s+(.+?)(?:\s*[\|\,]\s*(.+))?$', re.IGNORECASE)
+_JOB_TITLE_RE = re.compile(r'^((?:SENIOR|JUNIOR|LEAD|PRINCIPAL|STAFF)?\s*(?:SOFTWARE|BACKEND|FRONTEND|FULLSTACK|FULL STACK|DATA|DEVOPS|PLATFORM|SYSTEMS?)\s*(?:ENGINEER|DEVELOPER|ARCHITECT|ANALYST|SCIENTIST|MANAGER))\s+(.+)$', re.IGNORECASE)
+_TITLE_WORD_RE = re.compile(r'(?i)(engineer|developer|manager|analyst|architect|designer|lead|senior|junior|specialist|consultant|director|coordinator)')
+_MONTH_NAME_TAIL_RE = re.compile(r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}.*', re.IGNORECASE)
+_YEAR_RANGE_TAIL_RE = re.compile(r'\d{4}\s*[-–]\s*(?:\d{4}|Present|Current).*')
+_BLANK_LINE_RE = re.compile(r'\n\s*\n')
+
+# Substrings that rule a line out as a name, found in one pass over the lowercased line
+_NAME_SKIP_RE = re.compile(r'@|\||•|http|www|\.com|\.org|\.net|\.edu')
+
+# Opening verbs that mark an unbulleted line as a responsibility
+_ACTION_VERBS = ('managed', 'developed', 'led', 'created', 'implemented',
+                 'designed', 'built', 'established', 'improved', 'coordinated',
+                 'analyzed', 'increased', 'reduced', 'streamlined', 'optimized',
+                 'collaborated', 'delivered', 'architected', 'launched', 'spearheaded')
+
+
+# Known skills by category, matched as whole words in the lowercased text
+_SKILL_CATEGORIES = {
+    'programming': ['python', 'java', 'javascript', 'c++', 'c#', 'ruby', 'go', 'rust', 'php', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'typescript', 'perl', 'bash', 'shell', 'powershell', 'vba', 'objective-c', 'dart', 'lua', 'groovy', 'haskell', 'erlang', 'clojure', 'f#', 'julia', 'fortran', 'cobol', 'pascal', 'delphi'],
+    'web': ['html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring', 'rails', 'asp.net', 'jquery', 'bootstrap', 'sass', 'less', 'webpack', 'babel', 'gulp', 'grunt', 'next.js', 'nuxt.js', 'gatsby', 'svelte', 'ember', 'backbone', 'meteor', 'laravel', 'symfony', 'codeigniter', 'fastapi', 'graphql', 'rest', 'soap', 'websocket'],
+    'database': ['sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'oracle', 'sqlite', 'cassandra', 'dynamodb', 'elasticsearch', 'neo4j', 'couchdb', 'firebase', 'firestore', 'mariadb', 'db2', 'sybase', 'teradata', 'snowflake', 'redshift', 'bigquery', 'cosmos db', 'memcached', 'influxdb'],
+    'cloud': ['aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform', 'ansible', 'jenkins', 'circleci', 'gitlab', 'github actions', 'travis ci', 'bamboo', 'teamcity', 'puppet', 'chef', 'saltstack', 'vagrant', 'packer', 'consul', 'vault', 'nomad', 'istio', 'helm', 'prometheus', 'grafana', 'datadog', 'new relic', 'cloudformation', 'openstack', 'vmware', 'heroku', 'netlify', 'vercel'],
+    'data': ['pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras', 'spark', 'hadoop', 'tableau', 'powerbi', 'looker', 'qlik', 'sas', 'spss', 'stata', 'jupyter', 'matplotlib', 'seaborn', 'plotly', 'bokeh', 'nltk', 'spacy', 'opencv', 'pillow', 'scrapy', 'beautifulsoup', 'selenium', 'airflow', 'luigi', 'dask', 'ray', 'mlflow', 'kubeflow', 'h2o', 'xgboost', 'lightgbm', 'catboost'],
+    'tools': ['git', 'jira', 'confluence', 'slack', 'trello', 'asana', 'figma', 'sketch', 'photoshop', 'illustrator', 'xd', 'invision', 'zeplin', 'notion', 'monday', 'basecamp', 'clickup', 'linear', 'shortcut', 'pivotal tracker', 'bugzilla', 'mantis', 'redmine', 'youtrack', 'bitbucket', 'subversion', 'mercurial', 'perforce', 'visual studio', 'vscode', 'intellij', 'eclipse', 'atom', 'sublime', 'vim', 'emacs', 'postman', 'insomnia', 'charles', 'fiddler', 'wireshark']
+}
+
+_KNOWN_SKILLS = sorted(
+    {skill for skills in _SKILL_CATEGORIES.values() for skill in skills},
+    key=lambda skill: (-len(skill), skill)
+)
+
+# All known skills as one alternation, longest first, so a single pass over
+# the text replaces a search per skill. The alternation sits in a lookahead,
+# so it is tried at every word boundary without consuming text and overlapping
+# skills are all found ("objective-c#" holds both objective-c and c#).
+_SKILL_KEYWORDS_RE = re.compile(
+    r'(?=\b(' + '|'.join(re.escape(skill) for skill in _KNOWN_SKILLS) + r')\b)'
+)
+
+# Skills that are a whole-word prefix of a longer skill; the lookahead only
+# records the longest skill at each position, so these are searched separately
+_PREFIX_SKILL_RES = tuple(
+    (skill, re.compile(r'\b' + re.escape(skill) + r'\b'))
+    for skill in _KNOWN_SKILLS
+    if any(other != skill and re.match(r'\b' + re.escape(skill) + r'\b', other)
+           for other in _KNOWN_SKILLS)
+)
+
+
+def _find_known_skills(text_lower: str) -> Set[str]:
+    """Return the known skills that occur as whole words in lowercased text."""
+    found = set(_SKILL_KEYWORDS_RE.findall(text_lower))
+    found.update(skill for skill, pattern in _PREFIX_SKILL_RES if pattern.search(text_lower))
+    return found
+
+
+@lru_cache(maxsize=32)
+def _preprocess(text: str) -> Tuple[str, Dict[str, tuple]]:
+    """
+    Merge split lines, normalize whitespace and locate sections.
+    
+    Memoized so that re-parsing the same text, as analysis pipelines and
+    examples often do, skips these full-text regex passes.
+    
+    Args:
+        text: Raw resume text
+        
+    Returns:
+        Tuple of (normalized text, section boundaries); the boundaries
+        dict is shared between calls and must not be modified
+    """
+    text = ResumePatterns.merge_split_lines(text)
+    text = ResumePatterns.normalize_whitespace(text)
+    return text, ResumePatterns.find_section_boundaries(text)
+
+
+def _split_pair(text: str, sep: str) -> Tuple[str, str]:
+    """
+    Split off the first two ``sep``-separated fields, stripped.
+    
+    Same result as ``parts = text.split(sep)`` followed by ``parts[0]`` and
+    ``parts[1]``, without building a list of every field.
+    """
+    head, _, rest = text.partition(sep)
+    return head.strip(), rest.partition(sep)[0].strip()
+
+
+def _count_non_bullet(lines: List[str]) -> int:
+    """Count the non-blank lines that are not bullet points."""
+    return sum(1 for line in map(str.strip, lines)
+               if line and not line.startswith(_BULLET_CHARS))
+
 
 class ResumeParser:
     """
@@ -19,6 +124,9 @@ class ResumeParser:
     """
     
     def __init__(self):
+        # Imported here so that `import pyresume` does not load pdfplumber/python-docx
+        from .extractors import pdf, docx, text
+        
         self.extractors = {
             '.pdf': pdf.PDFExtractor(),
             '.docx': docx.DOCXExtractor(),
@@ -55,6 +163,36 @@ class ResumeParser:
         
         return self._parse_text(text_content)
     
+    def parse_bytes(self, data: bytes, file_type: str) -> Resume:
+        """
+        Parse a resume from in-memory file content.
+        
+        Args:
+            data: Raw file content (bytes or any buffer, e.g. an mmap)
+            file_type: File extension identifying the format, e.g. '.pdf'
+            
+        Returns:
+            Resume object containing extracted data
+            
+        Raises:
+            ValueError: If file format is not supported
+        """
+        extension = file_type.lower()
+        if not extension.startswith('.'):
+            extension = f'.{extension}'
+        
+        if extension not in self.extractors:
+            supported = ', '.join(self.extractors.keys())
+            raise ValueError(f"Unsupported file format: {extension}. Supported: {supported}")
+        
+        extractor = self.extractors[extension]
+        if extension == '.txt':
+            text_content = extractor.decode(data)
+        else:
+            text_content = extractor.extract_text(io.BytesIO(data))
+        
+        return self._parse_text(text_content)
+    
     def parse_text(self, text: str) -> Resume:
         """
         Parse resume from raw text content.
@@ -81,14 +219,9 @@ class ResumeParser:
         resume = Resume(raw_text=text)
         
         try:
-            # First merge split lines to handle PDF extraction issues
-            text = ResumePatterns.merge_split_lines(text)
-            
-            # Then normalize whitespace
-            text = ResumePatterns.normalize_whitespace(text)
-            
-            # Find section boundaries
-            sections = ResumePatterns.find_section_boundaries(text)
+            # Merge split lines from PDF extraction, normalize whitespace
+            # and find section boundaries
+            text, sections = _preprocess(text)
             
             # Extract contact information (usually at the beginning)
             try:
@@ -109,12 +242,13 @@ class ResumeParser:
                 else:
                     # Try to find summary in first part of resume
                     first_part = text[:1000]
+                    first_part_lower = first_part.lower()
                     for keyword in ['summary', 'objective', 'profile']:
-                        if keyword in first_part.lower():
+                        idx = first_part_lower.find(keyword)
+                        if idx != -1:
                             # Extract a few lines after the keyword
-                            idx = first_part.lower().find(keyword)
                             summary_candidate = first_part[idx:idx+500].strip()
-                            summary_lines = summary_candidate.split('\n')[1:4]
+                            summary_lines = summary_candidate.split('\n', 4)[1:4]
                             if summary_lines:
                                 resume.summary = ' '.join(summary_lines).strip()
                                 resume.confidence_scores['summary'] = 0.7
@@ -226,7 +360,7 @@ class ResumeParser:
             resume.extraction_metadata = {
                 'sections_found': list(sections.keys()),
                 'text_length': len(text),
-                'lines_count': len(text.split('\n')),
+                'lines_count': text.count('\n') + 1,
                 'has_email': bool(resume.contact_info.email),
                 'has_phone': bool(resume.contact_info.phone),
                 'has_name': bool(resume.contact_info.name),
@@ -263,8 +397,9 @@ class ResumeParser:
         contact = ContactInfo()
         confidence_scores = []
         
-        # Extract name (usually at the beginning, in first 5 lines)
-        lines = text.split('\n')[:10]
+        # Extract name (usually at the beginning, in first 5 lines); maxsplit
+        # stops splitting once the ten lines needed have been found
+        lines = text.split('\n', 10)[:10]
         name = self._extract_name(lines)
         if name:
             # Clean up name - sometimes it includes extra lines
@@ -299,35 +434,38 @@ class ResumeParser:
         else:
             confidence_scores.append(0.0)
         
+        # Find URLs once and sort them by host for the LinkedIn/GitHub/website checks
+        linkedin_urls = []
+        github_urls = []
+        other_urls = []
+        for url in ResumePatterns.extract_urls(text):
+            url_lower = url.lower()
+            if 'linkedin.com' in url_lower:
+                linkedin_urls.append(url)
+            if 'github.com' in url_lower:
+                github_urls.append(url)
+            elif 'linkedin.com' not in url_lower:
+                other_urls.append(url)
+        
         # Extract LinkedIn
         linkedin_username = ResumePatterns.extract_linkedin_username(text)
         if linkedin_username:
             contact.linkedin = f"https://linkedin.com/in/{linkedin_username}"
             confidence_scores.append(0.95)
-        else:
-            # Look for LinkedIn URL without username extraction
-            if 'linkedin.com' in text.lower():
-                urls = ResumePatterns.extract_urls(text)
-                for url in urls:
-                    if 'linkedin.com' in url.lower():
-                        contact.linkedin = url
-                        confidence_scores.append(0.8)
-                        break
+        elif linkedin_urls:
+            # LinkedIn URL without username extraction
+            contact.linkedin = linkedin_urls[0]
+            confidence_scores.append(0.8)
         
         # Extract GitHub
         github_username = ResumePatterns.extract_github_username(text)
         if github_username:
             contact.github = f"https://github.com/{github_username}"
             confidence_scores.append(0.95)
-        else:
-            # Look for GitHub URL without username extraction
-            if 'github.com' in text.lower():
-                urls = ResumePatterns.extract_urls(text)
-                for url in urls:
-                    if 'github.com' in url.lower():
-                        contact.github = url
-                        confidence_scores.append(0.8)
-                        break
+        elif github_urls:
+            # GitHub URL without username extraction
+            contact.github = github_urls[0]
+            confidence_scores.append(0.8)
         
         # Extract location/address
         locations = ResumePatterns.extract_locations(text[:1000])  # Look in first part
@@ -337,12 +475,9 @@ class ResumeParser:
             confidence_scores.append(0.8)
         
         # Extract website (other than LinkedIn/GitHub)
-        urls = ResumePatterns.extract_urls(text)
-        for url in urls:
-            if 'linkedin.com' not in url.lower() and 'github.com' not in url.lower():
-                contact.website = url
-                confidence_scores.append(0.7)
-                break
+        if other_urls:
+            contact.website = other_urls[0]
+            confidence_scores.append(0.7)
         
         # Calculate overall confidence
         overall_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0.0
@@ -376,12 +511,11 @@ class ResumeParser:
                 continue
             
             # Skip lines that look like headers or contain special characters
-            skip_chars = ['@', '|', '•', 'http', 'www', '.com', '.org', '.net', '.edu']
-            if any(char in line.lower() for char in skip_chars):
+            if _NAME_SKIP_RE.search(line.lower()):
                 continue
             
             # Skip lines with phone patterns
-            if re.search(r'\d{3,}', line):
+            if _DIGIT_RUN_RE.search(line):
                 continue
             
             # Skip lines that are too short or too long
@@ -461,16 +595,19 @@ class ResumeParser:
         title_found = False
         company_found = False
         
+        # The first line is tested by several patterns below; strip it once
+        # and remember the job-title check once it has been run
+        first_line = lines[0].strip()
+        first_is_title = None
+        
         # CRITICAL FIX: Skip blocks that start with a bullet point
         # Lever never treats bullet points as company names
-        if lines[0].strip() and re.match(r'^[•▪▫‣⁃\-\*]\s*', lines[0].strip()):
+        if first_line.startswith(_BULLET_CHARS):
             return None
         
         # Lever prefers specific patterns - check first 3 lines for title/company/dates
         # Pattern 1: First line is title (often ALL CAPS)
-        if lines and lines[0].strip():
-            first_line = lines[0].strip()
-            
+        if first_line:
             # Don't parse section headers as experience
             if ResumePatterns.is_section_header(first_line):
                 return None
@@ -481,8 +618,8 @@ class ResumeParser:
                 # This line has both title and company, handle later
                 pass
             elif (first_line.isupper() or 
-                  ResumePatterns.is_likely_job_title(first_line) or
-                  re.match(r'^[A-Z][A-Z\s\-,]+$', first_line)):  # All caps with some punctuation
+                  (first_is_title := ResumePatterns.is_likely_job_title(first_line)) or
+                  _ALLCAPS_RE.match(first_line)):  # All caps with some punctuation
                 # Store the whole line as title for now, we'll split it later if needed
                 exp.title = first_line
                 title_found = True
@@ -493,34 +630,32 @@ class ResumeParser:
             second_line = lines[1].strip()
             
             # CRITICAL FIX: Skip if this line is a bullet point
-            if re.match(r'^[•▪▫‣⁃\-\*]\s*', second_line):
+            if second_line.startswith(_BULLET_CHARS):
                 # This is not a valid experience block
                 return None
             
+            # Every date pattern contains a four-digit year, so one cheap scan
+            # decides whether the date checks below need to run at all
+            has_year = _YEAR_RE.search(second_line) is not None
+            
             # CRITICAL FIX: Don't treat date patterns as company names
-            if re.search(r'\d{1,2}/\d{4}|\d{4}\s*[-–]\s*(?:\d{4}|Present|Current)', second_line, re.IGNORECASE):
+            if has_year and _DATE_RANGE_RE.search(second_line):
                 # This is a date line, not a company line
                 pass
             # Look for separator patterns
             elif ' | ' in second_line:
-                parts = second_line.split(' | ')
-                if len(parts) >= 2:
-                    exp.company = parts[0].strip()
-                    exp.location = parts[1].strip()
-                    company_found = True
-                    used_lines.add(1)
-            elif ' - ' in second_line and not re.search(r'\d{4}', second_line):  # Not a date
-                parts = second_line.split(' - ')
-                if len(parts) >= 2:
-                    exp.company = parts[0].strip()
-                    exp.location = parts[1].strip()
-                    company_found = True
-                    used_lines.add(1)
+                exp.company, exp.location = _split_pair(second_line, ' | ')
+                company_found = True
+                used_lines.add(1)
+            elif ' - ' in second_line and not has_year:  # Not a date
+                exp.company, exp.location = _split_pair(second_line, ' - ')
+                company_found = True
+                used_lines.add(1)
             elif ', ' in second_line:
-                # Could be Company, Location
-                parts = second_line.split(', ')
-                if len(parts) == 2 and re.search(r'\b[A-Z]{2}\b', parts[1]):
-                    exp.company = parts[0].strip()
+                # Could be Company, Location (exactly one comma separator)
+                company, _, location = second_line.partition(', ')
+                if ', ' not in location and _STATE_CODE_RE.search(location):
+                    exp.company = company.strip()
                     exp.location = second_line
                     company_found = True
                     used_lines.add(1)
@@ -529,9 +664,8 @@ class ResumeParser:
                     company_found = True
                     used_lines.add(1)
             else:
-                # Just company name - but ensure it's not a bullet point or date
-                if (not re.match(r'^[•▪▫‣⁃\-\*]\s*', second_line) and
-                    not re.search(r'\d{1,2}/\d{4}|\d{4}', second_line)):
+                # Just company name - but ensure it's not a date (bullets returned above)
+                if not has_year:
                     exp.company = second_line
                     company_found = True
                     used_lines.add(1)
@@ -541,8 +675,8 @@ class ResumeParser:
         if len(lines) > date_line_idx and date_line_idx not in used_lines:
             date_line = lines[date_line_idx].strip()
             
-            # Lever prefers MM/YYYY format
-            if re.search(r'\d{1,2}/\d{4}', date_line) or re.search(r'\d{4}', date_line):
+            # Lever prefers MM/YYYY format; any MM/YYYY or YYYY date has a year
+            if _YEAR_RE.search(date_line):
                 start_date, end_date = DateParser.extract_date_range(date_line)
                 if start_date:
                     exp.start_date = start_date
@@ -555,28 +689,27 @@ class ResumeParser:
         # If we didn't get title/company from the structured format, try other patterns
         if not exp.title or not exp.company:
             # First check if first line has both title and company
-            if lines and 0 not in used_lines:
-                first_line = lines[0].strip()
-                
+            if 0 not in used_lines:
                 # Pattern: Title at Company
-                match = re.match(r'^(.+?)\s+(?:at|@)\s+(.+?)(?:\s*[\|\,]\s*(.+))?$', first_line, re.IGNORECASE)
+                match = _TITLE_AT_COMPANY_RE.match(first_line)
                 if match:
                     exp.title = match.group(1).strip()
                     exp.company = match.group(2).strip()
                     if match.group(3):
                         location_part = match.group(3).strip()
-                        if re.search(r'\b[A-Z]{2}\b', location_part):
+                        if _STATE_CODE_RE.search(location_part):
                             exp.location = location_part
                     title_found = company_found = True
                     used_lines.add(0)
         
             # Handle first line that might have both title and company info
-            if lines and 0 not in used_lines:
-                first_line = lines[0].strip()
+            if 0 not in used_lines:
+                if first_is_title is None:
+                    first_is_title = ResumePatterns.is_likely_job_title(first_line)
                 
                 # Check if first line contains BOTH title keywords AND company info
                 # This is a parsing error - we need to use next line for company
-                if (ResumePatterns.is_likely_job_title(first_line) and 
+                if (first_is_title and 
                     (' | ' in first_line or ResumePatterns.is_likely_company(first_line))):
                     
                     # Extract just the title part
@@ -609,16 +742,14 @@ class ResumeParser:
             # "SOFTWARE ENGINEER StartupCo"
             
             # Strategy 1: Look for known job title pattern followed by capitalized words
-            job_title_match = re.match(r'^((?:SENIOR|JUNIOR|LEAD|PRINCIPAL|STAFF)?\s*(?:SOFTWARE|BACKEND|FRONTEND|FULLSTACK|FULL STACK|DATA|DEVOPS|PLATFORM|SYSTEMS?)\s*(?:ENGINEER|DEVELOPER|ARCHITECT|ANALYST|SCIENTIST|MANAGER))\s+(.+)$', title_text, re.IGNORECASE)
+            job_title_match = _JOB_TITLE_RE.match(title_text)
             if job_title_match:
                 exp.title = job_title_match.group(1).strip()
                 company_info = job_title_match.group(2).strip()
                 
                 # Check if company info has location
                 if ' | ' in company_info:
-                    parts = company_info.split(' | ')
-                    exp.company = parts[0].strip()
-                    exp.location = parts[1].strip()
+                    exp.company, exp.location = _split_pair(company_info, ' | ')
                 else:
                     exp.company = company_info
                 
@@ -630,7 +761,7 @@ class ResumeParser:
                 # Find the last job-title-related word
                 last_title_idx = -1
                 for i, word in enumerate(words):
-                    if re.match(r'(?i)(engineer|developer|manager|analyst|architect|designer|lead|senior|junior|specialist|consultant|director|coordinator)', word):
+                    if _TITLE_WORD_RE.match(word):
                         last_title_idx = i
                 
                 if last_title_idx >= 0 and last_title_idx < len(words) - 1:
@@ -641,9 +772,7 @@ class ResumeParser:
                     if company_part:
                         # Check if company part has location info
                         if ' | ' in company_part:
-                            parts = company_part.split(' | ')
-                            exp.company = parts[0].strip()
-                            exp.location = parts[1].strip()
+                            exp.company, exp.location = _split_pair(company_part, ' | ')
                         else:
                             exp.company = company_part
                         
@@ -655,15 +784,12 @@ class ResumeParser:
             
             # Make sure it's not a bullet or date line
             if (second_line and
-                not re.match(r'^[•▪▫‣⁃\-\*]\s*', second_line) and
-                not re.search(r'\d{1,2}/\d{4}|\d{4}\s*[-–]', second_line)):
+                not second_line.startswith(_BULLET_CHARS) and
+                not _DATE_RANGE_START_RE.search(second_line)):
                 
                 # This could be the company line
                 if ' | ' in second_line:
-                    parts = second_line.split(' | ')
-                    exp.company = parts[0].strip()
-                    if len(parts) > 1:
-                        exp.location = parts[1].strip()
+                    exp.company, exp.location = _split_pair(second_line, ' | ')
                 else:
                     exp.company = second_line
                 
@@ -691,8 +817,8 @@ class ResumeParser:
                 # Also check if location is in the same line as dates
                 if not exp.location and exp.start_date and i < len(lines):
                     # Remove date part and check for location
-                    line_without_date = re.sub(r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}.*', '', line, flags=re.IGNORECASE)
-                    line_without_date = re.sub(r'\d{4}\s*[-–]\s*(?:\d{4}|Present|Current).*', '', line_without_date)
+                    line_without_date = _MONTH_NAME_TAIL_RE.sub('', line)
+                    line_without_date = _YEAR_RANGE_TAIL_RE.sub('', line_without_date)
                     
                     for loc_pattern in ResumePatterns.LOCATION_PATTERNS:
                         match = loc_pattern.search(line_without_date)
@@ -719,20 +845,16 @@ class ResumeParser:
                 continue
             
             # Skip lines that look like headers
-            if re.match(r'^[A-Z][A-Z\s]+:?$', line) and len(line) < 30:
+            if _HEADER_LINE_RE.match(line) and len(line) < 30:
                 continue
             
             # Lines starting with bullets are responsibilities
-            bullet_match = re.match(r'^[•▪▫‣⁃\-\*]\s*(.+)', line)
+            bullet_match = _BULLET_TEXT_RE.match(line)
             if bullet_match:
                 resp_lines.append(bullet_match.group(1))
             else:
                 # Check if line starts with action verb (common in responsibilities)
-                action_verbs = ['managed', 'developed', 'led', 'created', 'implemented',
-                               'designed', 'built', 'established', 'improved', 'coordinated',
-                               'analyzed', 'increased', 'reduced', 'streamlined', 'optimized',
-                               'collaborated', 'delivered', 'architected', 'launched', 'spearheaded']
-                if any(line.lower().startswith(verb) for verb in action_verbs):
+                if line.lower().startswith(_ACTION_VERBS):
                     resp_lines.append(line)
                 else:
                     # Other lines are description
@@ -976,7 +1098,8 @@ class ResumeParser:
                 if len(line.split()) >= 2 and not re.search(r'\d{4}', line):
                     # Exclude common non-institution words
                     exclude = ['expected', 'graduation', 'gpa', 'major', 'minor', 'concentration']
-                    if not any(word in line.lower() for word in exclude):
+                    line_lower = line.lower()
+                    if not any(word in line_lower for word in exclude):
                         edu.institution = line.strip()
                         used_lines.add(i)
                         break
@@ -1089,28 +1212,18 @@ class ResumeParser:
         skills = []
         skill_names = set()
         
-        # Common skill categories
-        categories = {
-            'programming': ['python', 'java', 'javascript', 'c++', 'c#', 'ruby', 'go', 'rust', 'php', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'typescript', 'perl', 'bash', 'shell', 'powershell', 'vba', 'objective-c', 'dart', 'lua', 'groovy', 'haskell', 'erlang', 'clojure', 'f#', 'julia', 'fortran', 'cobol', 'pascal', 'delphi'],
-            'web': ['html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring', 'rails', 'asp.net', 'jquery', 'bootstrap', 'sass', 'less', 'webpack', 'babel', 'gulp', 'grunt', 'next.js', 'nuxt.js', 'gatsby', 'svelte', 'ember', 'backbone', 'meteor', 'laravel', 'symfony', 'codeigniter', 'fastapi', 'graphql', 'rest', 'soap', 'websocket'],
-            'database': ['sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'oracle', 'sqlite', 'cassandra', 'dynamodb', 'elasticsearch', 'neo4j', 'couchdb', 'firebase', 'firestore', 'mariadb', 'db2', 'sybase', 'teradata', 'snowflake', 'redshift', 'bigquery', 'cosmos db', 'memcached', 'influxdb'],
-            'cloud': ['aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform', 'ansible', 'jenkins', 'circleci', 'gitlab', 'github actions', 'travis ci', 'bamboo', 'teamcity', 'puppet', 'chef', 'saltstack', 'vagrant', 'packer', 'consul', 'vault', 'nomad', 'istio', 'helm', 'prometheus', 'grafana', 'datadog', 'new relic', 'cloudformation', 'openstack', 'vmware', 'heroku', 'netlify', 'vercel'],
-            'data': ['pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras', 'spark', 'hadoop', 'tableau', 'powerbi', 'looker', 'qlik', 'sas', 'spss', 'stata', 'jupyter', 'matplotlib', 'seaborn', 'plotly', 'bokeh', 'nltk', 'spacy', 'opencv', 'pillow', 'scrapy', 'beautifulsoup', 'selenium', 'airflow', 'luigi', 'dask', 'ray', 'mlflow', 'kubeflow', 'h2o', 'xgboost', 'lightgbm', 'catboost'],
-            'tools': ['git', 'jira', 'confluence', 'slack', 'trello', 'asana', 'figma', 'sketch', 'photoshop', 'illustrator', 'xd', 'invision', 'zeplin', 'notion', 'monday', 'basecamp', 'clickup', 'linear', 'shortcut', 'pivotal tracker', 'bugzilla', 'mantis', 'redmine', 'youtrack', 'bitbucket', 'subversion', 'mercurial', 'perforce', 'visual studio', 'vscode', 'intellij', 'eclipse', 'atom', 'sublime', 'vim', 'emacs', 'postman', 'insomnia', 'charles', 'fiddler', 'wireshark']
-        }
+        categories = _SKILL_CATEGORIES
         
         # Convert text to lowercase for matching
         text_lower = text.lower()
         
         # Extract skills by category
+        found = _find_known_skills(text_lower)
         for category, skill_list in categories.items():
             for skill in skill_list:
-                # Use word boundaries for accurate matching
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, text_lower):
-                    if skill not in skill_names:
-                        skills.append(Skill(name=skill.title(), category=category))
-                        skill_names.add(skill)
+                if skill in found and skill not in skill_names:
+                    skills.append(Skill(name=skill.title(), category=category))
+                    skill_names.add(skill)
         
         # Extract skills from bullet points or comma-separated lists
         skill_patterns = [
@@ -1135,14 +1248,14 @@ class ResumeParser:
                     ps = ps.rstrip('.')  # Remove trailing period
                     
                     # Validate skill
+                    skill_lower = ps.lower()
                     if (ps and 
                         2 <= len(ps) <= 40 and 
-                        ps.lower() not in skill_names and
-                        not ps.lower().startswith(('with', 'using', 'including', 'such as', 'like', 'for'))):
+                        skill_lower not in skill_names and
+                        not skill_lower.startswith(('with', 'using', 'including', 'such as', 'like', 'for'))):
                         
                         # Try to categorize the skill
                         skill_category = None
-                        skill_lower = ps.lower()
                         
                         for category, skill_list in categories.items():
                             if any(s in skill_lower for s in skill_list):
@@ -1150,7 +1263,7 @@ class ResumeParser:
                                 break
                         
                         skills.append(Skill(name=ps, category=skill_category))
-                        skill_names.add(ps.lower())
+                        skill_names.add(skill_lower)
         
         # Calculate confidence based on number of skills found
         confidence = min(0.95, len(skills) * 0.05) if skills else 0.0
@@ -1369,7 +1482,7 @@ class ResumeParser:
         text = ResumePatterns.normalize_whitespace(text)
         
         # Split by double newlines first (major blocks)
-        major_blocks = re.split(r'\n\s*\n', text)
+        major_blocks = _BLANK_LINE_RE.split(text)
         
         final_blocks = []
         for block in major_blocks:
@@ -1389,7 +1502,7 @@ class ResumeParser:
                 
                 if current_block:  # Only check if we already have content
                     # Skip if line is a bullet point
-                    if re.match(r'^[•▪▫‣⁃\-\*]\s*', line_stripped):
+                    if line_stripped.startswith(_BULLET_CHARS):
                         current_block.append(line)
                         continue
                     
@@ -1399,25 +1512,22 @@ class ResumeParser:
                         if not ResumePatterns.is_section_header(line_stripped):
                             # Check if previous block has meaningful content
                             # Need at least 2 non-bullet lines
-                            non_bullet_count = sum(1 for l in current_block 
-                                                 if l.strip() and not re.match(r'^[•▪▫‣⁃\-\*]\s*', l.strip()))
+                            non_bullet_count = _count_non_bullet(current_block)
                             if non_bullet_count >= 2:  # Title + company at minimum
                                 is_new_entry = True
                     
                     # Lever pattern 2: Degree pattern in education
                     elif ResumePatterns.is_likely_degree(line_stripped):
                         # Check if we're in education section and have content
-                        non_bullet_count = sum(1 for l in current_block 
-                                             if l.strip() and not re.match(r'^[•▪▫‣⁃\-\*]\s*', l.strip()))
+                        non_bullet_count = _count_non_bullet(current_block)
                         if non_bullet_count >= 2:
                             is_new_entry = True
                     
                     # Lever pattern 3: Clear job title pattern after content
                     elif (ResumePatterns.is_likely_job_title(line_stripped) and 
-                          not re.search(r'\d{1,2}/\d{4}|\d{4}', line_stripped)):  # Not a date line
+                          not _YEAR_RE.search(line_stripped)):  # Not a date line
                         # Need substantial previous content
-                        non_bullet_count = sum(1 for l in current_block 
-                                             if l.strip() and not re.match(r'^[•▪▫‣⁃\-\*]\s*', l.strip()))
+                        non_bullet_count = _count_non_bullet(current_block)
                         if non_bullet_count >= 3:  # Title, company, dates at minimum
                             is_new_entry = True
                 
@@ -1456,7 +1566,7 @@ class ResumeParser:
                         continue
             
             # Remove bullet points
-            line = re.sub(r'^[•▪▫‣⁃\-\*]\s*', '', line)
+            line = _BULLET_RE.sub('', line)
             
             if line:
                 cleaned_lines.append(line)
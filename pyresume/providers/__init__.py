@@ -2,9 +2,72 @@
 LLM Provider abstraction for intelligent resume parsing.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 from dataclasses import dataclass
 import json
+import time
+
+
+# JSON layout requested from providers for each parsed resume
+RESUME_JSON_SCHEMA = """{
+    "name": "Full name of the candidate",
+    "email": "Email address",
+    "phone": "Phone number",
+    "location": "City, State/Country",
+    "linkedin": "LinkedIn URL if present",
+    "github": "GitHub URL if present", 
+    "website": "Personal website if present",
+    "summary": "Professional summary or objective",
+    "experience": [
+        {
+            "title": "Job title",
+            "company": "Company name",
+            "location": "Job location",
+            "start_date": "Start date (any format)",
+            "end_date": "End date or 'Present'",
+            "description": "Job description",
+            "responsibilities": ["List of key responsibilities or achievements"]
+        }
+    ],
+    "education": [
+        {
+            "degree": "Degree type (e.g., BS, MS, PhD)",
+            "field": "Field of study/Major",
+            "institution": "School/University name",
+            "location": "School location",
+            "graduation_date": "Graduation date or expected date",
+            "gpa": "GPA if mentioned",
+            "honors": "Any honors or distinctions"
+        }
+    ],
+    "skills": ["List of technical and soft skills"],
+    "certifications": [
+        {
+            "name": "Certification name",
+            "issuer": "Issuing organization",
+            "date": "Date obtained",
+            "expiry": "Expiry date if applicable"
+        }
+    ],
+    "projects": [
+        {
+            "name": "Project name",
+            "description": "Project description",
+            "technologies": ["Technologies used"],
+            "date": "Project date or duration",
+            "url": "Project URL if available"
+        }
+    ]
+}"""
+
+# Extraction rules appended to every parsing prompt
+EXTRACTION_GUIDELINES = """Important:
+- Extract the actual name of the person, not section headers
+- For dates, preserve the original format
+- If information is not found, use null
+- For skills, include both technical skills and tools
+- Extract ALL work experiences and education entries
+"""
 
 
 @dataclass
@@ -36,11 +99,76 @@ class ParsedResume:
         self.skills = self.skills or []
         self.certifications = self.certifications or []
         self.projects = self.projects or []
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], raw_response: Optional[str] = None,
+                  confidence: float = 0.0) -> "ParsedResume":
+        """Build a ParsedResume from a JSON object following RESUME_JSON_SCHEMA."""
+        return cls(
+            name=data.get("name"),
+            email=data.get("email"),
+            phone=data.get("phone"),
+            location=data.get("location"),
+            linkedin=data.get("linkedin"),
+            github=data.get("github"),
+            website=data.get("website"),
+            summary=data.get("summary"),
+            experience=data.get("experience", []),
+            education=data.get("education", []),
+            skills=data.get("skills", []),
+            certifications=data.get("certifications", []),
+            projects=data.get("projects", []),
+            raw_response=raw_response,
+            confidence=confidence
+        )
+
+
+def _poll_with_backoff(
+    fetch: Callable[[], Any],
+    is_done: Callable[[Any], bool],
+    initial_delay: float = 10.0,
+    max_delay: float = 300.0,
+    timeout: Optional[float] = None
+) -> Any:
+    """
+    Call ``fetch`` until ``is_done`` accepts its result, backing off exponentially.
+    
+    Args:
+        fetch: Callable returning the current state (e.g. a batch status)
+        is_done: Predicate deciding whether the state is final
+        initial_delay: Seconds to wait after the first unfinished poll
+        max_delay: Upper bound on the wait between polls
+        timeout: Give up after this many seconds (None waits indefinitely)
+        
+    Returns:
+        The first result accepted by ``is_done``
+    """
+    delay = initial_delay
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        result = fetch()
+        if is_done(result):
+            return result
+        if deadline is not None and time.monotonic() + delay > deadline:
+            raise TimeoutError("Timed out waiting for batch to complete")
+        time.sleep(delay)
+        delay = min(delay * 2, max_delay)
 
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
     
+    # Optional TokenBucket applied to every request the provider sends
+    rate_limiter = None
+    
+    # Output tokens reserved for a resume parsed on its own, the smallest
+    # share of a request each resume gets when several are packed together,
+    # and the most one request may ask for (the model's output limit); None
+    # where the provider has no cap
+    max_tokens: Optional[int] = None
+    packed_tokens_per_resume: Optional[int] = None
+    max_output_tokens_per_call: Optional[int] = None
+    
     @abstractmethod
     def parse_resume(self, text: str, job_description: Optional[str] = None) -> ParsedResume:
         """
@@ -60,6 +188,120 @@ class LLMProvider(ABC):
         """Check if the provider is available and configured."""
         pass
     
+    def parse_batch(
+        self,
+        texts: List[str],
+        job_description: Optional[str] = None
+    ) -> List[Optional[ParsedResume]]:
+        """
+        Parse several resumes.
+        
+        Providers with a native batch API override this to submit every text
+        as one asynchronous job; by default each text is parsed in turn.
+        
+        Args:
+            texts: Raw resume texts
+            job_description: Optional job description for better context
+            
+        Returns:
+            One ParsedResume per input text, or None where parsing failed
+        """
+        return self._parse_each(texts, job_description)
+    
+    def parse_resumes(
+        self,
+        texts: List[str],
+        job_description: Optional[str] = None
+    ) -> List[Optional[ParsedResume]]:
+        """
+        Parse several resumes in a single request.
+        
+        Providers override this to send one prompt built by
+        ``get_multi_prompt``, trading requests-per-minute for tokens per
+        request; by default each text is parsed in turn.
+        
+        Args:
+            texts: Raw resume texts
+            job_description: Optional job description for better context
+            
+        Returns:
+            One ParsedResume per input text, or None where parsing failed
+        """
+        return self._parse_each(texts, job_description)
+    
+    def max_resumes_per_call(self) -> Optional[int]:
+        """
+        Most resumes whose output fits in one ``parse_resumes`` request.
+        
+        Packed resumes share ``max_output_tokens_per_call`` and each needs at
+        least ``packed_tokens_per_resume`` of it (``max_tokens`` when unset).
+        
+        Returns:
+            max_output_tokens_per_call // per-resume share (at least 1), or
+            None when the provider has no output limit
+        """
+        per_resume = self.packed_tokens_per_resume or self.max_tokens
+        if not per_resume or not self.max_output_tokens_per_call:
+            return None
+        return max(1, self.max_output_tokens_per_call // per_resume)
+    
+    def _output_budget(self, count: int = 1) -> int:
+        """
+        Output tokens to request for ``count`` resumes.
+        
+        A single resume gets ``max_tokens``; a packed request gets the
+        per-resume share times ``count``, at least ``max_tokens`` so packing
+        never shrinks the budget below a single call. Both are capped at
+        ``max_output_tokens_per_call``.
+        """
+        budget = self.max_tokens or 0
+        if count > 1:
+            per_resume = self.packed_tokens_per_resume or budget
+            budget = max(budget, per_resume * count)
+        if self.max_output_tokens_per_call:
+            budget = min(budget, self.max_output_tokens_per_call)
+        return budget
+    
+    def _throttle(self, prompt: str, max_tokens: int = 0):
+        """Wait for the rate limiter, estimating about four characters per prompt token."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(len(prompt) // 4 + max_tokens)
+    
+    def _parse_each(
+        self,
+        texts: List[str],
+        job_description: Optional[str] = None
+    ) -> List[Optional[ParsedResume]]:
+        """Parse texts one request at a time, recording None for failures."""
+        results = []
+        for text in texts:
+            try:
+                results.append(self.parse_resume(text, job_description))
+            except Exception:
+                results.append(None)
+        return results
+    
+    def _split_multi_response(
+        self,
+        data: Any,
+        count: int,
+        raw_response: str,
+        confidence: float
+    ) -> List[Optional[ParsedResume]]:
+        """Map a {"resumes": [...]} response back onto ``count`` inputs."""
+        entries = data.get("resumes") if isinstance(data, dict) else data
+        if not isinstance(entries, list):
+            return [None] * count
+        
+        results = []
+        for i in range(count):
+            entry = entries[i] if i < len(entries) else None
+            results.append(
+                ParsedResume.from_dict(entry, raw_response, confidence)
+                if isinstance(entry, dict) else None
+            )
+        return results
+    
     def get_prompt(self, text: str, job_description: Optional[str] = None) -> str:
         """
         Generate the prompt for resume parsing.
@@ -79,64 +321,40 @@ Resume Text:
 
 """
         
-        prompt += """Please extract and return the following information in JSON format:
-{
-    "name": "Full name of the candidate",
-    "email": "Email address",
-    "phone": "Phone number",
-    "location": "City, State/Country",
-    "linkedin": "LinkedIn URL if present",
-    "github": "GitHub URL if present", 
-    "website": "Personal website if present",
-    "summary": "Professional summary or objective",
-    "experience": [
-        {
-            "title": "Job title",
-            "company": "Company name",
-            "location": "Job location",
-            "start_date": "Start date (any format)",
-            "end_date": "End date or 'Present'",
-            "description": "Job description",
-            "responsibilities": ["List of key responsibilities or achievements"]
-        }
-    ],
-    "education": [
-        {
-            "degree": "Degree type (e.g., BS, MS, PhD)",
-            "field": "Field of study/Major",
-            "institution": "School/University name",
-            "location": "School location",
-            "graduation_date": "Graduation date or expected date",
-            "gpa": "GPA if mentioned",
-            "honors": "Any honors or distinctions"
-        }
-    ],
-    "skills": ["List of technical and soft skills"],
-    "certifications": [
-        {
-            "name": "Certification name",
-            "issuer": "Issuing organization",
-            "date": "Date obtained",
-            "expiry": "Expiry date if applicable"
-        }
-    ],
-    "projects": [
-        {
-            "name": "Project name",
-            "description": "Project description",
-            "technologies": ["Technologies used"],
-            "date": "Project date or duration",
-            "url": "Project URL if available"
-        }
-    ]
-}
+        prompt += f"""Please extract and return the following information in JSON format:
+{RESUME_JSON_SCHEMA}
 
-Important:
-- Extract the actual name of the person, not section headers
-- For dates, preserve the original format
-- If information is not found, use null
-- For skills, include both technical skills and tools
-- Extract ALL work experiences and education entries
+{EXTRACTION_GUIDELINES}"""
+        
+        return prompt
+    
+    def get_multi_prompt(self, texts: List[str], job_description: Optional[str] = None) -> str:
+        """
+        Generate one prompt that asks for several resumes at once.
+        
+        The response is expected to be a JSON object whose "resumes" array
+        holds one entry per input, in order.
+        """
+        prompt = f"""Extract structured information from each of the following {len(texts)} resumes. Be as accurate as possible and extract all relevant information.
+
+"""
+        
+        for i, text in enumerate(texts, 1):
+            prompt += f"""===RESUME {i}===
+{text}
+
+"""
+        
+        if job_description:
+            prompt += f"""Job Description (for context):
+{job_description}
+
+"""
+        
+        prompt += f"""Return a JSON object of the form {{"resumes": [...]}} where element i of "resumes" is the structured resume for RESUME i+1, each in this format:
+{RESUME_JSON_SCHEMA}
+
+{EXTRACTION_GUIDELINES}- Return exactly {len(texts)} entries in "resumes", in the same order as the input
 """
         
         return prompt
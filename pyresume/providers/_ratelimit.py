@@ -0,0 +1,68 @@
+"""
+Client-side rate limiting for LLM provider requests.
+"""
+from typing import Optional
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token-bucket limiter for requests per minute and tokens per minute.
+
+    Both budgets refill continuously. ``acquire`` blocks until the request
+    fits, so callers stay under the provider's limits instead of spending
+    retries on 429 responses. Safe to share between threads.
+    """
+
+    def __init__(self, rpm: Optional[int] = None, tpm: Optional[int] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            rpm: Requests allowed per minute (None for no request limit)
+            tpm: Tokens allowed per minute (None for no token limit)
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm) if rpm else 0.0
+        self._tokens = float(tpm) if tpm else 0.0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 0):
+        """
+        Block until one request using ``tokens`` tokens may be sent.
+
+        Args:
+            tokens: Estimated tokens for the request (prompt + output cap);
+                requests larger than the per-minute budget wait for a full bucket
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                needed_tokens = min(tokens, self.tpm) if self.tpm else 0
+
+                wait = 0.0
+                if self.rpm and self._requests < 1:
+                    wait = (1 - self._requests) * 60.0 / self.rpm
+                if self.tpm and self._tokens < needed_tokens:
+                    wait = max(wait, (needed_tokens - self._tokens) * 60.0 / self.tpm)
+
+                if wait == 0.0:
+                    if self.rpm:
+                        self._requests -= 1
+                    if self.tpm:
+                        self._tokens -= needed_tokens
+                    return
+            time.sleep(wait)
+
+    def _refill(self):
+        """Add the budget accrued since the last update, up to one minute's worth."""
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        if self.rpm:
+            self._requests = min(float(self.rpm), self._requests + elapsed * self.rpm / 60.0)
+        if self.tpm:
+            self._tokens = min(float(self.tpm), self._tokens + elapsed * self.tpm / 60.0)
@@ -3,8 +3,8 @@ Anthropic Claude provider for resume parsing.
 """
 import os
 import json
-from typing import Optional
-from . import LLMProvider, ParsedResume
+from typing import Optional, List, Dict, Any
+from . import LLMProvider, ParsedResume, _poll_with_backoff
 
 try:
     from anthropic import Anthropic
@@ -16,20 +16,43 @@ except ImportError:
 class AnthropicProvider(LLMProvider):
     """Anthropic Claude provider for intelligent resume parsing."""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-sonnet-20240229"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "claude-3-sonnet-20240229",
+        timeout: float = 60.0,
+        max_retries: int = 3,
+        max_tokens: int = 4000,
+        max_output_tokens_per_call: int = 4096,
+        packed_tokens_per_resume: int = 1024
+    ):
         """
         Initialize Anthropic provider.
         
         Args:
             api_key: Anthropic API key. If not provided, will check ANTHROPIC_API_KEY env var
             model: Model to use (default: claude-3-sonnet-20240229)
+            timeout: Per-request timeout in seconds
+            max_retries: Retries on connection errors, 429 and 5xx responses
+                (the SDK backs off exponentially with jitter)
+            max_tokens: Output token cap per resume
+            max_output_tokens_per_call: Output token limit of the model; requests
+                covering several resumes never ask for more (default: 4096)
+            packed_tokens_per_resume: Output tokens each resume needs when
+                several share one request, which sets how many fit in
+                max_output_tokens_per_call (default: 1024, i.e. 4 per request)
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         self.model = model
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_tokens = max_tokens
+        self.max_output_tokens_per_call = max_output_tokens_per_call
+        self.packed_tokens_per_resume = packed_tokens_per_resume
         self.client = None
         
         if HAS_ANTHROPIC and self.api_key:
-            self.client = Anthropic(api_key=self.api_key)
+            self.client = Anthropic(api_key=self.api_key, timeout=timeout, max_retries=max_retries)
     
     def is_available(self) -> bool:
         """Check if Anthropic is available and configured."""
@@ -43,61 +66,138 @@ class AnthropicProvider(LLMProvider):
         prompt = self.get_prompt(text, job_description)
         
         try:
+            self._throttle(prompt, self._output_budget())
+            response = self.client.messages.create(**self._message_params(prompt))
+            return self._parse_response(response.content[0].text)
+        except Exception as e:
+            raise RuntimeError(f"Failed to parse resume with Anthropic: {str(e)}")
+    
+    def parse_resumes(
+        self,
+        texts: List[str],
+        job_description: Optional[str] = None
+    ) -> List[Optional[ParsedResume]]:
+        """
+        Parse several resumes with a single Claude request.
+        
+        The output budget grows with the number of resumes but is capped at
+        ``max_output_tokens_per_call``; see ``max_resumes_per_call`` for the
+        largest group whose output fits.
+        """
+        if not self.is_available():
+            raise RuntimeError("Anthropic provider is not available. Install with: pip install pyresume[anthropic]")
+        
+        prompt = self.get_multi_prompt(texts, job_description)
+        
+        try:
+            max_tokens = self._output_budget(len(texts))
+            self._throttle(prompt, max_tokens)
             response = self.client.messages.create(
-                model=self.model,
-                max_tokens=4000,
-                temperature=0.1,  # Low temperature for consistency
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
+                **self._message_params(prompt, max_tokens=max_tokens)
             )
-            
-            # Extract the JSON response
             response_text = response.content[0].text
+            data = json.loads(self._extract_json_text(response_text))
+        except Exception as e:
+            raise RuntimeError(f"Failed to parse resumes with Anthropic: {str(e)}")
+        
+        return self._split_multi_response(data, len(texts), response_text, 0.95)
+    
+    def parse_batch(
+        self,
+        texts: List[str],
+        job_description: Optional[str] = None
+    ) -> List[Optional[ParsedResume]]:
+        """
+        Parse several resumes through the Message Batches API.
+        
+        Batched requests are billed at a discount and have separate rate
+        limits, but complete asynchronously (within 24 hours), so this call
+        blocks while polling.
+        """
+        if not self.is_available():
+            raise RuntimeError("Anthropic provider is not available. Install with: pip install pyresume[anthropic]")
+        
+        if not hasattr(self.client.messages, "batches"):
+            # Older SDKs have no Message Batches support
+            return super().parse_batch(texts, job_description)
+        
+        try:
+            responses = self.submit_batch([self.get_prompt(text, job_description) for text in texts])
+        except Exception as e:
+            raise RuntimeError(f"Failed to run Anthropic message batch: {str(e)}")
+        
+        results = []
+        for i in range(len(texts)):
+            response_text = responses.get(f"resume-{i}")
+            try:
+                results.append(self._parse_response(response_text) if response_text is not None else None)
+            except Exception:
+                results.append(None)
+        return results
+    
+    def submit_batch(self, prompts: List[str]) -> Dict[str, str]:
+        """
+        Submit prompts as one message batch and wait for it to finish.
+        
+        Args:
+            prompts: Prompts to send; request i gets the custom_id "resume-i"
             
-            # Try to parse JSON from the response
-            # Claude might wrap it in markdown code blocks
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                json_text = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                json_text = response_text[json_start:json_end].strip()
-            else:
-                json_text = response_text
-            
-            # Parse the JSON
-            data = json.loads(json_text)
-            
-            # Create ParsedResume object
-            return ParsedResume(
-                name=data.get("name"),
-                email=data.get("email"),
-                phone=data.get("phone"),
-                location=data.get("location"),
-                linkedin=data.get("linkedin"),
-                github=data.get("github"),
-                website=data.get("website"),
-                summary=data.get("summary"),
-                experience=data.get("experience", []),
-                education=data.get("education", []),
-                skills=data.get("skills", []),
-                certifications=data.get("certifications", []),
-                projects=data.get("projects", []),
-                raw_response=response_text,
-                confidence=0.95  # Claude typically has high accuracy
-            )
-            
-        except json.JSONDecodeError as e:
+        Returns:
+            Mapping of custom_id to response text for requests that succeeded
+        """
+        batches = self.client.messages.batches
+        batch = batches.create(requests=[
+            {"custom_id": f"resume-{i}", "params": self._message_params(prompt)}
+            for i, prompt in enumerate(prompts)
+        ])
+        batch_id = batch.id
+        _poll_with_backoff(
+            lambda: batches.retrieve(batch_id),
+            lambda current: current.processing_status == "ended"
+        )
+        
+        responses = {}
+        for entry in batches.results(batch_id):
+            if entry.result.type == "succeeded" and entry.result.message.content:
+                responses[entry.custom_id] = entry.result.message.content[0].text
+        return responses
+    
+    def _message_params(self, prompt: str, max_tokens: Optional[int] = None) -> Dict[str, Any]:
+        """Build the Messages API request parameters for a prompt."""
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens or self._output_budget(),
+            "temperature": 0.1,  # Low temperature for consistency
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ]
+        }
+    
+    def _parse_response(self, response_text: str) -> ParsedResume:
+        """Build a ParsedResume from Claude's response text."""
+        try:
+            data = json.loads(self._extract_json_text(response_text))
+        except json.JSONDecodeError:
             # If JSON parsing fails, return what we can
             return ParsedResume(
-                raw_response=response_text if 'response_text' in locals() else str(e),
+                raw_response=response_text,
                 confidence=0.0
             )
-        except Exception as e:
-            raise RuntimeError(f"Failed to parse resume with Anthropic: {str(e)}")
\ No newline at end of file
+        
+        # Claude typically has high accuracy
+        return ParsedResume.from_dict(data, raw_response=response_text, confidence=0.95)
+    
+    def _extract_json_text(self, response_text: str) -> str:
+        """Strip the markdown code fence Claude may wrap JSON in."""
+        if "```json" in response_text:
+            json_start = response_text.find("```json") + 7
+            json_end = response_text.find("```", json_start)
+            return response_text[json_start:json_end].strip()
+        elif "```" in response_text:
+            json_start = response_text.find("```") + 3
+            json_end = response_text.find("```", json_start)
+            return response_text[json_start:json_end].strip()
+        return response_text
@@ -67,6 +67,7 @@ class LocalLLMProvider(LLMProvider):
         prompt = self.get_prompt(text, job_description)
         
         try:
+            self._throttle(prompt)
             if self.api_type == "ollama":
                 response = self._call_ollama(prompt)
             elif self.api_type == "openai":
@@ -3,8 +3,8 @@ OpenAI provider for resume parsing.
 """
 import os
 import json
-from typing import Optional
-from . import LLMProvider, ParsedResume
+from typing import Optional, List, Dict, Any
+from . import LLMProvider, ParsedResume, _poll_with_backoff
 
 try:
     from openai import OpenAI
@@ -16,20 +16,43 @@ except ImportError:
 class OpenAIProvider(LLMProvider):
     """OpenAI provider for intelligent resume parsing."""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4-turbo-preview"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gpt-4-turbo-preview",
+        timeout: float = 60.0,
+        max_retries: int = 3,
+        max_tokens: int = 4000,
+        max_output_tokens_per_call: int = 4096,
+        packed_tokens_per_resume: int = 1024
+    ):
         """
         Initialize OpenAI provider.
         
         Args:
             api_key: OpenAI API key. If not provided, will check OPENAI_API_KEY env var
             model: Model to use (default: gpt-4-turbo-preview)
+            timeout: Per-request timeout in seconds
+            max_retries: Retries on connection errors, 429 and 5xx responses
+                (the SDK backs off exponentially with jitter)
+            max_tokens: Output token cap per resume
+            max_output_tokens_per_call: Output token limit of the model; requests
+                covering several resumes never ask for more (default: 4096)
+            packed_tokens_per_resume: Output tokens each resume needs when
+                several share one request, which sets how many fit in
+                max_output_tokens_per_call (default: 1024, i.e. 4 per request)
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.model = model
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_tokens = max_tokens
+        self.max_output_tokens_per_call = max_output_tokens_per_call
+        self.packed_tokens_per_resume = packed_tokens_per_resume
         self.client = None
         
         if HAS_OPENAI and self.api_key:
-            self.client = OpenAI(api_key=self.api_key)
+            self.client = OpenAI(api_key=self.api_key, timeout=timeout, max_retries=max_retries)
     
     def is_available(self) -> bool:
         """Check if OpenAI is available and configured."""
@@ -43,52 +66,142 @@ class OpenAIProvider(LLMProvider):
         prompt = self.get_prompt(text, job_description)
         
         try:
+            self._throttle(prompt, self._output_budget())
+            response = self.client.chat.completions.create(**self._completion_params(prompt))
+            return self._parse_response(response.choices[0].message.content)
+        except Exception as e:
+            raise RuntimeError(f"Failed to parse resume with OpenAI: {str(e)}")
+    
+    def parse_resumes(
+        self,
+        texts: List[str],
+        job_description: Optional[str] = None
+    ) -> List[Optional[ParsedResume]]:
+        """Parse several resumes with a single chat completion in JSON mode."""
+        if not self.is_available():
+            raise RuntimeError("OpenAI provider is not available. Install with: pip install pyresume[openai]")
+        
+        prompt = self.get_multi_prompt(texts, job_description)
+        
+        try:
+            max_tokens = self._output_budget(len(texts))
+            self._throttle(prompt, max_tokens)
             response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a professional resume parser. Extract structured information from resumes accurately."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.1,  # Low temperature for consistency
-                response_format={"type": "json_object"}  # Force JSON response
+                **self._completion_params(prompt, max_tokens=max_tokens)
             )
-            
-            # Extract the JSON response
             response_text = response.choices[0].message.content
-            
-            # Parse the JSON
             data = json.loads(response_text)
+        except Exception as e:
+            raise RuntimeError(f"Failed to parse resumes with OpenAI: {str(e)}")
+        
+        return self._split_multi_response(data, len(texts), response_text, 0.95)
+    
+    def parse_batch(
+        self,
+        texts: List[str],
+        job_description: Optional[str] = None
+    ) -> List[Optional[ParsedResume]]:
+        """
+        Parse several resumes through the Batch API.
+        
+        Batched requests are billed at a discount and have separate rate
+        limits, but complete asynchronously (within 24 hours), so this call
+        blocks while polling.
+        """
+        if not self.is_available():
+            raise RuntimeError("OpenAI provider is not available. Install with: pip install pyresume[openai]")
+        
+        try:
+            responses = self.submit_batch([self.get_prompt(text, job_description) for text in texts])
+        except Exception as e:
+            raise RuntimeError(f"Failed to run OpenAI batch: {str(e)}")
+        
+        results = []
+        for i in range(len(texts)):
+            response_text = responses.get(f"resume-{i}")
+            try:
+                results.append(self._parse_response(response_text) if response_text is not None else None)
+            except Exception:
+                results.append(None)
+        return results
+    
+    def submit_batch(self, prompts: List[str]) -> Dict[str, str]:
+        """
+        Upload prompts as a JSONL batch job and wait for it to finish.
+        
+        Args:
+            prompts: Prompts to send; request i gets the custom_id "resume-i"
             
-            # Create ParsedResume object
-            return ParsedResume(
-                name=data.get("name"),
-                email=data.get("email"),
-                phone=data.get("phone"),
-                location=data.get("location"),
-                linkedin=data.get("linkedin"),
-                github=data.get("github"),
-                website=data.get("website"),
-                summary=data.get("summary"),
-                experience=data.get("experience", []),
-                education=data.get("education", []),
-                skills=data.get("skills", []),
-                certifications=data.get("certifications", []),
-                projects=data.get("projects", []),
-                raw_response=response_text,
-                confidence=0.95  # GPT-4 typically has high accuracy
-            )
-            
-        except json.JSONDecodeError as e:
+        Returns:
+            Mapping of custom_id to response text for requests that succeeded
+        """
+        lines = [
+            json.dumps({
+                "custom_id": f"resume-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._completion_params(prompt)
+            })
+            for i, prompt in enumerate(prompts)
+        ]
+        input_file = self.client.files.create(
+            file=("resume_batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        batch_id = batch.id
+        batch = _poll_with_backoff(
+            lambda: self.client.batches.retrieve(batch_id),
+            lambda current: current.status in ("completed", "failed", "expired", "cancelled")
+        )
+        
+        # Expired or cancelled batches may still have partial output
+        if not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch_id} ended with status '{batch.status}'")
+        
+        responses = {}
+        for line in self.client.files.content(batch.output_file_id).text.splitlines():
+            if not line:
+                continue
+            entry = json.loads(line)
+            response = entry.get("response") or {}
+            if response.get("status_code") == 200:
+                responses[entry["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        return responses
+    
+    def _completion_params(self, prompt: str, max_tokens: Optional[int] = None) -> Dict[str, Any]:
+        """Build the Chat Completions request parameters for a prompt."""
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens or self._output_budget(),
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are a professional resume parser. Extract structured information from resumes accurately."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "temperature": 0.1,  # Low temperature for consistency
+            "response_format": {"type": "json_object"}  # Force JSON response
+        }
+    
+    def _parse_response(self, response_text: str) -> ParsedResume:
+        """Build a ParsedResume from the model's JSON response text."""
+        try:
+            data = json.loads(response_text)
+        except json.JSONDecodeError:
             # If JSON parsing fails, return what we can
             return ParsedResume(
-                raw_response=response_text if 'response_text' in locals() else str(e),
+                raw_response=response_text,
                 confidence=0.0
             )
-        except Exception as e:
-            raise RuntimeError(f"Failed to parse resume with OpenAI: {str(e)}")
\ No newline at end of file
+        
+        # GPT-4 typically has high accuracy
+        return ParsedResume.from_dict(data, raw_response=response_text, confidence=0.95)
@@ -13,19 +13,24 @@ class DateParser:
     # Common date patterns in resumes - ordered by Lever preference
     DATE_PATTERNS = [
         # MM/YYYY format (Lever preferred)
-        r'(\d{1,2})/(\d{4})',
+        re.compile(r'(\d{1,2})/(\d{4})'),
         # MM-YYYY format
-        r'(\d{1,2})-(\d{4})',
+        re.compile(r'(\d{1,2})-(\d{4})'),
         # Month Year formats
-        r'(?i)(jan|january|feb|february|mar|march|apr|april|may|jun|june|jul|july|aug|august|sep|september|oct|october|nov|november|dec|december)\s+(\d{4})',
+        re.compile(r'(?i)(jan|january|feb|february|mar|march|apr|april|may|jun|june|jul|july|aug|august|sep|september|oct|october|nov|november|dec|december)\s+(\d{4})'),
         # YYYY only
-        r'(\d{4})',
+        re.compile(r'(\d{4})'),
         # Quarter formats
-        r'(?i)q([1-4])\s+(\d{4})',
+        re.compile(r'(?i)q([1-4])\s+(\d{4})'),
         # Season formats
-        r'(?i)(spring|summer|fall|autumn|winter)\s+(\d{4})',
+        re.compile(r'(?i)(spring|summer|fall|autumn|winter)\s+(\d{4})'),
     ]
     
+    # MM/YYYY - MM/YYYY range (Lever preferred)
+    MM_YYYY_RANGE = re.compile(
+        r'(\d{1,2}/\d{4})\s*[-–]\s*(\d{1,2}/\d{4}|present|current)', re.IGNORECASE
+    )
+    
     MONTH_MAPPING = {
         'jan': 1, 'january': 1,
         'feb': 2, 'february': 2,
@@ -70,10 +75,10 @@ class DateParser:
         
         # Try custom patterns
         for pattern in DateParser.DATE_PATTERNS:
-            match = re.search(pattern, date_str)
+            match = pattern.search(date_str)
             if match:
                 try:
-                    return DateParser._parse_match(match, pattern)
+                    return DateParser._parse_match(match, pattern.pattern)
                 except (ValueError, TypeError):
                     continue
         
@@ -136,8 +141,7 @@ class DateParser:
             Tuple of (start_date, end_date)
         """
         # First try to find MM/YYYY - MM/YYYY pattern (Lever preferred)
-        mm_yyyy_pattern = r'(\d{1,2}/\d{4})\s*[-–]\s*(\d{1,2}/\d{4}|present|current)'
-        match = re.search(mm_yyyy_pattern, text, re.IGNORECASE)
+        match = DateParser.MM_YYYY_RANGE.search(text)
         if match:
             start_date = DateParser.parse_date(match.group(1))
             end_date = DateParser.parse_date(match.group(2))
@@ -2,7 +2,12 @@
 Common regex patterns and text matching utilities for resume parsing.
 """
 import re
-from typing import List, Dict, Pattern, Optional
+from typing import List, Dict, Pattern, Optional, Tuple
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 
 class ResumePatterns:
@@ -149,6 +154,160 @@ class ResumePatterns:
         re.compile(r'(?i)(?:present|current|ongoing|till\s+date|to\s+date|now|today)'),
     ]
     
+    # Text cleanup patterns
+    WHITESPACE_RUN = re.compile(r'\s+')
+    SPACE_RUN = re.compile(r' +')
+    EXCESS_BLANK_LINES = re.compile(r'\n{3,}')
+    SYMBOL_BULLET_PREFIX = re.compile(r'^[•▪▫‣⁃]\s*', re.MULTILINE)
+    DASH_BULLET_PREFIX = re.compile(r'^[-*]\s*', re.MULTILINE)
+    BULLET_ITEM = re.compile(r'^[•▪▫‣⁃\-\*]\s*(.+)$', re.MULTILINE)
+    BULLET_START = re.compile(r'^[•▪▫‣⁃\-\*]')
+    
+    # Line heuristics used when merging split lines
+    DATE_LINE_START = re.compile(r'^\d{1,2}/\d{4}|\d{4}\s*[-–]')
+    INLINE_CITY_STATE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s*[,|]\s*[A-Z]{2}\b')
+    SENTENCE_END = re.compile(r'[.!?]$')
+    CLAUSE_END = re.compile(r'[.!?:]$')
+    PHONE_LIKE = re.compile(r'\d{3}.*\d{3}.*\d{4}')
+    
+    # Name patterns
+    NAME_LEADING_WORDS = re.compile(r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})(?:\s|$)', re.MULTILINE)
+    NAME_AFTER_LABEL = re.compile(r'(?:Name|Contact):\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})', re.IGNORECASE)
+    NAME_ALL_CAPS = re.compile(r'^([A-Z]{2,}(?:\s+[A-Z]{2,}){1,2})(?:\s|$)', re.MULTILINE)
+    NAME_CAPS_LINE = re.compile(r'^([A-Z][A-Z\s]{2,40})$', re.MULTILINE)
+    NAME_PROPER_CASE = re.compile(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3}$')
+    UPPER_WORDS_ONLY = re.compile(r'^[A-Z\s]+$')
+    NAME_INVALID_CHARS = re.compile(r'[0-9@#$%^&*()_+=\[\]{};:"\\|<>?/]')
+    
+    # Patterns searched together by scan_all(); a pattern's id is its index
+    SCAN_PATTERNS = (
+        ('email', EMAIL),
+        ('phone', PHONE),
+        ('url', URL),
+        ('github', GITHUB_URL),
+        ('linkedin', LINKEDIN_URL),
+        ('university', UNIVERSITY_KEYWORDS),
+        ('degree', DEGREE_PATTERNS),
+        ('gpa', GPA_PATTERN),
+    ) + tuple(('section_' + name, pattern) for name, pattern in SECTION_HEADERS.items()) \
+      + tuple(('date', pattern) for pattern in DATE_PATTERNS)
+    
+    _scan_database = None
+    _scan_database_failed = False
+    _scan_fallback_ids: Tuple[int, ...] = ()
+    
+    @classmethod
+    def scan_all(cls, text: str) -> List[Tuple[int, int, int]]:
+        """
+        Find matches for every pattern in SCAN_PATTERNS in a single pass.
+        
+        Uses a hyperscan multi-pattern database when python-hyperscan is
+        installed, and falls back to one re.finditer() per pattern otherwise.
+        Patterns hyperscan cannot compile (lookaround assertions) are always
+        searched with re. Both backends report non-overlapping matches per
+        pattern.
+        
+        Args:
+            text: Text to scan
+            
+        Returns:
+            List of (pattern_id, start, end) tuples sorted by position, where
+            pattern_id indexes SCAN_PATTERNS
+        """
+        if not text:
+            return []
+        
+        database = cls._get_scan_database()
+        if database is None:
+            fallback_ids = range(len(cls.SCAN_PATTERNS))
+            matches = []
+        else:
+            fallback_ids = cls._scan_fallback_ids
+            matches = cls._hyperscan_matches(database, text)
+        
+        for pattern_id in fallback_ids:
+            pattern = cls.SCAN_PATTERNS[pattern_id][1]
+            matches.extend((pattern_id, m.start(), m.end()) for m in pattern.finditer(text))
+        
+        matches.sort(key=lambda match: (match[1], match[0]))
+        return matches
+    
+    @classmethod
+    def _get_scan_database(cls):
+        """Compile the hyperscan database on first use; None when unavailable."""
+        if hyperscan is None or cls._scan_database_failed:
+            return None
+        if cls._scan_database is not None:
+            return cls._scan_database
+        
+        expressions, ids, flags, fallback_ids = [], [], [], []
+        for pattern_id, (_, pattern) in enumerate(cls.SCAN_PATTERNS):
+            if any(token in pattern.pattern for token in ('(?=', '(?!', '(?<=', '(?<!')):
+                fallback_ids.append(pattern_id)
+                continue
+            
+            hs_flags = hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+            if pattern.flags & re.IGNORECASE:
+                hs_flags |= hyperscan.HS_FLAG_CASELESS
+            if pattern.flags & re.MULTILINE:
+                hs_flags |= hyperscan.HS_FLAG_MULTILINE
+            if pattern.flags & re.DOTALL:
+                hs_flags |= hyperscan.HS_FLAG_DOTALL
+            
+            expressions.append(pattern.pattern.encode('utf-8'))
+            ids.append(pattern_id)
+            flags.append(hs_flags)
+        
+        try:
+            database = hyperscan.Database()
+            database.compile(expressions=expressions, ids=ids, elements=len(expressions), flags=flags)
+        except hyperscan.error:
+            # Leave scanning to re rather than failing the parse, and remember
+            # the failure so later calls do not recompile the database
+            cls._scan_database_failed = True
+            return None
+        
+        cls._scan_fallback_ids = tuple(fallback_ids)
+        cls._scan_database = database
+        return database
+    
+    @staticmethod
+    def _hyperscan_matches(database, text: str) -> List[Tuple[int, int, int]]:
+        """Scan text with hyperscan and reduce its reports to re-style matches."""
+        data = text.encode('utf-8')
+        reports = []
+        
+        def on_match(pattern_id, start, end, flags, context):
+            reports.append((pattern_id, start, end))
+        
+        database.scan(data, match_event_handler=on_match)
+        
+        # hyperscan reports every end offset; keep the longest match at each
+        # start and drop matches overlapping an earlier one, as finditer would
+        reports.sort(key=lambda report: (report[0], report[1], -report[2]))
+        matches = []
+        last_id, last_end = None, -1
+        for pattern_id, start, end in reports:
+            if pattern_id != last_id:
+                last_id, last_end = pattern_id, -1
+            if start >= last_end and end > start:
+                matches.append((pattern_id, start, end))
+                last_end = end
+        
+        # Convert UTF-8 byte offsets back to str indices
+        if len(data) != len(text):
+            char_index = [0] * (len(data) + 1)
+            position = 0
+            for index, char in enumerate(text):
+                width = len(char.encode('utf-8'))
+                char_index[position:position + width] = [index] * width
+                position += width
+            char_index[len(data)] = len(text)
+            matches = [(pattern_id, char_index[start], char_index[end])
+                       for pattern_id, start, end in matches]
+        
+        return matches
+    
     @classmethod
     def find_section_boundaries(cls, text: str) -> Dict[str, tuple]:
         """
@@ -245,6 +404,24 @@ class ResumePatterns:
         
         return result
     
+    @classmethod
+    def has_contact_and_sections(cls, text: str, sections: tuple = ('experience', 'education')) -> bool:
+        """
+        Check whether text has an email address and headers for the given sections.
+        
+        Usable as an early-stop predicate for PDFExtractor.extract_until().
+        
+        Args:
+            text: Resume text
+            sections: SECTION_HEADERS keys that must all be present
+            
+        Returns:
+            True if an email and every requested section header were found
+        """
+        if not cls.EMAIL.search(text):
+            return False
+        return all(cls.SECTION_HEADERS[section].search(text) for section in sections)
+    
     @classmethod
     def extract_emails(cls, text: str) -> List[str]:
         """Extract email addresses from text."""
@@ -329,11 +506,11 @@ class ResumePatterns:
             Cleaned text
         """
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = cls.WHITESPACE_RUN.sub(' ', text)
         
         # Remove bullet points and common formatting
-        text = re.sub(r'^[•▪▫‣⁃]\s*', '', text, flags=re.MULTILINE)
-        text = re.sub(r'^[-*]\s*', '', text, flags=re.MULTILINE)
+        text = cls.SYMBOL_BULLET_PREFIX.sub('', text)
+        text = cls.DASH_BULLET_PREFIX.sub('', text)
         
         # Remove leading/trailing whitespace
         text = text.strip()
@@ -354,18 +531,15 @@ class ResumePatterns:
         potential_names = []
         
         # Pattern 1: Two or three capitalized words at the beginning
-        name_pattern1 = re.compile(r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})(?:\s|$)', re.MULTILINE)
-        matches = name_pattern1.findall(text[:500])  # Look in first 500 chars
+        matches = cls.NAME_LEADING_WORDS.findall(text[:500])  # Look in first 500 chars
         potential_names.extend(matches)
         
         # Pattern 2: Name after common labels
-        name_pattern2 = re.compile(r'(?:Name|Contact):\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})', re.IGNORECASE)
-        matches = name_pattern2.findall(text[:500])
+        matches = cls.NAME_AFTER_LABEL.findall(text[:500])
         potential_names.extend(matches)
         
         # Pattern 3: All caps name (JOHN DOE)
-        name_pattern3 = re.compile(r'^([A-Z]{2,}(?:\s+[A-Z]{2,}){1,2})(?:\s|$)', re.MULTILINE)
-        matches = name_pattern3.findall(text[:500])
+        matches = cls.NAME_ALL_CAPS.findall(text[:500])
         potential_names.extend([name.title() for name in matches])
         
         return potential_names
@@ -423,7 +597,7 @@ class ResumePatterns:
             return False
         
         # Additional validation: names shouldn't contain certain characters
-        if re.search(r'[0-9@#$%^&*()_+=\[\]{};:"\\|<>?/]', name):
+        if cls.NAME_INVALID_CHARS.search(name):
             return False
         
         return True
@@ -431,8 +605,7 @@ class ResumePatterns:
     @classmethod
     def extract_bullets(cls, text: str) -> List[str]:
         """Extract bullet points from text."""
-        bullet_pattern = re.compile(r'^[•▪▫‣⁃\-\*]\s*(.+)$', re.MULTILINE)
-        return bullet_pattern.findall(text)
+        return cls.BULLET_ITEM.findall(text)
     
     @classmethod
     def normalize_whitespace(cls, text: str) -> str:
@@ -442,14 +615,14 @@ class ResumePatterns:
         normalized_lines = []
         for line in lines:
             # Replace multiple spaces within a line with single space
-            normalized_line = re.sub(r' +', ' ', line.strip())
+            normalized_line = cls.SPACE_RUN.sub(' ', line.strip())
             normalized_lines.append(normalized_line)
         
         # Join lines back together
         text = '\n'.join(normalized_lines)
         
         # Replace multiple consecutive blank lines with double newline
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = cls.EXCESS_BLANK_LINES.sub('\n\n', text)
         
         return text.strip()
     
@@ -484,15 +657,15 @@ class ResumePatterns:
                 
                 if current_line and next_line:
                     # Don't merge if next line looks like a date
-                    if re.search(r'^\d{1,2}/\d{4}|\d{4}\s*[-–]', next_line):
+                    if cls.DATE_LINE_START.search(next_line):
                         should_merge = False
                     # Don't merge if current line has location pattern (City, ST or City | ST)
-                    elif re.search(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s*[,|]\s*[A-Z]{2}\b', current_line):
+                    elif cls.INLINE_CITY_STATE.search(current_line):
                         should_merge = False
                     # Check if line ends mid-sentence
-                    elif (not re.search(r'[.!?:]$', current_line) and 
-                          not re.match(r'^[•▪▫‣⁃\-\*]', next_line) and
-                          not cls.SECTION_HEADERS.get('experience', re.compile('')).match(next_line)):
+                    elif (not cls.CLAUSE_END.search(current_line) and 
+                          not cls.BULLET_START.match(next_line) and
+                          not cls.SECTION_HEADERS['experience'].match(next_line)):
                         
                         # Check for word continuation
                         if current_line.endswith('-'):
@@ -505,7 +678,7 @@ class ResumePatterns:
                         # Very conservative merging - only merge if it's clearly a split sentence
                         elif (len(current_line) < 20 and  # Very short line
                               current_line.count(' ') < 3 and  # Few words
-                              not re.search(r'[.!?]$', current_line) and
+                              not cls.SENTENCE_END.search(current_line) and
                               not current_line.isupper() and  # Don't merge ALL CAPS lines
                               not cls.is_likely_job_title(current_line) and  # Don't merge job titles
                               not cls.is_likely_company(current_line)):  # Don't merge company names
@@ -545,7 +718,7 @@ class ResumePatterns:
                 continue
             
             # Skip URLs, emails, phone numbers
-            if '@' in line or 'http' in line or re.search(r'\d{3}.*\d{3}.*\d{4}', line):
+            if '@' in line or 'http' in line or cls.PHONE_LIKE.search(line):
                 continue
             
             # Skip if it's a known section header
@@ -556,14 +729,14 @@ class ResumePatterns:
             if line.isupper():
                 # Validate it looks like a name
                 # Must be 2-4 words, no special chars except spaces
-                if re.match(r'^[A-Z\s]+$', line):
+                if cls.UPPER_WORDS_ONLY.match(line):
                     words = line.split()
                     if 2 <= len(words) <= 4:
                         # Return as title case
                         return line.title()
             
             # Check if it's already in proper name format
-            elif re.match(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3}$', line):
+            elif cls.NAME_PROPER_CASE.match(line):
                 return line
         
         # Strategy 2: Look for name pattern near contact info
@@ -580,14 +753,13 @@ class ResumePatterns:
                     # Check if it looks like a name
                     if line.isupper() and ' ' in line:
                         return line.title()
-                    elif re.match(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3}$', line):
+                    elif cls.NAME_PROPER_CASE.match(line):
                         return line
         
         # Strategy 3: Pattern-based extraction from first 200 chars
         first_part = text[:200]
         # Look for 2-4 capitalized words
-        name_pattern = re.compile(r'^([A-Z][A-Z\s]{2,40})$', re.MULTILINE)
-        matches = name_pattern.findall(first_part)
+        matches = cls.NAME_CAPS_LINE.findall(first_part)
         for match in matches:
             words = match.strip().split()
             if 2 <= len(words) <= 4:
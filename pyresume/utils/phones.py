@@ -6,7 +6,6 @@ from typing import Optional, List
 
 try:
     import phonenumbers
-    from phonenumbers import geocoder, carrier
     PHONENUMBERS_AVAILABLE = True
 except ImportError:
     phonenumbers = None
@@ -19,15 +18,17 @@ class PhoneParser:
     # Regex patterns for phone number detection
     PHONE_PATTERNS = [
         # US formats: (123) 456-7890, 123-456-7890, 123.456.7890
-        r'\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})',
+        re.compile(r'\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})'),
         # International format: +1 123 456 7890
-        r'\+(\d{1,3})\s?(\d{3})\s?(\d{3})\s?(\d{4})',
+        re.compile(r'\+(\d{1,3})\s?(\d{3})\s?(\d{3})\s?(\d{4})'),
         # General international: +XX XXXXXXXXX
-        r'\+(\d{1,3})\s?(\d{4,15})',
+        re.compile(r'\+(\d{1,3})\s?(\d{4,15})'),
         # 10-digit numbers: 1234567890
-        r'(\d{10})',
+        re.compile(r'(\d{10})'),
     ]
     
+    NON_DIGIT = re.compile(r'\D')
+    
     @staticmethod
     def extract_phone_numbers(text: str) -> List[str]:
         """
@@ -45,11 +46,11 @@ class PhoneParser:
         found_numbers = []
         
         for pattern in PhoneParser.PHONE_PATTERNS:
-            matches = re.finditer(pattern, text)
+            matches = pattern.finditer(text)
             for match in matches:
                 # Skip numbers that are too long or short to be valid
                 full_match = match.group(0)
-                digits_only = re.sub(r'\D', '', full_match)
+                digits_only = PhoneParser.NON_DIGIT.sub('', full_match)
                 
                 if 7 <= len(digits_only) <= 15:
                     found_numbers.append(full_match.strip())
@@ -91,7 +92,7 @@ class PhoneParser:
                 pass
         
         # Fallback formatting for US numbers
-        digits_only = re.sub(r'\D', '', phone)
+        digits_only = PhoneParser.NON_DIGIT.sub('', phone)
         
         if len(digits_only) == 10:
             # Format as (XXX) XXX-XXXX
@@ -125,7 +126,7 @@ class PhoneParser:
                 return False
         
         # Basic validation without phonenumbers library
-        digits_only = re.sub(r'\D', '', phone)
+        digits_only = PhoneParser.NON_DIGIT.sub('', phone)
         
         # Check if it's a reasonable length
         if len(digits_only) < 7 or len(digits_only) > 15:
@@ -162,6 +163,9 @@ class PhoneParser:
         }
         
         if PHONENUMBERS_AVAILABLE:
+            # The geocoder and carrier data take hundreds of ms to load; only pay for them here
+            from phonenumbers import geocoder, carrier
+            
             try:
                 parsed = phonenumbers.parse(phone, None)
                 
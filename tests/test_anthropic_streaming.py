@@ -0,0 +1,132 @@
+"""
+Tests for per-request streaming callbacks in LLM providers.
+"""
+import asyncio
+
+import pytest
+
+from pyresume.llm.base import LLMConfig, LLMProvider, LLMProviderType, LLMResponse
+
+
+class EchoProvider(LLMProvider):
+    """Streams each text back in two deltas, after one rejected attempt."""
+    
+    def _validate_config(self):
+        pass
+    
+    async def extract_structured(self, text, extraction_type, schema=None, examples=None, *, on_text=None):
+        for attempt, reply in enumerate(('bad', text), 1):
+            for delta in (reply[:2], reply[2:]):
+                await asyncio.sleep(0)
+                if on_text is not None:
+                    on_text(delta, attempt)
+        return LLMResponse(success=True, content=text)
+    
+    async def enhance_extraction(self, text, initial_extraction, extraction_type, *,
+                                 is_complete=None, on_text=None):
+        return LLMResponse(success=True, structured_data=initial_extraction)
+
+
+def test_batch_extract_passes_each_request_its_own_callback():
+    provider = EchoProvider(LLMConfig(LLMProviderType.CUSTOM))
+    deltas = []
+    
+    asyncio.run(provider.batch_extract(
+        ['first', 'second', 'third'], 'contact_info',
+        concurrency=3,
+        on_text=lambda index, delta, attempt: deltas.append((index, attempt, delta))
+    ))
+    
+    # Deltas of the three requests interleave, but each carries its text index
+    assert [index for index, _, _ in deltas[:3]] == [0, 1, 2]
+    for index, text in enumerate(('first', 'second', 'third')):
+        replies = {}
+        for delta_index, attempt, delta in deltas:
+            if delta_index == index:
+                replies[attempt] = replies.get(attempt, '') + delta
+        assert replies == {1: 'bad', 2: text}
+
+
+class FakeUsage:
+    input_tokens = 10
+    output_tokens = 5
+
+
+class FakeStream:
+    """Async context manager yielding a canned reply in two deltas."""
+    
+    def __init__(self, reply):
+        self.reply = reply
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    @property
+    async def text_stream(self):
+        half = len(self.reply) // 2
+        for delta in (self.reply[:half], self.reply[half:]):
+            await asyncio.sleep(0)
+            yield delta
+    
+    async def get_final_message(self):
+        return type('Message', (), {'usage': FakeUsage()})()
+
+
+class FakeMessages:
+    """Replies with invalid JSON to the first request for each resume text."""
+    
+    def __init__(self):
+        self.seen = set()
+    
+    def stream(self, messages, **request):
+        text = messages[0]['content']
+        if text in self.seen:
+            return FakeStream('{"name": "%s"}' % ('Jane' if 'Jane' in text else 'John'))
+        self.seen.add(text)
+        return FakeStream('not json')
+
+
+def _provider():
+    anthropic_provider = pytest.importorskip('pyresume.llm.providers.anthropic_provider')
+    provider = anthropic_provider.AnthropicProvider(LLMConfig(LLMProviderType.ANTHROPIC, api_key='test-key'))
+    provider._async_client = type('Client', (), {'messages': FakeMessages()})()
+    return provider
+
+
+def test_batch_extract_tags_deltas_with_text_index_and_attempt():
+    provider = _provider()
+    deltas = []
+    
+    responses = asyncio.run(provider.batch_extract(
+        ['Jane Doe resume', 'John Roe resume'], 'contact_info',
+        concurrency=2,
+        on_text=lambda index, delta, attempt: deltas.append((index, attempt, delta))
+    ))
+    
+    assert [response.get_json() for response in responses] == [{'name': 'Jane'}, {'name': 'John'}]
+    for index, name in enumerate(('Jane', 'John')):
+        attempts = {}
+        for delta_index, attempt, delta in deltas:
+            if delta_index == index:
+                attempts[attempt] = attempts.get(attempt, '') + delta
+        assert attempts == {1: 'not json', 2: '{"name": "%s"}' % name}
+
+
+def test_extract_structured_callback_is_per_call():
+    provider = _provider()
+    first, second = [], []
+    
+    async def run():
+        return await asyncio.gather(
+            provider.extract_structured('Jane Doe resume', 'contact_info',
+                                        on_text=lambda delta, attempt: first.append(delta)),
+            provider.extract_structured('John Roe resume', 'contact_info')
+        )
+    
+    asyncio.run(run())
+    
+    assert ''.join(first) == 'not json{"name": "Jane"}'
+    assert second == []
@@ -0,0 +1,92 @@
+"""
+Tests for DOCXExtractor.extract_text on generated DOCX fixtures.
+"""
+import zipfile
+
+import pytest
+
+docx = pytest.importorskip('docx')
+
+from pyresume.extractors.docx import DOCXExtractor
+
+
+FOOTNOTES_XML = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    b'<w:footnotes xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    b'<w:footnote w:id="1"><w:p><w:r><w:t>References available on request</w:t></w:r></w:p></w:footnote>'
+    b'</w:footnotes>'
+)
+
+
+@pytest.fixture
+def resume_docx(tmp_path):
+    """A resume with a header, footer, split runs, a nested table and a footnote part."""
+    document = docx.Document()
+    section = document.sections[0]
+    section.header.paragraphs[0].text = 'Jane Doe Resume'
+    section.footer.paragraphs[0].text = 'Page footer'
+    
+    document.add_paragraph('JANE DOE')
+    paragraph = document.add_paragraph()
+    paragraph.add_run('Senior ')
+    paragraph.add_run('Engineer').add_tab()
+    paragraph.add_run('2019')
+    paragraph.add_run().add_break()
+    paragraph.add_run('Acme Corp')
+    document.add_paragraph('SKILLS')
+    
+    table = document.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = 'Skill'
+    table.cell(0, 1).text = 'Level'
+    table.cell(1, 0).text = 'Python'
+    inner = table.cell(1, 1).add_table(rows=1, cols=2)
+    inner.cell(0, 0).text = 'Expert'
+    inner.cell(0, 1).text = '10 years'
+    
+    document.add_paragraph('JANE DOE')
+    document.add_paragraph('EDUCATION')
+    
+    path = tmp_path / 'resume.docx'
+    document.save(str(path))
+    with zipfile.ZipFile(path, 'a') as package:
+        package.writestr('word/footnotes.xml', FOOTNOTES_XML)
+    return str(path)
+
+
+def test_extract_text_layout(resume_docx):
+    text = DOCXExtractor().extract_text(resume_docx)
+    
+    assert text.split('\n') == [
+        '[Header] Jane Doe Resume',
+        'JANE DOE',
+        'Senior Engineer\t2019',
+        'Acme Corp',
+        'SKILLS',
+        'EDUCATION',
+        '',
+        '[Table 1]',
+        'Skill | Level',
+        'Python | Expert | 10 years',
+        '[Footer] Page footer',
+        '[Note] References available on request',
+    ]
+
+
+def test_runs_are_joined_within_a_paragraph(resume_docx):
+    text = DOCXExtractor().extract_text(resume_docx)
+    
+    assert 'Senior Engineer\t2019\nAcme Corp' in text
+    assert '\nSenior \n' not in text
+
+
+def test_nested_table_text_stays_in_its_cell(resume_docx):
+    lines = DOCXExtractor().extract_text(resume_docx).split('\n')
+    
+    assert 'Python | Expert | 10 years' in lines
+    assert not any(line.startswith('Expert') for line in lines)
+
+
+def test_repeated_paragraphs_are_emitted_once(resume_docx):
+    text = DOCXExtractor().extract_text(resume_docx)
+    
+    assert text.count('JANE DOE') == 1
@@ -0,0 +1,49 @@
+"""
+Tests for LLMResponse.get_json recovery of JSON embedded in model output.
+"""
+import time
+
+import pytest
+
+from pyresume.llm.base import LLMResponse, _find_json_objs
+
+
+@pytest.mark.parametrize('content, expected', [
+    ('{"name": "Jane Doe"}', {'name': 'Jane Doe'}),
+    ('```json\n{"name": "Jane Doe"}\n```', {'name': 'Jane Doe'}),
+    ('Here is the data:\n{"contact": {"name": "Jane Doe"}, "skills": ["Go"]}\nDone.',
+     {'contact': {'name': 'Jane Doe'}, 'skills': ['Go']}),
+    ('Fields {like this are unclosed. {"name": "Jane Doe"}', {'name': 'Jane Doe'}),
+    ('Skipped {not json} then {"title": "C# {lead}"}', {'title': 'C# {lead}'}),
+    ('{wrapper {"name": "Jane Doe"} end}', {'name': 'Jane Doe'}),
+    ('No JSON here', None),
+])
+def test_get_json_recovers_embedded_object(content, expected):
+    assert LLMResponse(success=True, content=content).get_json() == expected
+
+
+def test_get_json_prefers_structured_data():
+    response = LLMResponse(success=True, content='{"a": 1}', structured_data={'b': 2})
+    
+    assert response.get_json() == {'b': 2}
+
+
+def test_get_json_caches_parsed_content():
+    response = LLMResponse(success=True, content='text {"a": 1}')
+    
+    assert response.get_json() is response.get_json()
+
+
+def test_find_json_objs_orders_outer_spans_first():
+    text = 'a {b {c} d} {e}'
+    
+    assert _find_json_objs(text) == [(2, 11), (5, 8), (12, 15)]
+
+
+def test_unbalanced_braces_scan_in_linear_time():
+    start = time.perf_counter()
+    
+    assert LLMResponse(success=True, content='x' + '{' * 20000).get_json() is None
+    assert LLMResponse(success=True, content='{' * 20000 + '}' * 20000).get_json() is None
+    
+    assert time.perf_counter() - start < 1.0
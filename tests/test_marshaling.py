@@ -0,0 +1,68 @@
+"""
+Tests for packing several resumes into one LLM request.
+"""
+import pytest
+
+from pyresume.intelligent_parser import IntelligentResumeParser
+from pyresume.providers.anthropic_provider import AnthropicProvider
+
+
+RESUME_TEXT = """Jane Doe
+jane.doe@example.com
+
+EXPERIENCE
+Software Engineer, Acme Corp
+2019 - Present
+"""
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    """An AnthropicProvider with default limits that records each packed request."""
+    provider = AnthropicProvider(api_key=None)
+    provider.groups = []
+    
+    def parse_resumes(texts, job_description=None):
+        provider.groups.append(len(texts))
+        return [None] * len(texts)
+    
+    monkeypatch.setattr(provider, 'is_available', lambda: True)
+    monkeypatch.setattr(provider, 'parse_resumes', parse_resumes)
+    return provider
+
+
+def test_default_limits_pack_several_resumes(provider):
+    parser = IntelligentResumeParser(provider=provider)
+    
+    resumes = parser.parse_texts_marshaled([RESUME_TEXT] * 10)
+    
+    assert provider.max_resumes_per_call() == 4
+    assert provider.groups == [4, 4, 2]
+    assert len(resumes) == 10
+
+
+def test_rows_per_call_above_output_budget_warns(provider):
+    parser = IntelligentResumeParser(provider=provider)
+    
+    with pytest.warns(UserWarning, match='rows_per_call=8'):
+        parser.parse_texts_marshaled([RESUME_TEXT] * 8, rows_per_call=8)
+    
+    assert provider.groups == [4, 4]
+
+
+def test_output_budget_is_capped_per_call():
+    provider = AnthropicProvider(api_key=None)
+    
+    assert provider._output_budget() == 4000
+    assert provider._output_budget(2) == 4000
+    assert provider._output_budget(4) == 4096
+    assert provider._output_budget(16) == 4096
+
+
+def test_group_texts_bounds_rows_and_chars():
+    texts = ['a' * 40, 'b' * 40, 'c' * 40, 'd' * 200, 'e' * 10]
+    
+    groups = IntelligentResumeParser._group_texts(texts, 2, 100)
+    
+    assert groups == [texts[0:2], texts[2:3], texts[3:4], texts[4:5]]
+    assert IntelligentResumeParser._group_texts(texts, 8, 10000, 3) == [texts[:3], texts[3:]]
@@ -0,0 +1,49 @@
+"""
+Tests for known-skill matching in the regex parser.
+"""
+import random
+import re
+
+import pytest
+
+from pyresume import parser
+from pyresume.parser import ResumeParser
+
+
+def _per_skill_search(text):
+    """Skills found by a separate whole-word search per skill."""
+    text = text.lower()
+    return {
+        skill for skill in parser._KNOWN_SKILLS
+        if re.search(r'\b' + re.escape(skill) + r'\b', text)
+    }
+
+
+def _known_skill_names(text):
+    """Known skills found by the single-pass matcher."""
+    return parser._find_known_skills(text.lower())
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('objective-c#lightgbm', {'objective-c', 'c#', 'lightgbm'}),
+    ('Python, Go and Kubernetes', {'python', 'go', 'kubernetes'}),
+    ('github actions', {'github actions'}),
+])
+def test_overlapping_skills_are_all_found(text, expected):
+    assert _known_skill_names(text) == expected
+
+
+def test_extract_skills_reports_overlapping_skills():
+    skills, _ = ResumeParser()._extract_skills('objective-c#lightgbm')
+    
+    assert {'Objective-C', 'C#', 'Lightgbm'} <= {skill.name for skill in skills}
+
+
+def test_matches_per_skill_search_on_random_text():
+    rnd = random.Random(7)
+    separators = ['', ' ', '-', '#', '.', '+', ', ', '/']
+    for _ in range(2000):
+        parts = [rnd.choice(parser._KNOWN_SKILLS) for _ in range(rnd.randint(1, 5))]
+        text = ''.join(part + rnd.choice(separators) for part in parts)
+        
+        assert _known_skill_names(text) == _per_skill_search(text), text
@@ -0,0 +1,90 @@
+"""
+Tests for ResumePatterns.scan_all and its hyperscan/re backends.
+"""
+import pytest
+
+from pyresume.utils import patterns
+from pyresume.utils.patterns import ResumePatterns
+
+
+SAMPLE_RESUME = """JOSÉ NÚÑEZ
+jose.nunez@example.com | (415) 555-0100 | https://github.com/jnunez
+https://www.linkedin.com/in/jose-nunez | San José, CA
+
+EXPERIENCE
+Senior Software Engineer, Acme Corp
+03/2019 - Present
+
+EDUCATION
+Stanford University
+Master of Science in Computer Science, GPA: 3.9/4.0
+Graduated May 2013
+
+SKILLS
+Python, Go, Kubernetes
+"""
+
+
+def _finditer_matches(text):
+    """Expected scan_all output: every SCAN_PATTERNS pattern run with finditer."""
+    matches = [
+        (pattern_id, match.start(), match.end())
+        for pattern_id, (_, pattern) in enumerate(ResumePatterns.SCAN_PATTERNS)
+        for match in pattern.finditer(text)
+    ]
+    return sorted(matches, key=lambda match: (match[1], match[0]))
+
+
+@pytest.fixture
+def fresh_scan_state(monkeypatch):
+    """Isolate the class-level hyperscan database cache between tests."""
+    monkeypatch.setattr(ResumePatterns, '_scan_database', None)
+    monkeypatch.setattr(ResumePatterns, '_scan_database_failed', False)
+    monkeypatch.setattr(ResumePatterns, '_scan_fallback_ids', ())
+
+
+def test_scan_all_re_fallback_matches_finditer(monkeypatch, fresh_scan_state):
+    monkeypatch.setattr(patterns, 'hyperscan', None)
+    
+    matches = ResumePatterns.scan_all(SAMPLE_RESUME)
+    
+    assert matches
+    assert matches == _finditer_matches(SAMPLE_RESUME)
+
+
+def test_scan_all_empty_text():
+    assert ResumePatterns.scan_all('') == []
+
+
+def test_scan_all_hyperscan_matches_re(fresh_scan_state):
+    pytest.importorskip('hyperscan')
+    if ResumePatterns._get_scan_database() is None:
+        pytest.skip('hyperscan could not compile SCAN_PATTERNS')
+    
+    assert ResumePatterns.scan_all(SAMPLE_RESUME) == _finditer_matches(SAMPLE_RESUME)
+
+
+def test_failed_hyperscan_compile_is_not_retried(monkeypatch, fresh_scan_state):
+    compiles = []
+    
+    class FakeError(Exception):
+        pass
+    
+    class FakeDatabase:
+        def compile(self, **kwargs):
+            compiles.append(kwargs)
+            raise FakeError('unsupported pattern')
+    
+    class FakeHyperscan:
+        error = FakeError
+        Database = FakeDatabase
+        HS_FLAG_SOM_LEFTMOST = HS_FLAG_UTF8 = HS_FLAG_UCP = 0
+        HS_FLAG_CASELESS = HS_FLAG_MULTILINE = HS_FLAG_DOTALL = 0
+    
+    monkeypatch.setattr(patterns, 'hyperscan', FakeHyperscan)
+    
+    first = ResumePatterns.scan_all(SAMPLE_RESUME)
+    second = ResumePatterns.scan_all(SAMPLE_RESUME)
+    
+    assert len(compiles) == 1
+    assert first == second == _finditer_matches(SAMPLE_RESUME)
@@ -0,0 +1,80 @@
+"""
+Tests for PDFExtractor on scanned and mixed PDFs.
+"""
+import pytest
+
+pytest.importorskip('pdfplumber')
+
+from pyresume.extractors.pdf import PDFExtractor
+
+
+def _build_pdf(pages):
+    """
+    Write a minimal PDF whose pages are either an image (None) or a line of text.
+    
+    Args:
+        pages: One entry per page, None for an image-only page or the page text
+    
+    Returns:
+        The PDF file contents
+    """
+    objects = [b'<< /Type /Catalog /Pages 2 0 R >>', None,
+               b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+               b'<< /Type /XObject /Subtype /Image /Width 1 /Height 1 '
+               b'/ColorSpace /DeviceGray /BitsPerComponent 8 /Length 1 >>\nstream\n\x80\nendstream']
+    page_ids = []
+    for text in pages:
+        if text is None:
+            content = b'q 300 0 0 300 100 400 cm /Im1 Do Q'
+        else:
+            content = b'BT /F1 12 Tf 72 720 Td (' + text.encode('latin-1') + b') Tj ET'
+        objects.append(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(content), content))
+        objects.append(
+            b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents %d 0 R '
+            b'/Resources << /Font << /F1 3 0 R >> /XObject << /Im1 4 0 R >> >> >>' % (len(objects))
+        )
+        page_ids.append(len(objects))
+    objects[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (
+        b' '.join(b'%d 0 R' % page_id for page_id in page_ids), len(page_ids))
+    
+    body = b'%PDF-1.4\n'
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(body))
+        body += b'%d 0 obj\n%s\nendobj\n' % (number, obj)
+    xref = len(body)
+    body += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    body += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    body += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    return body
+
+
+@pytest.fixture
+def write_pdf(tmp_path):
+    def write(pages):
+        path = tmp_path / 'resume.pdf'
+        path.write_bytes(_build_pdf(pages))
+        return str(path)
+    return write
+
+
+def test_scanned_cover_pages_keep_later_text(write_pdf):
+    path = write_pdf([None, None, None, 'Jane Doe Senior Software Engineer'])
+    
+    text = PDFExtractor().extract_text(path)
+    
+    assert 'Jane Doe Senior Software Engineer' in text
+
+
+def test_scan_only_pdf_has_no_text(write_pdf):
+    path = write_pdf([None, None])
+    
+    assert PDFExtractor().extract_text(path) == ''
+
+
+def test_text_pages_in_order(write_pdf):
+    path = write_pdf(['First page text', None, 'Last page text'])
+    
+    text = PDFExtractor().extract_text(path)
+    
+    assert text.index('First page text') < text.index('Last page text')
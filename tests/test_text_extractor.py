@@ -0,0 +1,60 @@
+"""
+Tests for TextExtractor decoding of plain text resumes.
+"""
+import pytest
+
+from pyresume.extractors import text as text_module
+from pyresume.extractors.text import ENCODING_DETECT_BYTES, TextExtractor
+
+
+SAMPLE = 'José Núñez — Senior Engineer, Zürich\nPython, Go\n'
+
+
+@pytest.fixture
+def detect_calls(monkeypatch):
+    """Record chardet.detect inputs and report cp1252 for every call."""
+    calls = []
+    
+    def detect(data):
+        calls.append(len(data))
+        return {'encoding': 'cp1252'}
+    
+    monkeypatch.setattr(text_module.chardet, 'detect', detect)
+    return calls
+
+
+@pytest.mark.parametrize('raw', [
+    SAMPLE.encode('utf-8'),
+    b'\xef\xbb\xbf' + SAMPLE.encode('utf-8'),
+    bytearray(SAMPLE.encode('utf-8')),
+    memoryview(SAMPLE.encode('utf-8')),
+])
+def test_utf8_decodes_without_detection(raw, detect_calls):
+    assert TextExtractor().decode(raw) == SAMPLE
+    assert detect_calls == []
+
+
+def test_line_endings_are_normalized():
+    raw = b'Jane Doe\r\nEngineer\rAcme\n'
+    
+    assert TextExtractor().decode(raw) == 'Jane Doe\nEngineer\nAcme\n'
+
+
+def test_non_utf8_falls_back_to_detected_encoding(detect_calls):
+    raw = SAMPLE.encode('cp1252') * (ENCODING_DETECT_BYTES // len(SAMPLE) + 10)
+    
+    assert TextExtractor().decode(raw) == raw.decode('cp1252')
+    assert detect_calls == [ENCODING_DETECT_BYTES]
+
+
+def test_unknown_detected_encoding_uses_utf8_with_replacement(monkeypatch):
+    monkeypatch.setattr(text_module.chardet, 'detect', lambda data: {'encoding': 'no-such-codec'})
+    
+    assert TextExtractor().decode(b'Jane \xff Doe') == 'Jane � Doe'
+
+
+def test_extract_text_reads_file(tmp_path):
+    path = tmp_path / 'resume.txt'
+    path.write_bytes(SAMPLE.replace('\n', '\r\n').encode('utf-8'))
+    
+    assert TextExtractor().extract_text(str(path)) == SAMPLE